@@ -43,6 +43,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     "corsheaders",
     'accounts.apps.AccountsConfig',  # Use custom config to load signals
@@ -101,6 +102,18 @@ DATABASES = {
     }
 }
 
+# Cache
+# Defaults to per-process memory, for development and tests. Cached entries
+# are invalidated by the process making the change, so any deployment with
+# several processes (web workers, scheduler, stream service) must share one
+# backend: docker-compose points CACHE_BACKEND/CACHE_LOCATION at Redis.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "linkdeal"),
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -203,15 +216,27 @@ ACCOUNT_LINKING_TOKEN_EXPIRY_MINUTES = int(os.getenv("ACCOUNT_LINKING_TOKEN_EXPI
 # =======================
 # Email Configuration (SendGrid SMTP)
 # =======================
+# Emails are queued in core.OutboundEmail and sent by the outbox worker
+# (core/outbox.py). For local testing point EMAIL_HOST/EMAIL_PORT at an SMTP
+# sink, e.g. `python -m aiosmtpd -n -l localhost:1025` with EMAIL_USE_TLS=false.
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
-EMAIL_HOST = 'smtp.sendgrid.net'
-EMAIL_PORT = 587
-EMAIL_USE_TLS = True
-EMAIL_HOST_USER = 'apikey'  # SendGrid requires 'apikey' as username (literal string)
+EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.sendgrid.net")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "True").lower() == "true"
+EMAIL_TIMEOUT = 30
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "apikey")  # SendGrid requires 'apikey' as username (literal string)
 EMAIL_HOST_PASSWORD = os.getenv("SENDGRID_API_KEY")  # Your SendGrid API key
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@linkdeal.com')
 SERVER_EMAIL = DEFAULT_FROM_EMAIL  # For error emails
 
+# =======================
+# Periodic jobs (core/scheduler.py)
+# =======================
+# Jobs run in the single process holding the scheduler leader lock. In
+# production that is `python manage.py run_scheduler`; set this to true to
+# let web processes compete for the lock instead (runserver always does).
+SCHEDULER_AUTOSTART = os.getenv("SCHEDULER_AUTOSTART", "False").lower() == "true"
+
 # =======================
 # CORS (frontend allowed origins)
 # =======================
@@ -220,6 +245,8 @@ CORS_ALLOWED_ORIGINS = [
     # "https://app.linkdeal.io",  # example prod domain
 ]
 CORS_ALLOW_CREDENTIALS = True
+# Keyset pagination advertises the next page in headers (core/pagination.py)
+CORS_EXPOSE_HEADERS = ["Link", "X-Next-Cursor"]
 
 # =======================
 # Security (production hardening)
@@ -250,3 +277,5 @@ EMBEDDING_DIMENSION = int(os.getenv('EMBEDDING_DIMENSION', '384'))
 
 # Whereby API Key
 WHEREBY_API_KEY = os.getenv('WHEREBY_API_KEY', '')
+# Whereby API base URL (tests point it at scheduling.fake_whereby)
+WHEREBY_API_URL = os.getenv('WHEREBY_API_URL', 'https://api.whereby.dev/v1')
@@ -6,12 +6,13 @@ from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView, RetrieveAPIView, CreateAPIView
 from rest_framework.response import Response
-from rest_framework import status
+from rest_framework import serializers, status
 
 from accounts.models import MentorProfile, MenteeProfile, AppUser
 from accounts.auth0_client import Auth0Client
 from accounts.permissions import IsAuthenticatedAuth0, IsAdmin, IsSuperAdmin
 from core.exceptions import ExternalServiceError
+from core.pagination import KeysetPagination
 from accounts.serializers import (
     AdminMentorSerializer,
     AdminMentorDetailSerializer,
@@ -19,6 +20,7 @@ from accounts.serializers import (
     AdminInviteSerializer,
 )
 from accounts.email_service import send_status_change_email
+from accounts.moderation import MAX_BULK_IDS, actions_for, moderate
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,7 @@ logger = logging.getLogger(__name__)
 class PendingMentorsView(ListAPIView):
     permission_classes = [IsAuthenticatedAuth0, IsAdmin]
     serializer_class = AdminMentorSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         # Optional filter by status to allow viewing banned/rejected/approved lists
@@ -286,6 +289,7 @@ class MenteesListAdminView(ListAPIView):
     """
     permission_classes = [IsAuthenticatedAuth0, IsAdmin]
     serializer_class = AdminMenteeSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         status_param = self.request.query_params.get("status", "active")
@@ -433,6 +437,69 @@ class UnbanMenteeView(APIView):
         )
 
 
+# ---------- NEW: bulk moderation ----------
+class BulkModerationView(APIView):
+    """
+    POST /auth/admin/mentors/bulk/<action>/  (approve, reject, ban, unban)
+    POST /auth/admin/mentees/bulk/<action>/  (ban, unban)
+
+    Body: {"ids": [...], "reason": "..."} (reason is only used by ban).
+    Applies the action to every listed profile (see accounts/moderation.py)
+    and reports the outcome per id.
+    """
+    permission_classes = [IsAuthenticatedAuth0, IsAdmin]
+    model = None
+
+    class InputSerializer(serializers.Serializer):
+        ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=MAX_BULK_IDS)
+        reason = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+    def post(self, request, action):
+        if action not in actions_for(self.model):
+            return Response(
+                {
+                    "success": False,
+                    "message": f"Unknown action '{action}'.",
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = self.InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        admin = None
+        if action == "ban":
+            admin = AppUser.objects.filter(auth0_id=request.user.auth0_id).first()
+            if admin is None:
+                logger.warning("Banning admin AppUser not found for auth0_id=%s", request.user.auth0_id)
+
+        results = moderate(
+            self.model,
+            action,
+            serializer.validated_data["ids"],
+            reason=serializer.validated_data.get("reason") or None,
+            admin=admin,
+        )
+        updated = sum(result["success"] for result in results)
+        return Response(
+            {
+                "success": True,
+                "message": f"{updated} of {len(results)} profiles updated.",
+                "summary": {"updated": updated, "failed": len(results) - updated},
+                "results": results,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class BulkMentorModerationView(BulkModerationView):
+    model = MentorProfile
+
+
+class BulkMenteeModerationView(BulkModerationView):
+    model = MenteeProfile
+
+
 # ---------- NEW: admin invitation ----------
 class AdminInviteView(CreateAPIView):
     """
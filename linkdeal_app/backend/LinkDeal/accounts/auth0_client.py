@@ -2,14 +2,24 @@
 import logging
 import secrets
 import string
+import threading
+import time
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from core.exceptions import ExternalServiceError
+from core.http import client as http_client
 from typing import Optional, Dict, Any, List
 
 
 logger = logging.getLogger(__name__)
 
+# Management API token cache, shared by the workers through the cache backend
+MGMT_TOKEN_CACHE_KEY = "accounts:auth0_mgmt_token"
+MGMT_TOKEN_LOCK_KEY = "accounts:auth0_mgmt_token:refresh"
+MGMT_TOKEN_REFRESH_MARGIN = 120  # Seconds before expiry a token stops being used
+MGMT_TOKEN_WAIT = 5  # Seconds to wait for a token another worker is fetching
+
 
 def _generate_random_password(length: int = 32) -> str:
     """
@@ -39,10 +49,73 @@ class Auth0Client:
     and then calls the /api/v2 endpoints.
     """
 
+    @staticmethod
+    def http():
+        """Shared keep-alive session for all Auth0 calls (core/http.py)."""
+        return http_client("auth0")
+
+    # (access_token, expires_at) of this process
+    _mgmt_token = None
+    _mgmt_token_lock = threading.Lock()
+
+    @staticmethod
+    def _usable_token(entry) -> Optional[str]:
+        if entry and entry[1] - MGMT_TOKEN_REFRESH_MARGIN > time.time():
+            return entry[0]
+        return None
+
     @classmethod
     def _get_mgmt_token(cls) -> str:
+        """
+        Get a Management API token, reused until shortly before it expires.
+
+        Looked up in this process, then in the cache (tokens fetched by
+        other workers), then requested from Auth0: one thread per process
+        and, through a cache lock, one worker at a time; the others wait
+        for its token.
+        """
+        token = cls._usable_token(cls._mgmt_token)
+        if token:
+            return token
+
+        with cls._mgmt_token_lock:
+            token = cls._usable_token(cls._mgmt_token)
+            if token:
+                return token
+
+            entry = cache.get(MGMT_TOKEN_CACHE_KEY)
+            if not cls._usable_token(entry):
+                entry = cls._refresh_mgmt_token()
+            cls._mgmt_token = entry
+            return entry[0]
+
+    @classmethod
+    def _refresh_mgmt_token(cls):
+        """Fetch a token from Auth0 (or from the worker already fetching one) and cache it."""
+        locked = cache.add(MGMT_TOKEN_LOCK_KEY, True, timeout=MGMT_TOKEN_WAIT * 2)
+        if not locked:
+            deadline = time.monotonic() + MGMT_TOKEN_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(0.1)
+                entry = cache.get(MGMT_TOKEN_CACHE_KEY)
+                if cls._usable_token(entry):
+                    return entry
+            # The other worker is stuck or failed: fetch one ourselves
+
+        try:
+            access_token, expires_in = cls._request_mgmt_token()
+            entry = (access_token, time.time() + expires_in)
+            cache.set(MGMT_TOKEN_CACHE_KEY, entry, timeout=max(expires_in - MGMT_TOKEN_REFRESH_MARGIN, 1))
+            return entry
+        finally:
+            if locked:
+                cache.delete(MGMT_TOKEN_LOCK_KEY)
+
+    @classmethod
+    def _request_mgmt_token(cls):
         """
         Get a Management API token using client_credentials.
+        Returns (access_token, expires_in seconds).
         """
         url = f"https://{settings.AUTH0_DOMAIN}/oauth/token"
 
@@ -54,7 +127,7 @@ class Auth0Client:
         }
 
         try:
-            resp = requests.post(url, json=payload, timeout=5)
+            resp = cls.http().post(url, json=payload, timeout=5)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 /oauth/token")
             raise ExternalServiceError("Could not contact Auth0 for management token") from exc
@@ -64,7 +137,7 @@ class Auth0Client:
             raise ExternalServiceError("Auth0 management token request failed")
 
         data = resp.json()
-        return data["access_token"]
+        return data["access_token"], int(data.get("expires_in", 86400))
 
     @classmethod
     def _headers(cls) -> Dict[str, str]:
@@ -136,7 +209,7 @@ class Auth0Client:
         }
 
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = cls.http().post(url, json=payload, headers=headers, timeout=10)
             try:
                 data = resp.json()
             except Exception:
@@ -162,7 +235,7 @@ class Auth0Client:
         payload = {"app_metadata": metadata}
 
         try:
-            resp = requests.patch(url, json=payload, headers=cls._headers(), timeout=5)
+            resp = cls.http().patch(url, json=payload, headers=cls._headers(), timeout=5)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 update_user_app_metadata")
             raise ExternalServiceError("Could not contact Auth0 to update app_metadata") from exc
@@ -183,7 +256,7 @@ class Auth0Client:
         payload = {"roles": [role_id]}
 
         try:
-            resp = requests.post(url, json=payload, headers=cls._headers(), timeout=5)
+            resp = cls.http().post(url, json=payload, headers=cls._headers(), timeout=5)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 assign_role")
             raise ExternalServiceError("Could not contact Auth0 to assign role") from exc
@@ -205,7 +278,7 @@ class Auth0Client:
         url = f"https://{settings.AUTH0_DOMAIN}/api/v2/users/{user_id}"
 
         try:
-            resp = requests.get(url, headers=cls._headers(), timeout=10)
+            resp = cls.http().get(url, headers=cls._headers(), timeout=10)
         except requests.RequestException as e:
             logger.error("Auth0 get_user request error: %s", e)
             raise ExternalServiceError("Unable to contact Auth0 when fetching user.")
@@ -233,7 +306,7 @@ class Auth0Client:
         url = f"https://{settings.AUTH0_DOMAIN}/api/v2/users-by-email"
 
         try:
-            resp = requests.get(
+            resp = cls.http().get(
                 url,
                 headers=cls._headers(),
                 params={"email": email},
@@ -308,7 +381,7 @@ class Auth0Client:
         url = f"https://{settings.AUTH0_DOMAIN}/api/v2/users/{auth0_user_id}"
 
         try:
-            resp = requests.delete(url, headers=cls._headers(), timeout=10)
+            resp = cls.http().delete(url, headers=cls._headers(), timeout=10)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 delete_user")
             raise ExternalServiceError("Could not contact Auth0 to delete user") from exc
@@ -387,7 +460,7 @@ class Auth0Client:
         }
 
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = cls.http().post(url, json=payload, headers=headers, timeout=10)
             try:
                 data = resp.json()
             except ValueError:
@@ -439,7 +512,7 @@ class Auth0Client:
         }
 
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = cls.http().post(url, json=payload, headers=headers, timeout=10)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 change_password endpoint")
             raise ExternalServiceError("Could not contact Auth0 to send password reset email") from exc
@@ -465,7 +538,7 @@ class Auth0Client:
         payload = {"user_id": auth0_user_id}
 
         try:
-            resp = requests.post(url, json=payload, headers=cls._headers(), timeout=10)
+            resp = cls.http().post(url, json=payload, headers=cls._headers(), timeout=10)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 verification-email job")
             raise ExternalServiceError("Could not contact Auth0 to send verification email") from exc
@@ -506,7 +579,7 @@ class Auth0Client:
         }
         
         try:
-            resp = requests.post(url, json=payload, headers=cls._headers(), timeout=10)
+            resp = cls.http().post(url, json=payload, headers=cls._headers(), timeout=10)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 link_identities")
             raise ExternalServiceError("Could not contact Auth0 to link identities") from exc
@@ -525,6 +598,9 @@ class Auth0Client:
         per_page: int = 100,
         page: int = 0,
         include_totals: bool = False,
+        query: Optional[str] = None,
+        sort: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         List users from Auth0 Management API.
@@ -533,6 +609,9 @@ class Auth0Client:
         :param per_page: Number of results per page (max 100)
         :param page: Page number (0-indexed)
         :param include_totals: Include total count in response
+        :param query: Extra Lucene search query (e.g. 'email_verified:false')
+        :param sort: Sort field and order (e.g. "created_at:1")
+        :param fields: Only return these user fields
         :return: Dict with 'users' list and optionally 'total' count (if include_totals=True)
         :raises ExternalServiceError: If the request fails
         """
@@ -546,13 +625,23 @@ class Auth0Client:
         if include_totals:
             params["include_totals"] = "true"
         
+        # Auth0 uses 'q' parameter for Lucene query syntax
+        clauses = []
         if connection:
-            # Auth0 uses 'q' parameter for Lucene query syntax
             # Filter by connection using the identities array
-            params["q"] = f'identities.connection:"{connection}"'
+            clauses.append(f'identities.connection:"{connection}"')
+        if query:
+            clauses.append(f"({query})")
+        if clauses:
+            params["q"] = " AND ".join(clauses)
+        if sort:
+            params["sort"] = sort
+        if fields:
+            params["fields"] = ",".join(fields)
+            params["include_fields"] = "true"
         
         try:
-            resp = requests.get(url, params=params, headers=cls._headers(), timeout=10)
+            resp = cls.http().get(url, params=params, headers=cls._headers(), timeout=10)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 list_users")
             raise ExternalServiceError("Could not contact Auth0 to list users") from exc
@@ -569,6 +658,17 @@ class Auth0Client:
         
         return data
 
+    @classmethod
+    def get_users_by_ids(cls, user_ids: List[str], fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch up to 100 Auth0 users with a single search.
+        Ids unknown to Auth0 (or not indexed yet) are missing from the result.
+        """
+        if not user_ids:
+            return []
+        quoted = " OR ".join('"{}"'.format(user_id.replace('"', '\\"')) for user_id in user_ids)
+        return cls.list_users(query=f"user_id:({quoted})", per_page=len(user_ids), fields=fields)["users"]
+
     @classmethod
     def update_user_password(cls, auth0_user_id: str, new_password: str) -> None:
         """
@@ -583,7 +683,7 @@ class Auth0Client:
         payload = {"password": new_password}
         
         try:
-            resp = requests.patch(url, json=payload, headers=cls._headers(), timeout=10)
+            resp = cls.http().patch(url, json=payload, headers=cls._headers(), timeout=10)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 update_user_password")
             raise ExternalServiceError("Could not contact Auth0 to update password") from exc
@@ -607,7 +707,7 @@ class Auth0Client:
         payload = {"email_verified": True}
         
         try:
-            resp = requests.patch(url, json=payload, headers=cls._headers(), timeout=10)
+            resp = cls.http().patch(url, json=payload, headers=cls._headers(), timeout=10)
         except requests.RequestException as exc:
             logger.exception("Error calling Auth0 mark_email_verified")
             raise ExternalServiceError("Could not contact Auth0 to verify email") from exc
@@ -6,6 +6,12 @@ This command finds Auth0 users (from social logins) that:
 - Don't have a corresponding AppUser in the local database
 - Never completed registration
 
+Auth0 users are read in creation order, one search page at a time with a
+created_at cursor (so the run is not capped by Auth0's 1000-result paging
+limit). Each page is diffed against the local users with one query and its
+deletions run through a bounded, rate-limit-aware pool. The cursor is saved
+after each page, so an interrupted run resumes where it stopped.
+
 Usage:
     python manage.py cleanup_auth0_users --days 30
     python manage.py cleanup_auth0_users --days 30 --dry-run
@@ -13,14 +19,23 @@ Usage:
 """
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from datetime import timedelta
+from datetime import timedelta, timezone as dt_timezone
 from accounts.auth0_client import Auth0Client
 from accounts.models import AppUser
+from core.bulk import clear_checkpoint, load_checkpoint, run_concurrently, save_checkpoint
 from core.exceptions import ExternalServiceError
 import logging
 
 logger = logging.getLogger(__name__)
 
+CHECKPOINT = "cleanup_auth0_users"
+PER_PAGE = 100
+
+
+def _auth0_time(value):
+    """Auth0 search date format (UTC, milliseconds)."""
+    return value.astimezone(dt_timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
 
 class Command(BaseCommand):
     help = 'Clean up Auth0 users that never completed registration'
@@ -43,12 +58,24 @@ class Command(BaseCommand):
             action='store_true',
             help='Show what would be deleted without actually deleting'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Concurrent Auth0 deletions (default: 4)'
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Start from the oldest user instead of resuming an interrupted run'
+        )
 
     def handle(self, *args, **options):
         days = options['days']
         connection = options.get('connection')
         dry_run = options['dry_run']
-        
+        workers = options['workers']
+
         self.stdout.write(
             self.style.WARNING(
                 f"Starting cleanup of Auth0 users older than {days} days"
@@ -56,134 +83,107 @@ class Command(BaseCommand):
                 + (" (DRY RUN)" if dry_run else "")
             )
         )
-        
+
         # Calculate cutoff date
-        cutoff_date = timezone.now() - timedelta(days=days)
-        cutoff_timestamp = int(cutoff_date.timestamp() * 1000)  # Auth0 uses milliseconds
-        
+        cutoff = _auth0_time(timezone.now() - timedelta(days=days))
+
+        # A checkpoint only applies to a run with the same filters; dry runs
+        # neither resume nor save one
+        scope = {'days': days, 'connection': connection}
+        checkpoint = None
+        if not dry_run and not options['restart']:
+            checkpoint = load_checkpoint(CHECKPOINT)
+            if checkpoint and checkpoint['scope'] != scope:
+                checkpoint = None
+        if checkpoint:
+            self.stdout.write(f"Resuming after users created {checkpoint['after']}...")
+        # Users created at the cursor time that were already handled
+        after, seen = (checkpoint['after'], set(checkpoint['seen'])) if checkpoint else (None, set())
+
         deleted_count = 0
         kept_count = 0
         error_count = 0
         page = 0
-        per_page = 100
-        
+        # Search page at the current cursor: more than PER_PAGE users can share
+        # its created_at, and the handled ones come back first
+        search_page = 0
+        complete = False
+        throttle = Auth0Client.http().throttle
+
         try:
             while True:
-                # Get users from Auth0
+                lower = f'["{after}"' if after else '[*'
                 try:
                     result = Auth0Client.list_users(
                         connection=connection,
-                        per_page=per_page,
-                        page=page,
-                        include_totals=True
+                        per_page=PER_PAGE,
+                        page=search_page,
+                        query=f'created_at:{lower} TO "{cutoff}"}}',
+                        sort="created_at:1",
+                        fields=["user_id", "email", "created_at"],
                     )
                 except ExternalServiceError as e:
                     self.stdout.write(
                         self.style.ERROR(f"Failed to list Auth0 users: {e}")
                     )
                     break
-                
-                users = result.get('users', [])
-                total = result.get('total', len(users))
-                
+
+                found = result.get('users', [])
+                users = [user for user in found if user.get('user_id') not in seen]
                 if not users:
-                    break
-                
-                self.stdout.write(f"Processing page {page + 1} ({len(users)} users)...")
-                
-                for auth0_user in users:
-                    auth0_id = auth0_user.get('user_id')
-                    created_at = auth0_user.get('created_at')
-                    email = auth0_user.get('email', 'unknown')
-                    
-                    # Parse created_at timestamp (Auth0 format: ISO 8601 or timestamp)
-                    try:
-                        if isinstance(created_at, str):
-                            # Parse ISO 8601 format (e.g., "2024-01-01T00:00:00.000Z")
-                            from datetime import datetime
-                            # Remove timezone info if present and parse
-                            created_str = created_at.replace('Z', '+00:00')
-                            if '+' not in created_str and '-' in created_str[-6:]:
-                                # Already has timezone
-                                pass
-                            elif '+' not in created_str:
-                                created_str += '+00:00'
-                            created_dt = datetime.fromisoformat(created_str.replace('Z', ''))
-                            # Convert to UTC timestamp in milliseconds
-                            created_timestamp = int(created_dt.timestamp() * 1000)
-                        elif isinstance(created_at, (int, float)):
-                            # Already a timestamp (in milliseconds or seconds)
-                            created_timestamp = int(created_at) if created_at > 1e10 else int(created_at * 1000)
-                        else:
-                            self.stdout.write(
-                                self.style.WARNING(
-                                    f"Unknown created_at format for user {auth0_id}, skipping"
-                                )
-                            )
-                            error_count += 1
-                            continue
-                    except Exception as e:
+                    if len(found) < PER_PAGE:
+                        complete = True
+                        break
+                    # A full page of handled users: look past it
+                    search_page += 1
+                    continue
+
+                page += 1
+                self.stdout.write(f"Processing page {page} ({len(users)} users)...")
+
+                # Users that completed registration have a local record
+                ids = [user['user_id'] for user in users]
+                registered = set(AppUser.objects.filter(auth0_id__in=ids).values_list('auth0_id', flat=True))
+                unused = [user for user in users if user['user_id'] not in registered]
+                kept_count += len(users) - len(unused)
+
+                if dry_run:
+                    for auth0_user in unused:
                         self.stdout.write(
                             self.style.WARNING(
-                                f"Could not parse created_at for user {auth0_id}: {e}, skipping"
+                                f"Would delete: {auth0_user['user_id']} ({auth0_user.get('email', 'unknown')})"
+                                f" - created: {auth0_user.get('created_at')}"
                             )
                         )
-                        error_count += 1
-                        continue
-                    
-                    # Check if user is older than cutoff
-                    if created_timestamp >= cutoff_timestamp:
-                        # User is too new, skip
-                        kept_count += 1
-                        continue
-                    
-                    # Check if we have this user in our database
-                    app_user_exists = AppUser.objects.filter(auth0_id=auth0_id).exists()
-                    
-                    if not app_user_exists:
-                        # User never completed registration - candidate for deletion
-                        if dry_run:
-                            self.stdout.write(
-                                self.style.WARNING(
-                                    f"Would delete: {auth0_id} ({email}) - created: {created_at}"
-                                )
-                            )
+                    deleted_count += len(unused)
+                else:
+                    for auth0_user, _, error in run_concurrently(
+                        lambda user: Auth0Client.delete_user(user['user_id'], ignore_not_found=True),
+                        unused, workers, throttle
+                    ):
+                        auth0_id = auth0_user['user_id']
+                        email = auth0_user.get('email', 'unknown')
+                        if error is None:
                             deleted_count += 1
+                            self.stdout.write(self.style.SUCCESS(f"Deleted: {auth0_id} ({email})"))
+                            logger.info(f"Deleted unused Auth0 user: {auth0_id} ({email})")
                         else:
-                            try:
-                                Auth0Client.delete_user(auth0_id, ignore_not_found=True)
-                                deleted_count += 1
-                                self.stdout.write(
-                                    self.style.SUCCESS(
-                                        f"Deleted: {auth0_id} ({email})"
-                                    )
-                                )
-                                logger.info(f"Deleted unused Auth0 user: {auth0_id} ({email})")
-                            except ExternalServiceError as e:
-                                self.stdout.write(
-                                    self.style.ERROR(
-                                        f"Failed to delete {auth0_id}: {e}"
-                                    )
-                                )
-                                error_count += 1
-                                logger.error(f"Failed to delete Auth0 user {auth0_id}: {e}")
-                    else:
-                        # User exists in our database - keep
-                        kept_count += 1
-                
-                # Check if we've processed all users
-                if len(users) < per_page:
-                    break
-                
-                page += 1
-                
-                # Safety limit to prevent infinite loops
-                if page > 100:  # Max 10,000 users
-                    self.stdout.write(
-                        self.style.WARNING("Reached page limit (100), stopping")
-                    )
-                    break
-            
+                            self.stdout.write(self.style.ERROR(f"Failed to delete {auth0_id}: {error}"))
+                            error_count += 1
+                            logger.error(f"Failed to delete Auth0 user {auth0_id}: {error}")
+
+                # Advance the cursor past this page
+                last = users[-1]['created_at']
+                if last != after:
+                    after, seen, search_page = last, set(), 0
+                seen.update(user['user_id'] for user in users if user['created_at'] == after)
+                if not dry_run:
+                    save_checkpoint(CHECKPOINT, {'scope': scope, 'after': after, 'seen': sorted(seen)})
+
+            # A failed run keeps its checkpoint for the next one
+            if complete and not dry_run:
+                clear_checkpoint(CHECKPOINT)
+
             # Summary
             self.stdout.write("\n" + "=" * 60)
             if dry_run:
@@ -204,10 +204,10 @@ class Command(BaseCommand):
                         f"  Errors: {error_count}"
                     )
                 )
-                
+
         except KeyboardInterrupt:
             self.stdout.write(
-                self.style.WARNING("\nCleanup interrupted by user")
+                self.style.WARNING("\nCleanup interrupted by user, progress saved")
             )
         except Exception as e:
             logger.exception("Unexpected error during Auth0 cleanup")
@@ -215,4 +215,3 @@ class Command(BaseCommand):
                 self.style.ERROR(f"Unexpected error: {e}")
             )
             raise
-
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:19
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+# Generated columns need an IMMUTABLE expression: to_tsvector and
+# jsonb_to_tsvector are, as long as the text search configuration is
+# given explicitly. 'simple' (no stemming, no stop words) suits names and
+# skill keywords, and keeps "Will" or "IT" searchable.
+MENTOR_SEARCH_FUNCTION = """
+CREATE OR REPLACE FUNCTION accounts_mentor_search_document(
+    full_name text, professional_title text, skills jsonb, bio text
+)
+RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('simple'::regconfig, coalesce(full_name, '')), 'A')
+        || setweight(to_tsvector('simple'::regconfig, coalesce(professional_title, '')), 'B')
+        || setweight(jsonb_to_tsvector('simple'::regconfig, coalesce(skills, '[]'::jsonb), '["string"]'), 'B')
+        || setweight(to_tsvector('simple'::regconfig, coalesce(bio, '')), 'C')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_mentorprofile_wallet_balance'),
+    ]
+
+    operations = [
+        # gin_trgm_ops for fuzzy name matching
+        TrigramExtension(),
+        migrations.RunSQL(
+            MENTOR_SEARCH_FUNCTION,
+            reverse_sql="DROP FUNCTION IF EXISTS accounts_mentor_search_document(text, text, jsonb, text);",
+        ),
+        migrations.AddField(
+            model_name='mentorprofile',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('full_name', 'professional_title', 'skills', 'bio', function='accounts_mentor_search_document', output_field=django.contrib.postgres.search.SearchVectorField()), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='mentorprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='mentor_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mentorprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['full_name'], name='mentor_full_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:21
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+# Normalized entries of a skills/languages JSON value: arrays give their
+# string elements, legacy plain strings ("English, French") are split on
+# commas; entries are trimmed, lowercased and de-duplicated, so "Java" and
+# "java " become one key and never match "javascript". IMMUTABLE so it can
+# back generated columns.
+FACET_KEYS_FUNCTION = """
+CREATE OR REPLACE FUNCTION accounts_facet_keys(value jsonb)
+RETURNS text[] AS $$
+    SELECT coalesce(array_agg(DISTINCT key ORDER BY key), '{}')
+    FROM (
+        SELECT lower(btrim(item)) AS key
+        FROM jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(value) = 'array' THEN value ELSE '[]'::jsonb END
+        ) AS item
+        UNION ALL
+        SELECT lower(btrim(item))
+        FROM regexp_split_to_table(
+            CASE WHEN jsonb_typeof(value) = 'string' THEN value #>> '{}' ELSE '' END, ','
+        ) AS item
+    ) keys
+    WHERE key <> ''
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_mentorprofile_search'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            FACET_KEYS_FUNCTION,
+            reverse_sql="DROP FUNCTION IF EXISTS accounts_facet_keys(jsonb);",
+        ),
+        migrations.AddField(
+            model_name='menteeprofile',
+            name='language_keys',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('languages', function='accounts_facet_keys', output_field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)), output_field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)),
+        ),
+        migrations.AddField(
+            model_name='menteeprofile',
+            name='skill_keys',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('skills', function='accounts_facet_keys', output_field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)), output_field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)),
+        ),
+        migrations.AddField(
+            model_name='mentorprofile',
+            name='language_keys',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('languages', function='accounts_facet_keys', output_field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)), output_field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)),
+        ),
+        migrations.AddField(
+            model_name='mentorprofile',
+            name='skill_keys',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('skills', function='accounts_facet_keys', output_field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)), output_field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)),
+        ),
+        migrations.AddIndex(
+            model_name='menteeprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skill_keys'], name='mentee_skill_keys_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='menteeprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['language_keys'], name='mentee_language_keys_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mentorprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skill_keys'], name='mentor_skill_keys_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mentorprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['language_keys'], name='mentor_language_keys_idx'),
+        ),
+    ]
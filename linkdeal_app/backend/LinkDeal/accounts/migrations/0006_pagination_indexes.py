@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_profile_facet_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='menteeprofile',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='mentee_status_page_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mentorprofile',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='mentor_status_page_idx'),
+        ),
+    ]
@@ -1,3 +1,6 @@
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.db.models.signals import post_delete
 from django.dispatch import receiver
@@ -27,6 +30,23 @@ def mentor_profile_picture_upload_path(instance: "MentorProfile", filename: str)
     return f"mentors/{user_id}/profile_picture/{filename}"
 
 
+def facet_keys_field(source):
+    """
+    Generated text[] of the normalized (trimmed, lowercased, de-duplicated)
+    entries of a skills/languages JSON column, for GIN-indexed facet
+    filters. Legacy comma-separated strings are split into entries.
+    """
+    return models.GeneratedField(
+        expression=models.Func(
+            source,
+            function="accounts_facet_keys",
+            output_field=ArrayField(models.TextField()),
+        ),
+        output_field=ArrayField(models.TextField()),
+        db_persist=True,
+    )
+
+
 def mentor_cv_upload_path(instance: "MentorProfile", filename: str) -> str:
     user_id = instance.user_id or "unknown"
     return f"mentors/{user_id}/cv/{filename}"
@@ -250,8 +270,34 @@ class MentorProfile(models.Model):
         help_text="Last time the mentor was active on the platform"
     )
 
+    # Normalized facet values (see facet_keys_field)
+    skill_keys = facet_keys_field("skills")
+    language_keys = facet_keys_field("languages")
+
+    # Weighted full-text document (name > title/skills > bio), generated by
+    # PostgreSQL on every write; searched by mentoring/search.py
+    search_vector = models.GeneratedField(
+        expression=models.Func(
+            "full_name", "professional_title", "skills", "bio",
+            function="accounts_mentor_search_document",
+            output_field=SearchVectorField(),
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="mentor_search_vector_idx"),
+            GinIndex(fields=["full_name"], opclasses=["gin_trgm_ops"], name="mentor_full_name_trgm_idx"),
+            GinIndex(fields=["skill_keys"], name="mentor_skill_keys_idx"),
+            GinIndex(fields=["language_keys"], name="mentor_language_keys_idx"),
+            # Keyset pagination of the public and admin mentor lists
+            models.Index(fields=["status", "-created_at", "-id"], name="mentor_status_page_idx"),
+        ]
+
     def __str__(self):
         return f"MentorProfile({self.full_name} - {self.status})"
 
@@ -402,8 +448,20 @@ class MenteeProfile(models.Model):
         help_text="Last time the mentee was active on the platform"
     )
 
+    # Normalized facet values (see facet_keys_field)
+    skill_keys = facet_keys_field("skills")
+    language_keys = facet_keys_field("languages")
+
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=["skill_keys"], name="mentee_skill_keys_idx"),
+            GinIndex(fields=["language_keys"], name="mentee_language_keys_idx"),
+            # Keyset pagination of the admin mentee list
+            models.Index(fields=["status", "-created_at", "-id"], name="mentee_status_page_idx"),
+        ]
+
     def __str__(self):
         return f"MenteeProfile({self.full_name})"
 
@@ -0,0 +1,197 @@
+"""
+Bulk moderation of mentor and mentee accounts.
+
+moderate() applies one action (approve, reject, ban, unban) to a list of
+profiles:
+
+1. The profiles are loaded with one query and checked against the action's
+   rules.
+2. Their Auth0 app_metadata is updated AUTH0_WORKERS calls at a time,
+   waiting out the Auth0 rate limit. As in the single-profile admin views,
+   a profile whose Auth0 update fails is left unchanged.
+3. The others are updated with one UPDATE, in one transaction, guarded by
+   their status so a concurrent change is not overwritten. Their status
+   emails are queued with one outbox insert. Queryset updates send no
+   signals, so the admin dashboard KPIs are invalidated here.
+4. The Auth0 metadata of profiles that lost that race is set back to match
+   their current status, as it was already overwritten in step 2.
+"""
+import logging
+from typing import NamedTuple, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.auth0_client import Auth0Client
+from accounts.email_service import send_status_change_emails
+from accounts.models import MentorProfile
+from core.bulk import run_concurrently
+from core.dashboard import invalidate_dashboard_stats
+
+logger = logging.getLogger(__name__)
+
+AUTH0_WORKERS = 8
+MAX_BULK_IDS = 500
+
+
+class ModerationAction(NamedTuple):
+    status: str  # New profile status
+    allowed_from: Tuple[str, ...]  # Statuses the action applies to
+    error: str  # Result message for the other profiles
+    approval_status: str  # Auth0 app_metadata approval_status
+    email: str  # Status email (accounts.email_service.STATUS_EMAIL_TEMPLATES)
+
+
+MENTOR_ACTIONS = {
+    "approve": ModerationAction(
+        "approved", ("pending", "rejected"), "Only pending or rejected mentors can be approved.", "approved", "approved"
+    ),
+    "reject": ModerationAction(
+        "rejected", ("pending",), "Only pending mentors can be rejected.", "rejected", "rejected"
+    ),
+    "ban": ModerationAction(
+        "banned", ("approved",), "Only approved mentors can be banned.", "banned", "banned"
+    ),
+    "unban": ModerationAction(
+        "approved", ("banned",), "Mentor is not banned.", "approved", "unbanned"
+    ),
+}
+
+MENTEE_ACTIONS = {
+    "ban": ModerationAction(
+        "banned", ("active",), "Only active mentees can be banned.", "banned", "banned"
+    ),
+    "unban": ModerationAction(
+        "active", ("banned",), "Mentee is not banned.", "approved", "unbanned"
+    ),
+}
+
+
+# Auth0 app_metadata approval_status of each profile status
+APPROVAL_STATUSES = {
+    "pending": "pending",
+    "approved": "approved",
+    "rejected": "rejected",
+    "banned": "banned",
+    "active": "approved",
+}
+
+
+def actions_for(model):
+    return MENTOR_ACTIONS if model is MentorProfile else MENTEE_ACTIONS
+
+
+def _auth0_metadata(action_name, action, reason):
+    metadata = {"approval_status": action.approval_status}
+    if action_name == "ban" and reason:
+        metadata["ban_reason"] = reason
+    elif action_name == "unban":
+        metadata["ban_reason"] = None
+    return metadata
+
+
+def _update_auth0(profiles, metadata_for):
+    """Write the app_metadata of each profile; yields (profile, result, error)."""
+    return run_concurrently(
+        lambda profile: Auth0Client.update_user_app_metadata(profile.user.auth0_id, metadata_for(profile)),
+        profiles,
+        AUTH0_WORKERS,
+        Auth0Client.http().throttle,
+    )
+
+
+def _restore_auth0_metadata(model, profiles, user_type):
+    """Set the Auth0 metadata of profiles back to their current status."""
+    current = {
+        pk: (status, ban_reason)
+        for pk, status, ban_reason in model.objects.filter(
+            pk__in=[profile.pk for profile in profiles]
+        ).values_list("pk", "status", "ban_reason")
+    }
+    profiles = [profile for profile in profiles if profile.pk in current]
+
+    def metadata_for(profile):
+        status, ban_reason = current[profile.pk]
+        return {
+            "approval_status": APPROVAL_STATUSES[status],
+            "ban_reason": ban_reason if status == "banned" else None,
+        }
+
+    for profile, _, error in _update_auth0(profiles, metadata_for):
+        if error is not None:
+            logger.error(
+                f"Bulk moderation: could not restore Auth0 metadata of {user_type} {profile.pk}: {error}"
+            )
+
+
+def moderate(model, action_name, ids, *, reason: Optional[str] = None, admin=None):
+    """
+    Apply a moderation action to the profiles of model (MentorProfile or
+    MenteeProfile) with the given ids. admin and reason are recorded on
+    bans. Returns {"id", "success", "message"} dicts in ids order.
+    """
+    action = actions_for(model)[action_name]
+    user_type = "mentor" if model is MentorProfile else "mentee"
+    ids = list(dict.fromkeys(str(pk) for pk in ids))
+    messages = {}
+
+    profiles = {str(profile.pk): profile for profile in model.objects.filter(pk__in=ids).select_related("user")}
+    eligible = []
+    for pk in ids:
+        profile = profiles.get(pk)
+        if profile is None:
+            messages[pk] = (False, "Not found.")
+        elif profile.status not in action.allowed_from:
+            messages[pk] = (False, action.error)
+        else:
+            eligible.append(profile)
+
+    # Only the API calls run in the pool
+    metadata = _auth0_metadata(action_name, action, reason)
+    synced = []
+    for profile, _, error in _update_auth0(eligible, lambda profile: metadata):
+        if error is None:
+            synced.append(profile)
+        else:
+            logger.error(f"Bulk {action_name}: Auth0 update failed for {user_type} {profile.pk}: {error}")
+            messages[str(profile.pk)] = (False, "Auth0 update failed.")
+
+    fields = {"status": action.status}
+    if action_name == "ban":
+        fields.update(banned_at=timezone.now(), banned_by=admin, ban_reason=reason)
+
+    with transaction.atomic():
+        locked = set(
+            model.objects.select_for_update()
+            .filter(pk__in=[profile.pk for profile in synced], status__in=action.allowed_from)
+            .values_list("pk", flat=True)
+        )
+        model.objects.filter(pk__in=locked).update(**fields)
+
+        updated = []
+        lost = []
+        for profile in synced:
+            if profile.pk in locked:
+                for field, value in fields.items():
+                    setattr(profile, field, value)
+                updated.append(profile)
+                messages[str(profile.pk)] = (True, f"{user_type.capitalize()} status set to {action.status}.")
+            else:
+                lost.append(profile)
+                messages[str(profile.pk)] = (False, "Status changed by another request.")
+
+        if updated:
+            send_status_change_emails(
+                [(profile.user.email, profile.full_name) for profile in updated],
+                status=action.email,
+                user_type=user_type,
+                ban_reason=reason if action_name == "ban" else None,
+            )
+            if model is MentorProfile:
+                invalidate_dashboard_stats()
+
+    if lost:
+        _restore_auth0_metadata(model, lost, user_type)
+
+    logger.info(f"Bulk {action_name} of {len(ids)} {user_type}s: {len(updated)} updated")
+    return [{"id": pk, "success": messages[pk][0], "message": messages[pk][1]} for pk in ids]
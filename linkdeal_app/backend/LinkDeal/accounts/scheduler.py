@@ -1,4 +1,4 @@
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
 from django.core.management import call_command
 import logging
 
@@ -14,16 +14,21 @@ def cleanup_job():
     except Exception as e:
         logger.error(f"Scheduler: Error running cleanup job: {e}")
 
-def start():
+def register_jobs(scheduler):
     """
-    Initialize and start the scheduler.
+    Periodic account jobs (see core/scheduler.py).
     """
-    scheduler = BackgroundScheduler()
-    # We use MemoryJobStore by default (simpler setup). 
-    # If users restart server, jobs are re-added.
-    
-    # Run every 24 hours (production setting)
-    scheduler.add_job(cleanup_job, "interval", hours=24, id="cleanup_users", replace_existing=True)
-    
-    scheduler.start()
-    logger.info("Scheduler: Started! Cleanup job set to run every 1 minute.")
+    from core.scheduler import add_job
+
+    return [
+        # Run every 24 hours (production setting); a run missed while no
+        # scheduler was up still happens within the next 12 hours
+        add_job(
+            scheduler,
+            cleanup_job,
+            trigger=IntervalTrigger(hours=24),
+            id="cleanup_users",
+            name="Clean up unverified users",
+            misfire_grace_time=12 * 60 * 60,
+        ),
+    ]
@@ -4,9 +4,11 @@ Django signals for account-related operations.
 Handles bidirectional sync between Django and Auth0.
 """
 import logging
-from django.db.models.signals import pre_delete
+from django.db.models.signals import pre_delete, post_save, post_delete
 from django.dispatch import receiver
-from accounts.models import AppUser
+from accounts.models import AppUser, MentorProfile, MenteeProfile
+from core import rollups
+from core.dashboard import invalidate_dashboard_stats
 from accounts.auth0_client import Auth0Client
 from core.exceptions import ExternalServiceError
 
@@ -59,3 +61,31 @@ def delete_appuser_from_auth0(sender, instance, **kwargs):
     except Exception as e:
         logger.exception(f"Unexpected error deleting Auth0 user {instance.auth0_id}: {e}")
 
+
+@receiver(post_save, sender=MentorProfile)
+@receiver(post_save, sender=MenteeProfile)
+def record_profile_signup(sender, instance, created, **kwargs):
+    """Count new mentor/mentee profiles in the signup rollups (by user creation time)."""
+    if created:
+        role = 'mentor' if sender is MentorProfile else 'mentee'
+        rollups.record_signup(role, instance.user.created_at)
+
+
+@receiver(post_delete, sender=MentorProfile)
+@receiver(post_delete, sender=MenteeProfile)
+def remove_profile_signup(sender, instance, **kwargs):
+    """Removed profiles no longer count in the signup rollups."""
+    try:
+        created_at = instance.user.created_at
+    except AppUser.DoesNotExist:
+        return
+    role = 'mentor' if sender is MentorProfile else 'mentee'
+    rollups.record_signup(role, created_at, removed=True)
+
+
+@receiver([post_save, post_delete], sender=MentorProfile)
+def invalidate_mentor_kpis(sender, instance, signal, **kwargs):
+    """Approving, rejecting or banning a mentor changes the admin dashboard counts."""
+    update_fields = kwargs.get('update_fields')
+    if signal is post_delete or kwargs.get('created') or update_fields is None or 'status' in update_fields:
+        invalidate_dashboard_stats()
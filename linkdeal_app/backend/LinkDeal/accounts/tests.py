@@ -1,3 +1,158 @@
-from django.test import TestCase
+import re
+import threading
+import time
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from accounts.auth0_client import MGMT_TOKEN_REFRESH_MARGIN, Auth0Client
+from accounts.management.commands import cleanup_auth0_users
+from accounts.models import AppUser, MentorProfile
+from accounts import moderation
+from accounts.moderation import moderate
+from core.exceptions import ExternalServiceError
+from core.models import JobCheckpoint, OutboundEmail
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class MgmtTokenCacheTestCase(SimpleTestCase):
+    """The Auth0 Management API token is fetched once and reused until it expires."""
+
+    def setUp(self):
+        cache.clear()
+        token_patch = mock.patch.object(Auth0Client, '_mgmt_token', None)
+        token_patch.start()
+        self.addCleanup(token_patch.stop)
+        self.tokens = iter(['token-1', 'token-2'])
+
+    def _request(self):
+        time.sleep(0.05)
+        return next(self.tokens), 3600
+
+    def test_concurrent_callers_share_one_request(self):
+        results = []
+        with mock.patch.object(Auth0Client, '_request_mgmt_token', side_effect=self._request) as request:
+            threads = [
+                threading.Thread(target=lambda: results.append(Auth0Client._get_mgmt_token()))
+                for _ in range(10)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(request.call_count, 1)
+        self.assertEqual(results, ['token-1'] * 10)
+
+    def test_token_shared_through_cache(self):
+        with mock.patch.object(Auth0Client, '_request_mgmt_token', side_effect=self._request) as request:
+            Auth0Client._get_mgmt_token()
+            # Another worker: nothing in its process, the cached token is used
+            Auth0Client._mgmt_token = None
+            self.assertEqual(Auth0Client._get_mgmt_token(), 'token-1')
+            self.assertEqual(request.call_count, 1)
+
+    def test_token_refreshed_before_expiry(self):
+        Auth0Client._mgmt_token = ('old', time.time() + MGMT_TOKEN_REFRESH_MARGIN - 1)
+        with mock.patch.object(Auth0Client, '_request_mgmt_token', side_effect=self._request):
+            self.assertEqual(Auth0Client._get_mgmt_token(), 'token-1')
+
+
+class BulkModerationTestCase(TestCase):
+    """Bulk moderation updates eligible profiles in one go and reports per id."""
+
+    def setUp(self):
+        self.mentors = [self._create_mentor(i, 'pending') for i in range(3)]
+        self.approved = self._create_mentor(3, 'approved')
+
+    def _create_mentor(self, i, status):
+        user = AppUser.objects.create(email=f'mentor{i}@test.com', role='mentor', auth0_id=f'auth0|mentor{i}')
+        return MentorProfile.objects.create(
+            user=user,
+            email=user.email,
+            full_name=f'Mentor {i}',
+            professional_title='Senior Dev',
+            location='Remote',
+            linkedin_url='https://linkedin.com/in/mentor',
+            bio='Great mentor',
+            country='USA',
+            session_rate=Decimal('100.00'),
+            status=status,
+        )
+
+    def test_bulk_approve(self):
+        def update_metadata(auth0_user_id, metadata):
+            if auth0_user_id == 'auth0|mentor2':
+                raise ExternalServiceError("Auth0 app_metadata update failed")
+            return {}
+
+        ids = [mentor.pk for mentor in self.mentors] + [self.approved.pk]
+        with mock.patch.object(Auth0Client, 'update_user_app_metadata', side_effect=update_metadata) as update:
+            results = moderate(MentorProfile, 'approve', ids)
+            self.assertEqual(update.call_count, 3)
+
+        self.assertEqual([result['success'] for result in results], [True, True, False, False])
+        self.assertEqual(
+            list(MentorProfile.objects.order_by('full_name').values_list('status', flat=True)),
+            ['approved', 'approved', 'pending', 'approved'],
+        )
+        # One approval email per approved mentor
+        self.assertEqual(OutboundEmail.objects.count(), 2)
+
+    def test_lost_race_restores_auth0_metadata(self):
+        run_concurrently = moderation.run_concurrently
+        raced = []
+
+        def fan_out(*args, **kwargs):
+            results = run_concurrently(*args, **kwargs)
+            if not raced:
+                # Another admin approves mentor 0 while Auth0 is being updated
+                MentorProfile.objects.filter(pk=self.mentors[0].pk).update(status='approved')
+                raced.append(True)
+            return results
+
+        with mock.patch.object(moderation, 'run_concurrently', side_effect=fan_out), \
+                mock.patch.object(Auth0Client, 'update_user_app_metadata', return_value={}) as update:
+            results = moderate(MentorProfile, 'reject', [mentor.pk for mentor in self.mentors])
+
+        self.assertEqual([result['success'] for result in results], [False, True, True])
+        self.assertEqual(update.call_count, 4)
+        self.assertEqual(
+            update.call_args_list[-1],
+            mock.call('auth0|mentor0', {'approval_status': 'approved', 'ban_reason': None}),
+        )
+
+
+class CleanupAuth0UsersTestCase(TestCase):
+    """The created_at cursor walks past users sharing one timestamp."""
+
+    def setUp(self):
+        # More users at one instant than fit in a search page
+        self.users = [
+            {'user_id': f'google-oauth2|{i}', 'email': f'user{i}@test.com', 'created_at': '2026-01-01T00:00:00.000Z'}
+            for i in range(5)
+        ] + [{'user_id': 'google-oauth2|late', 'email': 'late@test.com', 'created_at': '2026-01-02T00:00:00.000Z'}]
+        AppUser.objects.create(email='user1@test.com', role='mentee', auth0_id='google-oauth2|1')
+        self.deleted = []
+
+    def _list_users(self, per_page, page, query, **kwargs):
+        # Inclusive lower bound, as in the command's search query
+        after = re.match(r'created_at:\["([^"]+)"', query)
+        users = [user for user in self.users if not after or user['created_at'] >= after.group(1)]
+        return {'users': users[page * per_page:(page + 1) * per_page]}
+
+    def test_every_user_is_checked_once(self):
+        with mock.patch.object(cleanup_auth0_users, 'PER_PAGE', 2), \
+                mock.patch.object(Auth0Client, 'list_users', side_effect=self._list_users), \
+                mock.patch.object(Auth0Client, 'delete_user', side_effect=lambda user_id, **kw: self.deleted.append(user_id)):
+            call_command('cleanup_auth0_users', '--days', '0', stdout=StringIO())
+
+        self.assertCountEqual(
+            self.deleted,
+            [user['user_id'] for user in self.users if user['user_id'] != 'google-oauth2|1']
+        )
+        self.assertFalse(JobCheckpoint.objects.filter(name=cleanup_auth0_users.CHECKPOINT).exists())
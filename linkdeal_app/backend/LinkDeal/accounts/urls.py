@@ -26,6 +26,8 @@ from accounts.admin_views import (
     MenteesListAdminView,
     MenteeDetailAdminView,
     BanMenteeView,
+    BulkMentorModerationView,
+    BulkMenteeModerationView,
     UnbanMenteeView,
     AdminInviteView,
     DeleteUserView,
@@ -75,6 +77,7 @@ urlpatterns = [
     path("admin/mentors/<uuid:pk>/ban/", BanMentorView.as_view(), name="ban-mentor"),
     path("admin/mentors/<uuid:pk>/unban/", UnbanMentorView.as_view(), name="unban-mentor"),
     path("admin/mentors/<uuid:pk>/edit/", EditMentorView.as_view(), name="edit-mentor"),
+    path("admin/mentors/bulk/<str:action>/", BulkMentorModerationView.as_view(), name="bulk-moderate-mentors"),
 
     # Admin mentee management
     path("admin/mentees/", MenteesListAdminView.as_view(), name="admin-mentees-list"),
@@ -82,6 +85,7 @@ urlpatterns = [
     path("admin/mentees/<uuid:pk>/ban/", BanMenteeView.as_view(), name="ban-mentee"),
     path("admin/mentees/<uuid:pk>/unban/", UnbanMenteeView.as_view(), name="unban-mentee"),
     path("admin/mentees/<uuid:pk>/edit/", EditMenteeView.as_view(), name="edit-mentee"),
+    path("admin/mentees/bulk/<str:action>/", BulkMenteeModerationView.as_view(), name="bulk-moderate-mentees"),
 
     # Super admin - admin invitation
     path("admin/admins/", AdminInviteView.as_view(), name="admin-invite"),
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_pagination_indexes'),
+        ('billing', '0002_remove_payment_refunded_at_payment_payout_processed_and_more'),
+        ('scheduling', '0006_session_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['mentee', '-created_at', '-id'], name='payment_mentee_page_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['mentor', '-created_at', '-id'], name='payment_mentor_page_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['-created_at', '-id'], name='payment_page_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payout',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='payout_user_page_idx'),
+        ),
+    ]
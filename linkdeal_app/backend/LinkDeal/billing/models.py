@@ -96,6 +96,12 @@ class Payment(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination of payment history (per mentee, per mentor, admin)
+            models.Index(fields=['mentee', '-created_at', '-id'], name='payment_mentee_page_idx'),
+            models.Index(fields=['mentor', '-created_at', '-id'], name='payment_mentor_page_idx'),
+            models.Index(fields=['-created_at', '-id'], name='payment_page_idx'),
+        ]
 
     def calculate_fees(self):
         """
@@ -165,6 +171,9 @@ class Payout(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='payout_user_page_idx'),
+        ]
 
     def __str__(self):
         return f"Payout {self.id} - {self.amount} {self.currency} to {self.user.email}"
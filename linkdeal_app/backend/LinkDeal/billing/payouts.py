@@ -0,0 +1,95 @@
+"""
+Mentor payouts for completed sessions.
+
+When a session is completed, the mentor's share of its payment
+(Payment.mentor_payout) moves from the platform wallet to the mentor's
+wallet, exactly once per payment (Payment.payout_processed).
+"""
+import logging
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+
+from accounts.models import MentorProfile
+from billing.email_service import send_session_completion_funds_email
+from billing.models import Payment
+from core.models import PlatformSettings
+
+logger = logging.getLogger(__name__)
+
+# Sessions handled per payout transaction
+PAYOUT_BATCH_SIZE = 100
+
+
+def process_session_payouts(session_ids, batch_size=PAYOUT_BATCH_SIZE):
+    """
+    Transfer mentor payouts for the given completed sessions.
+
+    Works in batches: each batch locks its unprocessed completed payments,
+    credits each mentor once with the sum of their payouts, debits the
+    platform wallet once and flags the payments as processed, all in one
+    transaction. Notification emails are sent after the batch commits.
+    Returns the number of payments paid out.
+    """
+    session_ids = list(session_ids)
+    processed = 0
+    for offset in range(0, len(session_ids), batch_size):
+        batch = session_ids[offset:offset + batch_size]
+        try:
+            processed += _process_payout_batch(batch)
+        except Exception as e:
+            logger.error(f"Error processing payouts for {len(batch)} sessions: {e}", exc_info=True)
+    return processed
+
+
+def _process_payout_batch(session_ids):
+    with transaction.atomic():
+        # Lock payment rows so concurrent completions cannot pay out twice
+        payments = list(
+            Payment.objects.select_for_update(of=('self',)).filter(
+                session_id__in=session_ids,
+                status='completed',
+                payout_processed=False,
+            ).select_related('mentor__user')
+        )
+        if not payments:
+            return 0
+
+        totals = defaultdict(Decimal)
+        for payment in payments:
+            totals[payment.mentor_id] += payment.mentor_payout
+
+        for mentor_id, amount in totals.items():
+            MentorProfile.objects.filter(id=mentor_id).update(
+                wallet_balance=F('wallet_balance') + amount
+            )
+
+        # Funds were held by the platform until the session took place
+        settings = PlatformSettings.get_settings()
+        PlatformSettings.objects.filter(pk=settings.pk).update(
+            wallet_balance=F('wallet_balance') - sum(totals.values())
+        )
+
+        Payment.objects.filter(id__in=[payment.id for payment in payments]).update(
+            payout_processed=True
+        )
+
+    for payment in payments:
+        logger.info(
+            f"Transferred {payment.mentor_payout} to mentor {payment.mentor.user.email} "
+            f"for session {payment.session_id}"
+        )
+        try:
+            send_session_completion_funds_email(
+                mentor_email=payment.mentor.user.email,
+                mentor_name=payment.mentor.full_name,
+                amount=payment.mentor_payout,
+                currency=payment.currency,
+                session_id=str(payment.session_id)
+            )
+        except Exception as e:
+            logger.error(f"Failed to send funds email: {e}")
+
+    return len(payments)
@@ -9,6 +9,7 @@ from django.db import transaction
 from accounts.permissions import IsAuthenticatedAuth0
 from accounts.models import AppUser, MenteeProfile, MentorProfile
 from core.models import PlatformSettings
+from core.pagination import KeysetPagination
 from billing.models import Payment, Payout
 from billing.serializers import (
     PaymentSerializer,
@@ -129,10 +130,17 @@ class ConfirmPaymentView(APIView):
         )
 
 
+class PaymentPagination(KeysetPagination):
+    # ?limit= predates keyset pagination and keeps its default of 10
+    page_size = 10
+    page_size_query_param = 'limit'
+
+
 class PaymentListView(APIView):
     """
     GET /billing/payments/
-    List payments for the authenticated user (as mentee or mentor).
+    List payments for the authenticated user (as mentee or mentor),
+    all payments for admins; paginated with ?limit= and ?cursor=.
     """
     permission_classes = [IsAuthenticatedAuth0]
 
@@ -164,22 +172,17 @@ class PaymentListView(APIView):
         else:
             payments = Payment.objects.all()
         
-        limit = request.query_params.get('limit', 10)
-        try:
-            limit = int(limit)
-        except ValueError:
-            limit = 10
-        
-        payments = payments[:limit]
+        paginator = PaymentPagination()
+        payments = paginator.paginate_queryset(payments, request, view=self)
         serializer = PaymentHistorySerializer(payments, many=True)
         
-        return Response(
+        return paginator.add_pagination_headers(Response(
             {
                 "success": True,
                 "data": serializer.data,
             },
             status=status.HTTP_200_OK,
-        )
+        ))
 
 
 class PaymentDetailView(APIView):
@@ -294,6 +297,7 @@ class PayoutListView(generics.ListAPIView):
     """
     permission_classes = [IsAuthenticatedAuth0]
     serializer_class = PayoutSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         user = self.request.user
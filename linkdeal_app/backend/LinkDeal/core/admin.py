@@ -1,3 +1,11 @@
 from django.contrib import admin
+from core.models import OutboundEmail
 
-# Register your models here.
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'recipients', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['subject', 'recipients', 'last_error']
+    readonly_fields = ['created_at', 'sent_at', 'last_error']
+    ordering = ['-created_at']
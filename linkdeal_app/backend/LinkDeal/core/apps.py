@@ -4,3 +4,16 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        """
+        Start a scheduler leader candidate in web processes that opt in
+        (production runs `manage.py run_scheduler` instead), and under
+        runserver in its main process (not in migrations or shell).
+        """
+        import os
+        from django.conf import settings
+
+        if settings.SCHEDULER_AUTOSTART or os.environ.get('RUN_MAIN') == 'true':
+            from core.scheduler import start_in_background
+            start_in_background()
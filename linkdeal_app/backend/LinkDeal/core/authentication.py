@@ -10,6 +10,7 @@ from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 from accounts.models import AppUser, MentorProfile, MenteeProfile
 from accounts.services import IdentityMappingService
+from core.http import client as http_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,7 @@ logger = logging.getLogger(__name__)
 def _get_jwks():
     url = f"https://{settings.AUTH0_DOMAIN}/.well-known/jwks.json"
     try:
-        resp = requests.get(url, timeout=5)
+        resp = http_client("auth0").get(url, timeout=5)
         resp.raise_for_status()
         return resp.json()
     except requests.RequestException as e:
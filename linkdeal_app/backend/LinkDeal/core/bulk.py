@@ -0,0 +1,50 @@
+"""
+Building blocks of the bulk maintenance commands.
+
+Work goes page by page: a command diffs a page of remote records against
+the local rows in memory, runs the page's per-item API calls through a
+bounded pool (run_concurrently) and then records its position
+(save_checkpoint), so an interrupted run resumes after the last completed
+page. The checkpoint is cleared once the run completes.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from core.models import JobCheckpoint
+
+
+def load_checkpoint(name):
+    """State saved by the last incomplete run of name, or None."""
+    return JobCheckpoint.objects.filter(name=name).values_list('state', flat=True).first()
+
+
+def save_checkpoint(name, state):
+    JobCheckpoint.objects.update_or_create(name=name, defaults={'state': state})
+
+
+def clear_checkpoint(name):
+    JobCheckpoint.objects.filter(name=name).delete()
+
+
+def run_concurrently(func, items, workers, before_call=None):
+    """
+    Call func on each item, at most `workers` calls at a time; before_call
+    (typically a rate limit throttle) runs before each call. Returns
+    (item, result, error) tuples in item order, error being the exception
+    func raised, if any.
+
+    func runs in pool threads: it should only do API calls, the database
+    work stays with the caller.
+    """
+    def call(item):
+        if before_call is not None:
+            before_call()
+        try:
+            return item, func(item), None
+        except Exception as e:
+            return item, None, e
+
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(call, items))
@@ -0,0 +1,78 @@
+"""
+Circuit breaker for calls to external services.
+
+After `failure_threshold` consecutive failures the circuit opens and calls
+are refused without reaching the service for `reset_timeout` seconds. Then
+a single trial call is let through (half-open): success closes the circuit,
+failure opens it again. State is per process.
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service whose circuit is open."""
+
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=5, reset_timeout=60):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._opened_at is not None and not self._trial_due()
+
+    def _trial_due(self):
+        return time.monotonic() - self._opened_at >= self.reset_timeout and not self._trial_running
+
+    def _before_call(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if not self._trial_due():
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            self._trial_running = True
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"{self.name} circuit closed")
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(f"{self.name} circuit opened after {self._failures} failures")
+                self._opened_at = time.monotonic()
+
+    def call(self, func, *args, **kwargs):
+        """
+        Call func through the breaker. Exceptions and falsy results (the
+        integrations' "request failed" value) count as failures.
+        """
+        self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        if result:
+            self.record_success()
+        else:
+            self.record_failure()
+        return result
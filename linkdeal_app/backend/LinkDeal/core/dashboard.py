@@ -0,0 +1,114 @@
+"""
+Platform KPIs for the admin dashboard.
+
+The KPIs are computed in one SQL statement and cached with
+stale-while-revalidate semantics: an entry younger than FRESH_FOR is served
+as is; an older one is still served while a single background thread
+recomputes it, so constant dashboard polling costs at most one query per
+FRESH_FOR seconds. Payment completion and mentor status changes drop the
+entry (see billing/signals.py and accounts/signals.py).
+"""
+import logging
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "core:admin_dashboard_stats"
+REFRESH_LOCK_KEY = "core:admin_dashboard_stats:refresh"
+FRESH_FOR = 30  # Seconds before a cached entry is refreshed in the background
+STALE_FOR = 60 * 10  # Seconds a stale entry may still be served
+
+KPI_FIELDS = [
+    'total_users', 'active_mentors', 'pending_mentors',
+    'monthly_revenue', 'total_payments', 'platform_earnings',
+]
+
+
+def compute_dashboard_stats():
+    """All admin dashboard KPIs, from a single SQL statement."""
+    from accounts.models import AppUser, MentorProfile
+    from billing.models import Payment
+    from scheduling.models import Session
+
+    def table(model):
+        return connection.ops.quote_name(model._meta.db_table)
+
+    thirty_days_ago = timezone.now() - timedelta(days=30)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT
+                (SELECT COUNT(*) FROM {table(AppUser)}
+                 WHERE role NOT IN ('admin', 'super_admin')),
+                mentors.active,
+                mentors.pending,
+                (SELECT COALESCE(SUM(price), 0) FROM {table(Session)}
+                 WHERE status = 'completed' AND scheduled_at >= %s),
+                payments.total,
+                payments.fees
+            FROM
+                (SELECT COUNT(*) FILTER (WHERE status = 'approved') AS active,
+                        COUNT(*) FILTER (WHERE status = 'pending') AS pending
+                 FROM {table(MentorProfile)}) AS mentors,
+                (SELECT COALESCE(SUM(amount), 0) AS total,
+                        COALESCE(SUM(platform_fee), 0) AS fees
+                 FROM {table(Payment)}
+                 WHERE status = 'completed') AS payments
+            """,
+            [thirty_days_ago]
+        )
+        row = cursor.fetchone()
+
+    return dict(zip(KPI_FIELDS, row))
+
+
+def _store(stats):
+    cache.set(CACHE_KEY, {'stats': stats, 'computed_at': time.time()}, STALE_FOR)
+
+
+def _refresh_in_background():
+    def refresh():
+        try:
+            _store(compute_dashboard_stats())
+        except Exception as e:
+            logger.error(f"Failed to refresh admin dashboard stats: {e}", exc_info=True)
+        finally:
+            cache.delete(REFRESH_LOCK_KEY)
+            connection.close()
+
+    threading.Thread(target=refresh, name='admin-dashboard-stats', daemon=True).start()
+
+
+def get_dashboard_stats():
+    """Return the admin dashboard KPIs, from cache when possible."""
+    entry = cache.get(CACHE_KEY)
+    if entry is None:
+        stats = compute_dashboard_stats()
+        _store(stats)
+        return stats
+
+    if time.time() - entry['computed_at'] > FRESH_FOR:
+        # Only one worker refreshes; the others keep serving the stale entry
+        if cache.add(REFRESH_LOCK_KEY, True, timeout=FRESH_FOR):
+            _refresh_in_background()
+    return entry['stats']
+
+
+def invalidate_dashboard_stats():
+    """Drop the cached KPIs once the current transaction commits."""
+    transaction.on_commit(lambda: cache.delete(CACHE_KEY))
+
+
+def format_amount(amount, symbol, decimals=2):
+    """€1.2K above a thousand, €950.00 (or €950 with decimals=0) below."""
+    amount = Decimal(amount)
+    if amount >= 1000:
+        return f"{symbol}{amount / 1000:.1f}K"
+    return f"{symbol}{amount:.{decimals}f}"
@@ -0,0 +1,129 @@
+"""
+Email templates.
+
+Every email is a single template file holding its whole content in blocks:
+
+    {% block subject %}...{% endblock %}
+    {% block text %}...{% endblock %}   plain-text body
+    {% block html %}...{% endblock %}   HTML body (or its layout content)
+    {% block layout %}core/emails/layout.html{% endblock %}   optional
+    {% block title %}...{% endblock %}  <title> of the layout, optional
+
+Templates are loaded through Django's cached loader, so each file is parsed
+once per process; the block nodes of a compiled template are looked up once
+and rendered directly, without going through {% extends %}. The shared
+layout is rendered once with placeholders and split into static segments:
+wrapping an email body in it is a string concatenation.
+
+render_email_batch() renders the same template for many per-recipient
+contexts, and send_templated_batch() queues the results in one INSERT.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+from django.template import Context
+from django.template.loader import get_template
+from django.template.loader_tags import BlockNode
+from django.utils.html import escape
+
+from core.outbox import queue_email, queue_emails
+
+RenderedEmail = namedtuple('RenderedEmail', ['subject', 'text', 'html'])
+
+_TITLE_MARKER = '@@email-title@@'
+_CONTENT_MARKER = '@@email-content@@'
+
+
+@lru_cache(maxsize=None)
+def _blocks(template):
+    """Top-level blocks of a compiled template, by name."""
+    return {node.name: node for node in template.nodelist.get_nodes_by_type(BlockNode)}
+
+
+def _compiled(template_name):
+    # The backend wrapper of the cached loader holds the compiled Template
+    return get_template(template_name).template
+
+
+@lru_cache(maxsize=None)
+def _layout_segments(layout_name):
+    """(before title, between title and content, after content) of a layout."""
+    html = _compiled(layout_name).render(
+        Context({'title': _TITLE_MARKER, 'content': _CONTENT_MARKER}, autoescape=False)
+    )
+    head, rest = html.split(_TITLE_MARKER, 1)
+    middle, tail = rest.split(_CONTENT_MARKER, 1)
+    return head, middle, tail
+
+
+def _render_block(template, blocks, name, context, autoescape):
+    block = blocks.get(name)
+    if block is None:
+        return ''
+    context.autoescape = autoescape
+    with context.bind_template(template):
+        return block.nodelist.render(context)
+
+
+def _render(template, blocks, context):
+    context = Context(context)
+
+    subject = _render_block(template, blocks, 'subject', context, autoescape=False)
+    text = _render_block(template, blocks, 'text', context, autoescape=False)
+    html = _render_block(template, blocks, 'html', context, autoescape=True)
+
+    layout_name = _render_block(template, blocks, 'layout', context, autoescape=False).strip()
+    if layout_name:
+        title = _render_block(template, blocks, 'title', context, autoescape=False).strip()
+        head, middle, tail = _layout_segments(layout_name)
+        html = head + escape(title or 'LinkDeal') + middle + html + tail
+
+    return RenderedEmail(
+        subject=' '.join(subject.split()),
+        text=text.strip() + '\n',
+        html=html.strip(),
+    )
+
+
+def render_email(template_name, context):
+    """Render one email template; returns RenderedEmail(subject, text, html)."""
+    template = _compiled(template_name)
+    return _render(template, _blocks(template), context)
+
+
+def render_email_batch(template_name, contexts):
+    """Render one template for each context, looking the template up once."""
+    template = _compiled(template_name)
+    blocks = _blocks(template)
+    return [_render(template, blocks, context) for context in contexts]
+
+
+def send_templated_email(template_name, context, recipient_list, from_email=None):
+    """Render an email template and queue it in the outbox."""
+    email = render_email(template_name, context)
+    return queue_email(
+        subject=email.subject,
+        message=email.text,
+        recipient_list=recipient_list,
+        html_message=email.html,
+        from_email=from_email,
+    )
+
+
+def send_templated_batch(template_name, recipients, from_email=None):
+    """
+    Queue one email per (recipient_email, context) pair, rendered from the
+    same template and inserted in a single query.
+    """
+    recipients = list(recipients)
+    rendered = render_email_batch(template_name, [context for _, context in recipients])
+    return queue_emails(
+        {
+            'subject': email.subject,
+            'message': email.text,
+            'recipient_list': [recipient_email],
+            'html_message': email.html,
+            'from_email': from_email,
+        }
+        for (recipient_email, _), email in zip(recipients, rendered)
+    )
@@ -18,6 +18,16 @@ class ExternalServiceError(APIException):
     default_code = "external_service_error"
 
 
+class ConflictError(APIException):
+    """
+    Used when a write collides with existing state (e.g. a double booking
+    rejected by a database constraint).
+    """
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "The request conflicts with the current state of the resource."
+    default_code = "conflict"
+
+
 def custom_exception_handler(exc, context):
     """
     Enterprise-grade global exception handler.
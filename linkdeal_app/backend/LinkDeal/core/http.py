@@ -0,0 +1,191 @@
+"""
+Outbound HTTP client shared by the third-party integrations.
+
+Each integration (Auth0, Whereby, ...) calls its APIs through a named
+client, client('auth0'): one requests.Session per integration, shared by
+all threads of the process, so connections are pooled per host and kept
+alive across calls instead of paying a TCP+TLS handshake each time.
+
+Every request gets the client's default (connect, read) timeout unless the
+call passes its own. Idempotent requests (GET, HEAD, PUT, DELETE, OPTIONS)
+are retried on connection errors and on 429/502/503/504 answers, with
+exponential backoff and full jitter, waiting for Retry-After when given;
+POST and PATCH are never retried. After the last retry the final response
+is returned as is, so callers keep handling status codes themselves.
+
+Call counts, errors (exceptions and 5xx) and latencies are recorded per
+integration and process (metrics()); slow calls are logged.
+
+APIs announcing their rate limit (X-RateLimit-Remaining / X-RateLimit-Reset
+headers, as Auth0 does) are tracked too: bulk callers call throttle()
+before each request to wait for the window reset instead of getting 429s.
+"""
+import logging
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (3.05, 10)
+DEFAULT_RETRIES = 2
+DEFAULT_POOL_SIZE = 10
+RETRY_STATUSES = (429, 502, 503, 504)
+BACKOFF_FACTOR = 0.3
+SLOW_CALL_SECONDS = 2
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# throttle() waits once no more than this many calls are left in the window
+RATE_LIMIT_RESERVE = 2
+MAX_THROTTLE_SECONDS = 60
+
+
+class JitteredRetry(Retry):
+    """Retry whose backoff is drawn uniformly below the exponential delay."""
+
+    def get_backoff_time(self):
+        return random.uniform(0, super().get_backoff_time())
+
+
+class _Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, integration, seconds, error):
+        with self._lock:
+            stats = self._stats.setdefault(integration, {
+                'calls': 0,
+                'errors': 0,
+                'total_seconds': 0.0,
+                'max_seconds': 0.0,
+                'buckets': [0] * (len(LATENCY_BUCKETS) + 1),
+            })
+            stats['calls'] += 1
+            stats['errors'] += error
+            stats['total_seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            stats['buckets'][next(
+                (i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS)
+            )] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                integration: {
+                    'calls': stats['calls'],
+                    'errors': stats['errors'],
+                    'avg_ms': round(stats['total_seconds'] * 1000 / stats['calls'], 1),
+                    'max_ms': round(stats['max_seconds'] * 1000, 1),
+                    'latency_buckets': dict(zip(
+                        [f'le_{bound}s' for bound in LATENCY_BUCKETS] + ['inf'], stats['buckets']
+                    )),
+                }
+                for integration, stats in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+_metrics = _Metrics()
+
+
+class IntegrationSession(requests.Session):
+    """requests.Session with pooling, default timeout, retries and metrics."""
+
+    def __init__(self, name, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, pool_size=DEFAULT_POOL_SIZE):
+        super().__init__()
+        self.name = name
+        self.timeout = timeout
+        # (calls remaining, epoch second the window resets) from the last response
+        self.rate_limit = None
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_size,
+            max_retries=JitteredRetry(
+                total=retries,
+                backoff_factor=BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                raise_on_status=False,
+            ),
+        )
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+
+        started = time.monotonic()
+        try:
+            response = super().request(method, url, **kwargs)
+        except requests.RequestException:
+            _metrics.record(self.name, time.monotonic() - started, error=True)
+            raise
+
+        elapsed = time.monotonic() - started
+        _metrics.record(self.name, elapsed, error=response.status_code >= 500)
+        if elapsed >= SLOW_CALL_SECONDS:
+            logger.warning(f"Slow {self.name} call: {method} {response.url} took {elapsed:.2f}s")
+        self._track_rate_limit(response)
+        return response
+
+    def _track_rate_limit(self, response):
+        try:
+            remaining = int(response.headers['X-RateLimit-Remaining'])
+            reset = float(response.headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            if response.status_code != 429:
+                return
+            retry_after = response.headers.get('Retry-After', '')
+            remaining, reset = 0, time.time() + (float(retry_after) if retry_after.isdigit() else 1)
+        self.rate_limit = (remaining, reset)
+
+    def throttle(self):
+        """Wait for the rate limit window to reset when it is (nearly) used up."""
+        if self.rate_limit is None:
+            return
+        remaining, reset = self.rate_limit
+        if remaining > RATE_LIMIT_RESERVE:
+            return
+        wait = min(reset - time.time(), MAX_THROTTLE_SECONDS)
+        if wait > 0:
+            logger.info(f"{self.name} rate limit reached, waiting {wait:.1f}s")
+            time.sleep(wait)
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def client(name, **options):
+    """
+    The shared session of an integration, created on first use with options
+    (timeout, retries, pool_size) taken into account only then.
+    """
+    session = _clients.get(name)
+    if session is None:
+        with _clients_lock:
+            session = _clients.get(name)
+            if session is None:
+                session = _clients[name] = IntegrationSession(name, **options)
+    return session
+
+
+def metrics():
+    """Per-integration call metrics of this process."""
+    return _metrics.snapshot()
+
+
+def reset_metrics():
+    _metrics.reset()
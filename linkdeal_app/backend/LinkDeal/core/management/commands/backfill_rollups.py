@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.rollups import backfill
+
+
+class Command(BaseCommand):
+    help = "Rebuild the hourly/daily metric rollups (sessions, signups, payments, platform fees) from raw rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            help="Only rebuild buckets from this date on (YYYY-MM-DD). Defaults to the whole history."
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            try:
+                since = timezone.make_aware(datetime.strptime(options['since'], '%Y-%m-%d'))
+            except ValueError:
+                raise CommandError("Invalid --since date. Use YYYY-MM-DD.")
+
+        self.stdout.write(f"Rebuilding metric rollups{f' since {since.date()}' if since else ''}...")
+        written = backfill(since)
+        for metric, count in written.items():
+            self.stdout.write(f"  {metric}: {count} buckets")
+        self.stdout.write(self.style.SUCCESS("Metric rollups rebuilt."))
@@ -0,0 +1,31 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from core.scheduler import LEADER_CHECK_INTERVAL, SchedulerLeader
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the periodic jobs. Several instances can run at once: one leads "
+        "(PostgreSQL advisory lock) and the others stand by to take over."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check-interval',
+            type=int,
+            default=LEADER_CHECK_INTERVAL,
+            help=f"Seconds between leader lock attempts and checks (default {LEADER_CHECK_INTERVAL})."
+        )
+
+    def handle(self, *args, **options):
+        leader = SchedulerLeader(check_interval=options['check_interval'])
+        signal.signal(signal.SIGTERM, lambda *_: leader.stop())
+
+        self.stdout.write("Scheduler started, waiting for the leader lock...")
+        try:
+            leader.run()
+        except KeyboardInterrupt:
+            leader.stop()
+        self.stdout.write(self.style.SUCCESS("Scheduler stopped."))
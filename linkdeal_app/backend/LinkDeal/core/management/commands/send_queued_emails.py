@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import OutboundEmail
+from core.outbox import BATCH_SIZE, drain_outbox
+
+
+class Command(BaseCommand):
+    help = "Send the emails waiting in the outbox (normally done by the scheduler every few seconds)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retry-dead',
+            action='store_true',
+            help="Requeue dead-lettered emails before sending."
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Emails claimed per batch (default {BATCH_SIZE})."
+        )
+
+    def handle(self, *args, **options):
+        if options['retry_dead']:
+            requeued = OutboundEmail.objects.filter(status='dead').update(
+                status='pending',
+                attempts=0,
+                next_attempt_at=timezone.now(),
+            )
+            self.stdout.write(f"Requeued {requeued} dead emails.")
+
+        sent, failed = drain_outbox(batch_size=options['batch_size'])
+        self.stdout.write(f"{sent} sent, {failed} failed.")
+
+        dead = OutboundEmail.objects.filter(status='dead').count()
+        if dead:
+            self.stdout.write(self.style.WARNING(f"{dead} emails are dead-lettered (see OutboundEmail in the admin)."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Email outbox drained."))
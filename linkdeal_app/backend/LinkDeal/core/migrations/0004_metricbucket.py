@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_platformsettings_wallet_balance_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MetricBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(max_length=50)),
+                ('subject', models.CharField(blank=True, default='', help_text="'' for platform-wide buckets, 'mentor:<id>' or 'mentee:<id>' for a profile", max_length=64)),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=4)),
+                ('bucket_start', models.DateTimeField()),
+                ('count', models.BigIntegerField(default=0)),
+                ('total', models.DecimalField(decimal_places=2, default=0, help_text='Summed value (minutes for sessions, amounts for payments and fees)', max_digits=14)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('metric', 'subject', 'granularity', 'bucket_start'), name='metric_bucket_unique')],
+            },
+        ),
+    ]
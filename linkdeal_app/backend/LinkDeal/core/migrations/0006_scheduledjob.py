@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_outboundemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduledJob',
+            fields=[
+                ('id', models.CharField(max_length=191, primary_key=True, serialize=False)),
+                ('next_run_time', models.DateTimeField(blank=True, db_index=True, help_text='Null while paused', null=True)),
+                ('job_state', models.BinaryField()),
+            ],
+            options={
+                'ordering': ['next_run_time'],
+            },
+        ),
+    ]
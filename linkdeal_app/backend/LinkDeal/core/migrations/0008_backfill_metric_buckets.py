@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from core.rollups import backfill
+
+
+def backfill_metric_buckets(apps, schema_editor):
+    """
+    Build the buckets of the existing sessions, signups and payments: the
+    dashboard charts only read MetricBucket, and signals only record the
+    changes made after 0004_metricbucket.
+    """
+    backfill(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_pagination_indexes'),
+        ('billing', '0003_pagination_indexes'),
+        ('core', '0007_jobcheckpoint'),
+        ('scheduling', '0008_build_session_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_metric_buckets, migrations.RunPython.noop),
+    ]
@@ -64,3 +64,117 @@ class PlatformSettings(models.Model):
 
     def __str__(self):
         return f"Platform Settings (Fee: {self.platform_fee_percentage}%, Min Price: {self.currency}{self.min_session_price})"
+
+
+class MetricBucket(models.Model):
+    """
+    Hourly/daily rollup of a platform metric (sessions, signups, payments,
+    platform fees), optionally scoped to one mentor or mentee.
+    Maintained incrementally by core/rollups.py, built for the existing
+    history by migration 0008_backfill_metric_buckets; rebuilt with
+    `manage.py backfill_rollups`.
+    """
+    GRANULARITY_CHOICES = [
+        ('hour', 'Hour'),
+        ('day', 'Day'),
+    ]
+
+    metric = models.CharField(max_length=50)
+    subject = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        help_text="'' for platform-wide buckets, 'mentor:<id>' or 'mentee:<id>' for a profile"
+    )
+    granularity = models.CharField(max_length=4, choices=GRANULARITY_CHOICES)
+    bucket_start = models.DateTimeField()
+    count = models.BigIntegerField(default=0)
+    total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text="Summed value (minutes for sessions, amounts for payments and fees)"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['metric', 'subject', 'granularity', 'bucket_start'],
+                name='metric_bucket_unique',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.metric}[{self.subject or 'platform'}] {self.granularity} {self.bucket_start}: {self.count}"
+
+
+class OutboundEmail(models.Model):
+    """
+    Durable outbox of emails to send. Rows are written in the caller's
+    transaction by core.outbox.queue_email and sent in batches by
+    core.outbox.drain_outbox, with retries and a dead-letter state.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('dead', 'Dead'),
+    ]
+
+    subject = models.CharField(max_length=998)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=254)
+    recipients = models.JSONField(help_text="List of recipient addresses")
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(
+        help_text="When the email is next due (retry backoff, or lease expiry while sending)"
+    )
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # The worker's queue: emails due for a (re)try
+            models.Index(
+                fields=['next_attempt_at'],
+                name='outbound_email_due_idx',
+                condition=models.Q(status__in=['pending', 'sending']),
+            ),
+        ]
+
+    def __str__(self):
+        return f"OutboundEmail({self.subject} -> {', '.join(self.recipients)}: {self.status})"
+
+
+class ScheduledJob(models.Model):
+    """
+    Persistent APScheduler job (core.scheduler.DjangoJobStore): the pickled
+    job state, so interval jobs keep their next run time across restarts.
+    """
+    id = models.CharField(max_length=191, primary_key=True)
+    next_run_time = models.DateTimeField(null=True, blank=True, db_index=True, help_text="Null while paused")
+    job_state = models.BinaryField()
+
+    class Meta:
+        ordering = ['next_run_time']
+
+    def __str__(self):
+        return f"ScheduledJob({self.id} at {self.next_run_time})"
+
+
+class JobCheckpoint(models.Model):
+    """
+    Progress of a long-running maintenance command (core.bulk), so an
+    interrupted run resumes where it stopped. Deleted when the run completes.
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+    state = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"JobCheckpoint({self.name} at {self.updated_at})"
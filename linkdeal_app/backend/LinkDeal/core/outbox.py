@@ -0,0 +1,154 @@
+"""
+Outbound email queue.
+
+Email helpers call queue_email() instead of django.core.mail.send_mail:
+it only inserts an OutboundEmail row, in the caller's transaction, so
+requests never wait on SMTP and emails of rolled-back work are never sent.
+
+drain_outbox() (scheduler job every few seconds, or
+`manage.py send_queued_emails`) claims due rows with SKIP LOCKED, sends
+them over a single SMTP connection with send_messages(), and reschedules
+failures with exponential backoff; after MAX_ATTEMPTS an email is moved
+to the 'dead' state and left for inspection.
+
+Claimed rows are leased (status 'sending', next_attempt_at = now + LEASE)
+so a worker that dies mid-batch does not lose them: they become due again
+once the lease expires.
+"""
+import logging
+import smtplib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 6
+BACKOFF_BASE = 60  # Seconds before the first retry, doubled on each attempt
+BACKOFF_MAX = 60 * 60
+LEASE = timedelta(minutes=5)
+
+
+def queue_email(subject, message, recipient_list, html_message=None, from_email=None):
+    """Queue an email; same arguments as django.core.mail.send_mail."""
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=message,
+        html_body=html_message or '',
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=list(recipient_list),
+        next_attempt_at=timezone.now(),
+    )
+
+
+def queue_emails(messages):
+    """Queue many emails in one INSERT; each message holds queue_email's arguments."""
+    now = timezone.now()
+    return OutboundEmail.objects.bulk_create([
+        OutboundEmail(
+            subject=message['subject'],
+            body=message['message'],
+            html_body=message.get('html_message') or '',
+            from_email=message.get('from_email') or settings.DEFAULT_FROM_EMAIL,
+            recipients=list(message['recipient_list']),
+            next_attempt_at=now,
+        )
+        for message in messages
+    ])
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX))
+
+
+def _claim_batch(batch_size):
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True).filter(
+                status__in=['pending', 'sending'],
+                next_attempt_at__lte=now,
+            ).order_by('next_attempt_at')[:batch_size]
+        )
+        if emails:
+            OutboundEmail.objects.filter(id__in=[email.id for email in emails]).update(
+                status='sending',
+                next_attempt_at=now + LEASE,
+            )
+    return emails
+
+
+def _build_message(email, connection):
+    message = EmailMultiAlternatives(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email,
+        to=email.recipients,
+        connection=connection,
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, 'text/html')
+    return message
+
+
+def drain_outbox(batch_size=BATCH_SIZE, max_batches=None):
+    """
+    Send due emails, batch after batch, until none are due (or max_batches
+    were sent). Returns (sent, failed) counts.
+    """
+    sent = failed = batches = 0
+    connection = get_connection(fail_silently=False)
+    try:
+        while max_batches is None or batches < max_batches:
+            emails = _claim_batch(batch_size)
+            if not emails:
+                break
+            batches += 1
+
+            for email in emails:
+                email.attempts += 1
+                try:
+                    # Opened once and reused; reopened after a dropped connection
+                    connection.open()
+                    connection.send_messages([_build_message(email, connection)])
+                except Exception as e:
+                    failed += 1
+                    email.last_error = f"{type(e).__name__}: {e}"[:2000]
+                    if email.attempts >= MAX_ATTEMPTS:
+                        email.status = 'dead'
+                        logger.error(f"Email {email.id} to {email.recipients} dead after {email.attempts} attempts: {e}")
+                    else:
+                        email.status = 'pending'
+                        email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+                        logger.warning(f"Email {email.id} to {email.recipients} failed (attempt {email.attempts}): {e}")
+                    if isinstance(e, (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)):
+                        connection.close()
+                else:
+                    sent += 1
+                    email.status = 'sent'
+                    email.sent_at = timezone.now()
+                    email.last_error = ''
+
+            OutboundEmail.objects.bulk_update(
+                emails, ['status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at']
+            )
+    finally:
+        connection.close()
+
+    if sent or failed:
+        logger.info(f"Email outbox: {sent} sent, {failed} failed")
+    return sent, failed
+
+
+def drain_outbox_job():
+    """Scheduler entry point; one run never raises."""
+    try:
+        drain_outbox()
+    except Exception as e:
+        logger.error(f"Error draining the email outbox: {e}", exc_info=True)
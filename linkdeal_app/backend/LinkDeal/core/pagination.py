@@ -0,0 +1,142 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Pages are cut on a composite (sort key, id) key: the next page is
+"rows after the last one returned", e.g.
+
+    WHERE created_at <= :last AND (created_at < :last OR id < :last_id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :page_size + 1
+
+so every page costs one index range scan however deep the client pages,
+and rows inserted meanwhile never shift or repeat items. The sort key is
+the first ordering of the queryset (or the view's / model's default
+ordering) and must be a non-null field or annotation.
+
+Response bodies are unchanged (the serialized list, or the view's own
+envelope); the next page is advertised in a Link header, as
+`<...?cursor=...>; rel="next"`, and in X-Next-Cursor. Every response is
+paged (page_size rows unless ?page_size= asks for up to max_page_size);
+clients that need the whole list follow X-Next-Cursor (fetchAllPages in
+the frontend's services/api.ts).
+"""
+import base64
+import datetime
+import decimal
+import json
+import uuid
+
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+class KeysetPagination(BasePagination):
+    page_size = 50
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    # Used when neither the queryset nor its model define an ordering
+    ordering = '-created_at'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.next_cursor = None
+
+        key, descending = self.get_sort_key(queryset, view)
+        lookup = 'lt' if descending else 'gt'
+        prefix = '-' if descending else ''
+        queryset = queryset.order_by(f'{prefix}{key}', f'{prefix}pk')
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            value, pk = cursor
+            if key == 'pk':
+                queryset = queryset.filter(**{f'pk__{lookup}': pk})
+            else:
+                # The first condition alone is a plain index range condition
+                queryset = queryset.filter(
+                    Q(**{f'{key}__{lookup}e': value}),
+                    Q(**{f'{key}__{lookup}': value}) | Q(**{f'pk__{lookup}': pk}),
+                )
+
+        page_size = self.get_page_size(request)
+        rows = list(queryset[:page_size + 1])
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            self.next_cursor = self.encode_cursor(self.key_value(last, key), last.pk)
+        return rows
+
+    def get_sort_key(self, queryset, view):
+        """(field or annotation name, descending) the page is cut on."""
+        orderings = (
+            list(queryset.query.order_by)
+            or list(getattr(view, 'ordering', None) or [])
+            or list(queryset.model._meta.ordering)
+            or [self.ordering]
+        )
+        first = orderings[0]
+        if not isinstance(first, str):
+            first = self.ordering
+        key = first.lstrip('-')
+        return ('pk' if key == 'id' else key), first.startswith('-')
+
+    @staticmethod
+    def key_value(obj, key):
+        value = obj
+        for part in key.split('__'):
+            value = getattr(value, part)
+        return value
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def encode_cursor(self, value, pk):
+        payload = json.dumps([_encode_value(value), str(pk)], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            value, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (TypeError, ValueError):
+            raise ValidationError({self.cursor_query_param: 'Invalid cursor.'})
+        return value, pk
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def add_pagination_headers(self, response):
+        """Advertise the next page on any response (for views with their own envelope)."""
+        next_link = self.get_next_link()
+        if next_link:
+            response['Link'] = f'<{next_link}>; rel="next"'
+            response['X-Next-Cursor'] = self.next_cursor
+        return response
+
+    def get_paginated_response(self, data):
+        return self.add_pagination_headers(Response(data))
+
+    def get_paginated_response_schema(self, schema):
+        return schema
@@ -0,0 +1,279 @@
+"""
+Time-bucketed rollups for the dashboard charts.
+
+Each tracked event adds (count, total) to an hourly and a daily
+MetricBucket, platform-wide and, for sessions, for the mentor and the
+mentee involved:
+
+- sessions:       by scheduled_at, total = duration in minutes
+- mentor_signups/
+  mentee_signups: by the user's created_at, for existing profiles
+- payments:       completed payments by completed_at, total = amount
+- platform_fees:  completed payments by completed_at, total = platform_fee
+
+Buckets are updated from model signals with one INSERT ... ON CONFLICT DO
+UPDATE per change, so charts read a single range of bucket rows instead of
+grouping raw history. Migration 0008_backfill_metric_buckets builds them
+for the existing history and `manage.py backfill_rollups` rebuilds them.
+"""
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.apps import apps as global_apps
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDay, TruncHour, TruncMonth, TruncYear
+from django.utils import timezone
+
+from core.models import MetricBucket
+
+GRANULARITIES = ('hour', 'day')
+
+TRUNC_FUNCTIONS = {
+    'hour': TruncHour,
+    'day': TruncDay,
+    'month': TruncMonth,
+    'year': TruncYear,
+}
+
+
+def bucket_start(moment, granularity):
+    """Start of the hour/day (current timezone) containing moment."""
+    local = timezone.localtime(moment)
+    if granularity == 'hour':
+        return local.replace(minute=0, second=0, microsecond=0)
+    return local.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def profile_subject(role, profile_id):
+    return f'{role}:{profile_id}'
+
+
+# -------------------------------------------------------------------
+# Incremental maintenance
+# -------------------------------------------------------------------
+
+def apply_bucket_deltas(deltas):
+    """
+    Add deltas to their buckets in one upsert.
+    deltas maps (metric, subject, moment) to (count, total); each entry is
+    applied to the hourly and daily bucket containing moment.
+    """
+    rows = defaultdict(lambda: [0, Decimal('0')])
+    for (metric, subject, moment), (count, total) in deltas.items():
+        for granularity in GRANULARITIES:
+            row = rows[(metric, subject, granularity, bucket_start(moment, granularity))]
+            row[0] += count
+            row[1] += Decimal(str(total))
+
+    values = [(*key, count, total) for key, (count, total) in rows.items() if count or total]
+    if not values:
+        return
+
+    table = connection.ops.quote_name(MetricBucket._meta.db_table)
+    placeholders = ', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(values))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (metric, subject, granularity, bucket_start, count, total)
+            VALUES {placeholders}
+            ON CONFLICT (metric, subject, granularity, bucket_start) DO UPDATE
+            SET count = {table}.count + EXCLUDED.count,
+                total = {table}.total + EXCLUDED.total
+            """,
+            [value for row in values for value in row]
+        )
+
+
+def _record_change(old_events, new_events):
+    """Apply the difference between two lists of ((metric, subject, moment), (count, total))."""
+    deltas = defaultdict(lambda: [0, Decimal('0')])
+    for events, sign in ((old_events, -1), (new_events, 1)):
+        for key, (count, total) in events:
+            deltas[key][0] += sign * count
+            deltas[key][1] += sign * Decimal(str(total or 0))
+    apply_bucket_deltas({key: tuple(value) for key, value in deltas.items()})
+
+
+def session_events(values):
+    """Bucket events of a session, from scheduling.stats.SESSION_FIELDS values."""
+    if not values:
+        return []
+    return [
+        (('sessions', subject, values['scheduled_at']), (1, values['duration_minutes']))
+        for subject in (
+            '',
+            profile_subject('mentor', values['mentor_id']),
+            profile_subject('mentee', values['mentee_id']),
+        )
+    ]
+
+
+def record_session_change(old, new):
+    _record_change(session_events(old), session_events(new))
+
+
+def payment_events(values):
+    """Bucket events of a payment, from scheduling.stats.PAYMENT_FIELDS values."""
+    if not values or values['status'] != 'completed' or not values['completed_at']:
+        return []
+    moment = values['completed_at']
+    return [
+        (('payments', '', moment), (1, values['amount'])),
+        (('platform_fees', '', moment), (1, values['platform_fee'])),
+    ]
+
+
+def record_payment_change(old, new):
+    _record_change(payment_events(old), payment_events(new))
+
+
+def record_signup(role, created_at, removed=False):
+    """A mentor/mentee profile was created (or removed) for a user created at created_at."""
+    count = -1 if removed else 1
+    apply_bucket_deltas({(f'{role}_signups', '', created_at): (count, 0)})
+
+
+# -------------------------------------------------------------------
+# Reads
+# -------------------------------------------------------------------
+
+def read_buckets(metrics, start, end, granularity='day', group_by=None, subject=''):
+    """
+    {(metric, period_start): {'count', 'total'}} for buckets in [start, end).
+    group_by ('day', 'month', 'year') regroups daily buckets in SQL; one
+    range scan over the bucket table either way.
+    """
+    queryset = MetricBucket.objects.filter(
+        metric__in=metrics,
+        subject=subject,
+        granularity=granularity,
+        bucket_start__gte=start,
+        bucket_start__lt=end,
+    )
+    if group_by and group_by != granularity:
+        queryset = queryset.annotate(period=TRUNC_FUNCTIONS[group_by]('bucket_start'))
+        period_field = 'period'
+    else:
+        period_field = 'bucket_start'
+
+    rows = queryset.values('metric', period_field).annotate(
+        count_sum=Sum('count'),
+        total_sum=Sum('total'),
+    ).order_by()
+
+    return {
+        (row['metric'], timezone.localtime(row[period_field])): {
+            'count': row['count_sum'] or 0,
+            'total': row['total_sum'] or Decimal('0'),
+        }
+        for row in rows
+    }
+
+
+def period_starts(start, count, step):
+    """count consecutive period starts from start; step is 'day', 'month' or 'year'."""
+    starts = []
+    current = start
+    for _ in range(count):
+        starts.append(current)
+        if step == 'day':
+            current = current + timedelta(days=1)
+        elif step == 'month':
+            current = current.replace(year=current.year + current.month // 12, month=current.month % 12 + 1)
+        else:
+            current = current.replace(year=current.year + 1)
+    return starts
+
+
+# -------------------------------------------------------------------
+# Backfill
+# -------------------------------------------------------------------
+
+def _grouped_rows(bucket_model, metric, queryset, moment_field, subject_field=None, total_field=None):
+    """bucket_model rows for metric, grouping queryset per subject and bucket."""
+    aggregates = {'bucket_count': Count('pk')}
+    if total_field:
+        aggregates['bucket_total'] = Sum(total_field)
+
+    buckets = []
+    for granularity in GRANULARITIES:
+        grouped = queryset.order_by().annotate(
+            bucket=TRUNC_FUNCTIONS[granularity](moment_field)
+        )
+        group_fields = ['bucket'] + ([subject_field] if subject_field else [])
+        for row in grouped.values(*group_fields).annotate(**aggregates):
+            subject = ''
+            if subject_field:
+                subject = profile_subject(subject_field.removesuffix('_id'), row[subject_field])
+            buckets.append(bucket_model(
+                metric=metric,
+                subject=subject,
+                granularity=granularity,
+                bucket_start=row['bucket'],
+                count=row['bucket_count'],
+                total=row.get('bucket_total') or 0,
+            ))
+    return buckets
+
+
+def backfill(since=None, apps=global_apps):
+    """
+    Rebuild every bucket starting at or after since (all of them if None)
+    from raw rows. The bucket table is locked meanwhile so signal upserts
+    wait for the rebuilt rows instead of being overwritten. apps is the
+    model registry (a migration's historical models when run from one).
+    Returns {metric: number of bucket rows written}.
+    """
+    MetricBucket = apps.get_model('core', 'MetricBucket')
+    MentorProfile = apps.get_model('accounts', 'MentorProfile')
+    MenteeProfile = apps.get_model('accounts', 'MenteeProfile')
+    Payment = apps.get_model('billing', 'Payment')
+    Session = apps.get_model('scheduling', 'Session')
+
+    if since is not None:
+        since = bucket_start(since, 'day')
+
+    def after(field):
+        return {f'{field}__gte': since} if since is not None else {}
+
+    sessions = Session.objects.filter(**after('scheduled_at'))
+    payments = Payment.objects.filter(status='completed', completed_at__isnull=False, **after('completed_at'))
+
+    with transaction.atomic():
+        table = connection.ops.quote_name(MetricBucket._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(f'LOCK TABLE {table} IN EXCLUSIVE MODE')
+
+        stale = MetricBucket.objects.all()
+        if since is not None:
+            stale = stale.filter(bucket_start__gte=since)
+        stale.delete()
+
+        rows = {
+            'sessions': (
+                _grouped_rows(MetricBucket, 'sessions', sessions, 'scheduled_at', total_field='duration_minutes')
+                + _grouped_rows(MetricBucket, 'sessions', sessions, 'scheduled_at', 'mentor_id', 'duration_minutes')
+                + _grouped_rows(MetricBucket, 'sessions', sessions, 'scheduled_at', 'mentee_id', 'duration_minutes')
+            ),
+            'mentor_signups': _grouped_rows(
+                MetricBucket,
+                'mentor_signups',
+                MentorProfile.objects.filter(**after('user__created_at')),
+                'user__created_at'
+            ),
+            'mentee_signups': _grouped_rows(
+                MetricBucket,
+                'mentee_signups',
+                MenteeProfile.objects.filter(**after('user__created_at')),
+                'user__created_at'
+            ),
+            'payments': _grouped_rows(MetricBucket, 'payments', payments, 'completed_at', total_field='amount'),
+            'platform_fees': _grouped_rows(MetricBucket, 'platform_fees', payments, 'completed_at', total_field='platform_fee'),
+        }
+        for buckets in rows.values():
+            MetricBucket.objects.bulk_create(buckets, batch_size=1000)
+
+    return {metric: len(buckets) for metric, buckets in rows.items()}
+
@@ -0,0 +1,250 @@
+"""
+Periodic job runtime.
+
+Jobs are registered by the apps (JOB_REGISTRIES) and run by a single
+leader per cluster: every candidate process tries to take a PostgreSQL
+session-level advisory lock, and only the holder starts the APScheduler
+BackgroundScheduler. Standbys retry every LEADER_CHECK_INTERVAL seconds,
+so a new leader takes over shortly after the previous one dies (its lock
+is released with its database connection).
+
+Candidates are `manage.py run_scheduler` (production: a process of its
+own, so jobs never run inside request-serving workers), or a web process
+when SCHEDULER_AUTOSTART is set or under `runserver`.
+
+Jobs are kept in the database (DjangoJobStore), so interval jobs keep
+their schedule across restarts and leader changes; runs missed while no
+leader was up are coalesced into one and dropped after their
+misfire_grace_time.
+"""
+import logging
+import pickle
+import threading
+from datetime import timezone as dt_timezone
+
+from apscheduler.job import Job
+from apscheduler.jobstores.base import BaseJobStore, ConflictingIdError, JobLookupError
+from apscheduler.schedulers.background import BackgroundScheduler
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, close_old_connections, connection, connections
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Functions called with the scheduler to add each app's jobs
+JOB_REGISTRIES = [
+    'notifications.scheduler.register_jobs',
+    'accounts.scheduler.register_jobs',
+]
+
+# Arbitrary key of the scheduler leader advisory lock
+LEADER_LOCK_KEY = 7_331_001
+LEADER_CHECK_INTERVAL = 15  # Seconds
+
+JOB_DEFAULTS = {
+    'coalesce': True,
+    'max_instances': 1,
+    'misfire_grace_time': 60,
+}
+
+
+class DjangoJobStore(BaseJobStore):
+    """APScheduler job store backed by core.ScheduledJob."""
+
+    def __init__(self, pickle_protocol=pickle.HIGHEST_PROTOCOL):
+        super().__init__()
+        self.pickle_protocol = pickle_protocol
+
+    @property
+    def _jobs(self):
+        from core.models import ScheduledJob
+
+        # The scheduler thread has no request cycle to drop broken or
+        # expired connections
+        if not connection.in_atomic_block:
+            close_old_connections()
+        return ScheduledJob.objects
+
+    def lookup_job(self, job_id):
+        row = self._jobs.filter(id=job_id).values_list('job_state', flat=True).first()
+        return self._reconstitute_job(row) if row is not None else None
+
+    def get_due_jobs(self, now):
+        return self._get_jobs(next_run_time__lte=now)
+
+    def get_next_run_time(self):
+        return (
+            self._jobs.filter(next_run_time__isnull=False)
+            .order_by('next_run_time')
+            .values_list('next_run_time', flat=True)
+            .first()
+        )
+
+    def get_all_jobs(self):
+        jobs = self._get_jobs()
+        self._fix_paused_jobs_sorting(jobs)
+        return jobs
+
+    def add_job(self, job):
+        try:
+            self._jobs.create(id=job.id, next_run_time=job.next_run_time, job_state=self._dump(job))
+        except IntegrityError:
+            raise ConflictingIdError(job.id)
+
+    def update_job(self, job):
+        updated = self._jobs.filter(id=job.id).update(next_run_time=job.next_run_time, job_state=self._dump(job))
+        if not updated:
+            raise JobLookupError(job.id)
+
+    def remove_job(self, job_id):
+        deleted, _ = self._jobs.filter(id=job_id).delete()
+        if not deleted:
+            raise JobLookupError(job_id)
+
+    def remove_all_jobs(self):
+        self._jobs.all().delete()
+
+    def _dump(self, job):
+        return pickle.dumps(job.__getstate__(), self.pickle_protocol)
+
+    def _reconstitute_job(self, job_state):
+        job_state = pickle.loads(job_state)
+        job_state['jobstore'] = self
+        job = Job.__new__(Job)
+        job.__setstate__(job_state)
+        job._scheduler = self._scheduler
+        job._jobstore_alias = self._alias
+        return job
+
+    def _get_jobs(self, **filters):
+        jobs = []
+        failed = []
+        for job_id, job_state in self._jobs.filter(**filters).order_by('next_run_time').values_list('id', 'job_state'):
+            try:
+                jobs.append(self._reconstitute_job(job_state))
+            except Exception:
+                # Typically a job whose function was renamed or removed
+                logger.exception(f"Unable to restore job {job_id}; removing it")
+                failed.append(job_id)
+        if failed:
+            self._jobs.filter(id__in=failed).delete()
+        return jobs
+
+
+def add_job(scheduler, func, trigger, id, **options):
+    """
+    Register a periodic job, keeping the stored schedule when the job is
+    unchanged: re-adding it would restart its interval on every start.
+    """
+    job = scheduler.get_job(id)
+    if job is not None and job.func_ref == f'{func.__module__}:{func.__qualname__}' and str(job.trigger) == str(trigger):
+        scheduler.modify_job(id, **options)
+    else:
+        scheduler.add_job(func, trigger=trigger, id=id, replace_existing=True, **options)
+    return id
+
+
+def build_scheduler():
+    """A started scheduler running every registered job."""
+    scheduler = BackgroundScheduler(
+        jobstores={'default': DjangoJobStore()},
+        job_defaults=JOB_DEFAULTS,
+        timezone=dt_timezone.utc,
+    )
+    # Paused until the jobs are registered: the job store is only usable once started
+    scheduler.start(paused=True)
+
+    try:
+        registered = set()
+        for path in JOB_REGISTRIES:
+            registered.update(import_string(path)(scheduler))
+        for job in scheduler.get_jobs():
+            if job.id not in registered:
+                logger.info(f"Removing job {job.id}, no longer registered")
+                job.remove()
+    except Exception:
+        scheduler.shutdown(wait=False)
+        raise
+
+    scheduler.resume()
+    return scheduler
+
+
+class SchedulerLeader:
+    """
+    Runs the scheduler while this process holds the leader lock.
+    run() blocks until stop() is called.
+    """
+
+    def __init__(self, check_interval=LEADER_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._stopped = threading.Event()
+        self._lock_connection = None
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        while not self._stopped.is_set():
+            # A connection of its own, out of reach of close_old_connections():
+            # the lock lives exactly as long as this connection
+            self._lock_connection = connections.create_connection(DEFAULT_DB_ALIAS)
+            try:
+                if self._acquire():
+                    self._lead()
+            except Exception as e:
+                logger.error(f"Scheduler leader election failed: {e}", exc_info=True)
+            finally:
+                # Releases the lock if it was held
+                self._lock_connection.close()
+            self._stopped.wait(self.check_interval)
+
+    def _acquire(self):
+        with self._lock_connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [LEADER_LOCK_KEY])
+            return cursor.fetchone()[0]
+
+    def _holds_lock(self):
+        # False too when the connection was dropped (and the lock with it)
+        try:
+            with self._lock_connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT EXISTS (
+                        SELECT 1 FROM pg_locks
+                        WHERE locktype = 'advisory' AND pid = pg_backend_pid()
+                          AND classid = 0 AND objid = %s AND objsubid = 1
+                    )
+                    """,
+                    [LEADER_LOCK_KEY]
+                )
+                return cursor.fetchone()[0]
+        except Exception as e:
+            logger.warning(f"Scheduler leader lock check failed: {e}")
+            return False
+
+    def _lead(self):
+        logger.info("Scheduler: this process is the leader, starting jobs")
+        scheduler = build_scheduler()
+        try:
+            while not self._stopped.wait(self.check_interval):
+                if not self._holds_lock():
+                    logger.warning("Scheduler: leader lock lost, stopping jobs")
+                    break
+        finally:
+            scheduler.shutdown(wait=False)
+
+
+_leader_thread = None
+
+
+def start_in_background():
+    """Run a scheduler leader candidate in a daemon thread of this process."""
+    global _leader_thread
+
+    if _leader_thread is not None:
+        logger.warning("Scheduler already running")
+        return
+
+    leader = SchedulerLeader()
+    _leader_thread = threading.Thread(target=leader.run, name='scheduler-leader', daemon=True)
+    _leader_thread.start()
@@ -1,3 +1,314 @@
-from django.test import TestCase
+import time
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import AppUser
+from core import dashboard, http
+from core.bulk import run_concurrently
+from core.authentication import Auth0User
+from core.models import OutboundEmail
+from core.pagination import KeysetPagination
+from notifications.models import Notification
+from notifications.views import NotificationListView
+from scheduling.fake_whereby import FakeWherebyServer
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class DashboardStatsCacheTestCase(SimpleTestCase):
+    """Stale-while-revalidate behaviour of the admin dashboard KPIs."""
+
+    STATS = dict.fromkeys(dashboard.KPI_FIELDS, 0)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_miss_computes_synchronously(self):
+        with mock.patch.object(dashboard, 'compute_dashboard_stats', return_value=self.STATS) as compute:
+            self.assertEqual(dashboard.get_dashboard_stats(), self.STATS)
+            self.assertEqual(dashboard.get_dashboard_stats(), self.STATS)
+        compute.assert_called_once()
+
+    def test_stale_entry_is_served_and_refreshed_once(self):
+        cache.set(dashboard.CACHE_KEY, {
+            'stats': self.STATS,
+            'computed_at': time.time() - dashboard.FRESH_FOR - 1,
+        })
+        with mock.patch.object(dashboard, 'compute_dashboard_stats') as compute, \
+                mock.patch.object(dashboard, '_refresh_in_background') as refresh:
+            self.assertEqual(dashboard.get_dashboard_stats(), self.STATS)
+            self.assertEqual(dashboard.get_dashboard_stats(), self.STATS)
+        compute.assert_not_called()
+        refresh.assert_called_once()
+
+    def test_format_amount(self):
+        self.assertEqual(dashboard.format_amount(Decimal('950.5'), '$'), '$950.50')
+        self.assertEqual(dashboard.format_amount(Decimal('950.5'), '€', decimals=0), '€950')
+        self.assertEqual(dashboard.format_amount(Decimal('1250'), '$'), '$1.2K')
+
+
+class IntegrationSessionTestCase(SimpleTestCase):
+    """Retries and metrics of the shared outbound HTTP client."""
+
+    def setUp(self):
+        self.server = FakeWherebyServer().start()
+        self.addCleanup(self.server.stop)
+        http.reset_metrics()
+        self.addCleanup(http.reset_metrics)
+        self.session = http.IntegrationSession('test', retries=2)
+        self.addCleanup(self.session.close)
+
+    def test_idempotent_calls_are_retried(self):
+        self.server.status = 503
+        response = self.session.get(f'{self.server.url}/meetings/m1')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.server.requests), 3)
+
+        # POST is not idempotent: a single attempt
+        self.session.post(f'{self.server.url}/meetings', json={})
+        self.assertEqual(len(self.server.requests), 4)
+
+        stats = http.metrics()['test']
+        self.assertEqual((stats['calls'], stats['errors']), (2, 2))
+
+    def test_metrics(self):
+        self.session.post(f'{self.server.url}/meetings', json={})
+        self.session.get(f'{self.server.url}/meetings/unknown')
+        with mock.patch.object(self.session, 'timeout', (0.5, 0.1)):
+            self.server.delay = 0.5
+            with self.assertRaises(http.requests.Timeout):
+                self.session.post(f'{self.server.url}/meetings', json={})
+
+        stats = http.metrics()['test']
+        # A 404 is an answer, not an integration error
+        self.assertEqual((stats['calls'], stats['errors']), (3, 1))
+        self.assertEqual(sum(stats['latency_buckets'].values()), 3)
+
+
+class BulkCallsTestCase(SimpleTestCase):
+    """Bounded pool and rate limit throttling of the bulk maintenance commands."""
+
+    def test_run_concurrently(self):
+        def check(n):
+            if n == 3:
+                raise ValueError(n)
+            return n * 2
+
+        results = run_concurrently(check, range(5), workers=2)
+        self.assertEqual([(item, result) for item, result, _ in results], [(0, 0), (1, 2), (2, 4), (3, None), (4, 8)])
+        self.assertIsInstance(results[3][2], ValueError)
+
+    def test_throttle_waits_for_rate_limit_reset(self):
+        session = http.IntegrationSession('test')
+        self.addCleanup(session.close)
+        response = http.requests.Response()
+        response.status_code = 200
+        response.headers['X-RateLimit-Remaining'] = '1'
+        response.headers['X-RateLimit-Reset'] = str(time.time() + 5)
+        session._track_rate_limit(response)
+
+        with mock.patch.object(http.time, 'sleep') as sleep:
+            session.throttle()
+            self.assertAlmostEqual(sleep.call_args.args[0], 5, delta=1)
+
+            session.rate_limit = (50, time.time() + 5)
+            session.throttle()
+            self.assertEqual(sleep.call_count, 1)
+
+
+class KeysetCursorTestCase(SimpleTestCase):
+    """Cursor encoding and page size handling of KeysetPagination."""
+
+    def _request(self, params):
+        return Request(APIRequestFactory().get('/', params))
+
+    def test_cursor_round_trip(self):
+        paginator = KeysetPagination()
+        moment = timezone.now()
+        cursor = paginator.encode_cursor(moment, 'a1b2')
+        self.assertEqual(
+            paginator.decode_cursor(self._request({'cursor': cursor})),
+            (moment.isoformat(), 'a1b2')
+        )
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValidationError):
+            KeysetPagination().decode_cursor(self._request({'cursor': 'not-a-cursor'}))
+
+    def test_page_size_is_capped(self):
+        paginator = KeysetPagination()
+        self.assertEqual(paginator.get_page_size(self._request({})), 50)
+        self.assertEqual(paginator.get_page_size(self._request({'page_size': '10'})), 10)
+        self.assertEqual(paginator.get_page_size(self._request({'page_size': '10000'})), 100)
+
+
+class KeysetPaginationTestCase(TestCase):
+    """Paging through a list walks every row exactly once, even across timestamp ties."""
+
+    def setUp(self):
+        self.user = AppUser.objects.create(email='mentee@test.com', role='mentee', auth0_id='auth0|mentee')
+        Notification.objects.bulk_create([
+            Notification(recipient=self.user, title=f'Notification {i}', message='Hello')
+            for i in range(25)
+        ])
+        # Ten rows share one timestamp, so only the id tiebreaker separates them
+        moment = timezone.now()
+        ids = Notification.objects.values_list('id', flat=True)[:10]
+        Notification.objects.filter(id__in=list(ids)).update(created_at=moment)
+
+    def _page(self, params):
+        ns = getattr(settings, 'AUTH0_CUSTOM_NAMESPACE', 'https://linkdeal.com/claims/')
+        request = APIRequestFactory().get('/notifications/', params)
+        force_authenticate(request, user=Auth0User({
+            'sub': self.user.auth0_id,
+            'email': self.user.email,
+            'email_verified': True,
+            f'{ns}roles': ['mentee'],
+        }))
+        response = NotificationListView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_pages_cover_every_row_once(self):
+        seen = []
+        params = {'page_size': 4}
+        while True:
+            response = self._page(params)
+            seen.extend(item['id'] for item in response.data)
+            if 'X-Next-Cursor' not in response:
+                break
+            self.assertIn('rel="next"', response['Link'])
+            params = {'page_size': 4, 'cursor': response['X-Next-Cursor']}
+
+        expected = [
+            str(pk) for pk in
+            Notification.objects.order_by('-created_at', '-id').values_list('id', flat=True)
+        ]
+        self.assertEqual(seen, expected)
+
+    def test_pages_without_paging_parameters(self):
+        with mock.patch.object(KeysetPagination, 'page_size', 10):
+            response = self._page({})
+        self.assertEqual(len(response.data), 10)
+        self.assertIn('X-Next-Cursor', response)
+
+
+class EmailOutboxTestCase(TestCase):
+    """Queued emails are sent by the worker, retried with backoff, then dead-lettered."""
+
+    def test_queue_and_drain(self):
+        from django.core import mail
+        from core.outbox import drain_outbox, queue_email
+
+        queue_email('Hello', 'Plain body', ['a@test.com'], html_message='<p>Hi</p>')
+        queue_email('Second', 'Plain body', ['b@test.com'])
+        self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(drain_outbox(), (2, 0))
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].alternatives[0][1], 'text/html')
+        self.assertFalse(OutboundEmail.objects.exclude(status='sent').exists())
+
+        # Nothing left to send
+        self.assertEqual(drain_outbox(), (0, 0))
+
+    def test_failures_back_off_then_dead_letter(self):
+        from core import outbox
+
+        email = outbox.queue_email('Hello', 'Body', ['a@test.com'])
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=OSError('boom')):
+            self.assertEqual(outbox.drain_outbox(), (0, 1))
+            email.refresh_from_db()
+            self.assertEqual((email.status, email.attempts), ('pending', 1))
+            self.assertGreater(email.next_attempt_at, timezone.now())
+
+            for _ in range(outbox.MAX_ATTEMPTS - 1):
+                OutboundEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+                outbox.drain_outbox()
+
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), ('dead', outbox.MAX_ATTEMPTS))
+        self.assertIn('boom', email.last_error)
+
+
+class EmailTemplateTestCase(SimpleTestCase):
+    """Emails render subject, text and HTML from a single template file."""
+
+    def test_render_wraps_html_in_layout(self):
+        from core.emails import render_email
+
+        email = render_email('billing/emails/payment_confirmation.html', {
+            'mentee_name': 'Ana <Admin>', 'amount': '49.00', 'currency': 'EUR', 'reference': 'REF-1',
+        })
+
+        self.assertEqual(email.subject, '✅ Payment Successful - LinkDeal')
+        self.assertIn('Hello Ana <Admin>,', email.text)
+        self.assertIn('Reference: REF-1', email.text)
+        self.assertTrue(email.html.startswith('<!DOCTYPE html>'))
+        self.assertIn('<title>Payment Confirmation</title>', email.html)
+        self.assertIn('Ana &lt;Admin&gt;', email.html)
+        self.assertIn('Connecting Mentors and Mentees Worldwide', email.html)
+
+    def test_batch_renders_each_context(self):
+        from core.emails import render_email, render_email_batch
+
+        contexts = [
+            {'user_name': 'Ana', 'user_type_display': 'Mentor', 'ban_reason': 'Spam'},
+            {'user_name': 'Bob', 'user_type_display': 'Mentee', 'ban_reason': None},
+        ]
+        emails = render_email_batch('accounts/emails/status_banned.html', contexts)
+
+        self.assertEqual(emails, [render_email('accounts/emails/status_banned.html', c) for c in contexts])
+        self.assertIn('Reason: Spam', emails[0].text)
+        self.assertNotIn('Reason:', emails[1].text)
+        self.assertIn('Your mentee account', emails[1].text)
+
+
+class DjangoJobStoreTestCase(TestCase):
+    """Scheduler jobs are stored in the database and keep their schedule when re-registered."""
+
+    def setUp(self):
+        from datetime import timezone as dt_timezone
+        from apscheduler.schedulers.base import BaseScheduler
+        from core.scheduler import DjangoJobStore
+
+        class ThreadlessScheduler(BaseScheduler):
+            # No background thread touching the test database
+            def wakeup(self):
+                pass
+
+            def shutdown(self, wait=True):
+                super().shutdown(wait)
+
+        self.scheduler = ThreadlessScheduler(jobstores={'default': DjangoJobStore()}, timezone=dt_timezone.utc)
+        self.scheduler.start(paused=True)
+        self.addCleanup(self.scheduler.shutdown, wait=False)
+
+    def test_register_keeps_schedule(self):
+        from apscheduler.triggers.interval import IntervalTrigger
+        from core.models import ScheduledJob
+        from core.outbox import drain_outbox_job
+        from core.scheduler import add_job
+
+        add_job(self.scheduler, drain_outbox_job, IntervalTrigger(minutes=5), id='outbox', name='Outbox')
+        stored = ScheduledJob.objects.get(id='outbox').next_run_time
+        self.assertEqual(self.scheduler.get_job('outbox').next_run_time, stored)
+
+        # Unchanged job: options are updated, the next run time is kept
+        add_job(self.scheduler, drain_outbox_job, IntervalTrigger(minutes=5), id='outbox', name='Email outbox')
+        job = self.scheduler.get_job('outbox')
+        self.assertEqual((job.name, job.next_run_time), ('Email outbox', stored))
+
+        # New trigger: the job is replaced
+        add_job(self.scheduler, drain_outbox_job, IntervalTrigger(minutes=1), id='outbox')
+        self.assertLess(ScheduledJob.objects.get(id='outbox').next_run_time, stored)
+
+        self.scheduler.remove_job('outbox')
+        self.assertFalse(ScheduledJob.objects.exists())
@@ -0,0 +1,42 @@
+"""
+Old/new value tracking for signal-driven denormalizations.
+
+Counters maintained from model signals (session stats, metric rollups) need
+both the stored and the new values of a row to compute what a save changed.
+pre_save receivers call remember_state(); post_save receivers pick the
+stored values up again with take_previous_state().
+"""
+
+# Returned by take_previous_state() when the save touched no tracked field
+UNTRACKED = object()
+
+
+def _field_name(name):
+    return name[:-3] if name.endswith('_id') else name
+
+
+def remember_state(instance, fields, update_fields=None):
+    """
+    Keep the stored values of fields on the instance: None for a new row,
+    nothing when update_fields shows none of them can change.
+    """
+    if instance._state.adding:
+        instance._previous_state = None
+    elif update_fields is not None and not (
+        {_field_name(f) for f in fields} & {_field_name(f) for f in update_fields}
+    ):
+        instance.__dict__.pop('_previous_state', None)
+    else:
+        instance._previous_state = type(instance)._default_manager.filter(
+            pk=instance.pk
+        ).values(*fields).first()
+
+
+def take_previous_state(instance):
+    """Values stored by remember_state (None for a new row), or UNTRACKED."""
+    return instance.__dict__.pop('_previous_state', UNTRACKED)
+
+
+def current_state(instance, fields):
+    """Current values of fields on the instance, in remember_state's format."""
+    return {field: getattr(instance, field) for field in fields}
@@ -1,8 +1,11 @@
 from django.urls import path
-from core.views import PlatformSettingsView, AdminDashboardStatsView, AdminDashboardChartsView
+from core.views import (
+    PlatformSettingsView, AdminDashboardStatsView, AdminDashboardChartsView, AdminIntegrationMetricsView,
+)
 
 urlpatterns = [
     path('settings/platform/', PlatformSettingsView.as_view(), name='platform-settings'),
     path('admin/dashboard/stats/', AdminDashboardStatsView.as_view(), name='admin-dashboard-stats'),
     path('admin/dashboard/charts/', AdminDashboardChartsView.as_view(), name='admin-dashboard-charts'),
+    path('admin/integrations/metrics/', AdminIntegrationMetricsView.as_view(), name='admin-integration-metrics'),
 ]
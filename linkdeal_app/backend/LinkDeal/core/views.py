@@ -1,14 +1,14 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Sum
 from django.utils import timezone
 from datetime import timedelta
-from decimal import Decimal
 
 from core.models import PlatformSettings
+from core.dashboard import format_amount, get_dashboard_stats
+from core.http import metrics as integration_metrics
+from core.rollups import period_starts, read_buckets
 from accounts.permissions import IsAuthenticatedAuth0, IsAdmin
-from accounts.models import AppUser, MentorProfile, MenteeProfile
 
 
 class PlatformSettingsView(APIView):
@@ -63,159 +63,92 @@ class AdminDashboardStatsView(APIView):
     permission_classes = [IsAuthenticatedAuth0, IsAdmin]
 
     def get(self, request):
-        # Count all registered users excluding admins and super admins
-        total_users = AppUser.objects.exclude(role__in=['admin', 'super_admin']).count()
-
-        # Active mentors (approved status)
-        active_mentors = MentorProfile.objects.filter(status='approved').count()
-
-        # Pending items (pending mentor applications)
-        pending_mentors = MentorProfile.objects.filter(status='pending').count()
-
-        # Monthly revenue calculation
-        # Try to calculate from completed sessions in the last 30 days
-        monthly_revenue = Decimal('0.00')
-        try:
-            from scheduling.models import Session
-            thirty_days_ago = timezone.now() - timedelta(days=30)
-            completed_sessions = Session.objects.filter(
-                status='completed',
-                start_time__gte=thirty_days_ago
-            )
-            # Sum up session amounts or calculate from session_rate
-            total_amount = completed_sessions.aggregate(total=Sum('amount'))['total']
-            if total_amount:
-                monthly_revenue = Decimal(str(total_amount))
-        except Exception:
-            # If Session model doesn't exist or has issues, return 0
-            pass
-
-        # Format revenue
-        if monthly_revenue >= 1000:
-            formatted_revenue = f"€{monthly_revenue / 1000:.1f}K"
-        else:
-            formatted_revenue = f"€{monthly_revenue:.0f}"
-
-        # Calculate total payments and platform earnings from billing
-        total_payments = Decimal('0.00')
-        platform_earnings = Decimal('0.00')
-        try:
-            from billing.models import Payment
-            # Get all completed payments
-            completed_payments = Payment.objects.filter(status='completed')
-            
-            # Total of all payments (full amount)
-            total_payments_sum = completed_payments.aggregate(total=Sum('amount'))['total']
-            if total_payments_sum:
-                total_payments = Decimal(str(total_payments_sum))
-            
-            # Platform earnings (platform fees only, not mentor payouts)
-            platform_fees_sum = completed_payments.aggregate(total=Sum('platform_fee'))['total']
-            if platform_fees_sum:
-                platform_earnings = Decimal(str(platform_fees_sum))
-        except Exception:
-            pass
-
-        # Format total payments
-        if total_payments >= 1000:
-            formatted_total_payments = f"${total_payments / 1000:.1f}K"
-        else:
-            formatted_total_payments = f"${total_payments:.2f}"
-
-        # Format platform earnings
-        if platform_earnings >= 1000:
-            formatted_platform_earnings = f"${platform_earnings / 1000:.1f}K"
-        else:
-            formatted_platform_earnings = f"${platform_earnings:.2f}"
+        # One SQL statement behind a stale-while-revalidate cache (see core/dashboard.py)
+        stats = get_dashboard_stats()
 
         return Response({
-            "total_users": total_users,
-            "active_mentors": active_mentors,
-            "monthly_revenue": formatted_revenue,
-            "pending_items": pending_mentors,
-            "total_payments": formatted_total_payments,
-            "platform_earnings": formatted_platform_earnings,
+            "total_users": stats['total_users'],
+            "active_mentors": stats['active_mentors'],
+            # Completed sessions of the last 30 days
+            "monthly_revenue": format_amount(stats['monthly_revenue'], "€", decimals=0),
+            "pending_items": stats['pending_mentors'],
+            "total_payments": format_amount(stats['total_payments'], "$"),
+            "platform_earnings": format_amount(stats['platform_earnings'], "$"),
         })
 
 
+class AdminIntegrationMetricsView(APIView):
+    """
+    GET: Call metrics of the outbound integrations (Auth0, Whereby, ...)
+    Returns: calls, errors and latencies per integration, for the worker process answering
+    """
+    permission_classes = [IsAuthenticatedAuth0, IsAdmin]
+
+    def get(self, request):
+        return Response(integration_metrics())
+
+
 class AdminDashboardChartsView(APIView):
     """
     GET: Admin dashboard chart data (User Growth & Revenue Trend)
     Query params: period=day|month|year (default: month)
+    Served from the daily metric rollups, whatever the history size.
     """
     permission_classes = [IsAuthenticatedAuth0, IsAdmin]
 
     def get(self, request):
         period = request.query_params.get('period', 'month')
         
-        now = timezone.now()
+        now = timezone.localtime()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
         
         # Get time periods based on filter
         if period == 'day':
             # Last 7 days
-            periods = []
-            for i in range(6, -1, -1):
-                day = now - timedelta(days=i)
-                periods.append({
-                    'start': day.replace(hour=0, minute=0, second=0, microsecond=0),
-                    'end': day.replace(hour=23, minute=59, second=59, microsecond=999999),
-                    'label': day.strftime('%a')  # Mon, Tue, etc.
-                })
+            group_by = 'day'
+            starts = period_starts(today - timedelta(days=6), 7, 'day')
+            labels = [start.strftime('%a') for start in starts]  # Mon, Tue, etc.
+            end = today + timedelta(days=1)
         elif period == 'year':
             # Last 6 years
-            periods = []
-            for i in range(5, -1, -1):
-                year = now.year - i
-                periods.append({
-                    'start': timezone.make_aware(timezone.datetime(year, 1, 1)),
-                    'end': timezone.make_aware(timezone.datetime(year, 12, 31, 23, 59, 59)),
-                    'label': str(year)
-                })
+            group_by = 'year'
+            starts = period_starts(today.replace(year=now.year - 5, month=1, day=1), 6, 'year')
+            labels = [str(start.year) for start in starts]
+            end = today.replace(year=now.year + 1, month=1, day=1)
         else:  # month (default)
             # Last 6 months
-            periods = []
-            for i in range(5, -1, -1):
-                month_date = now - timedelta(days=30 * i)
-                periods.append({
-                    'start': month_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
-                    'end': month_date.replace(hour=23, minute=59, second=59, microsecond=999999),
-                    'label': month_date.strftime('%b')  # Jan, Feb, etc.
-                })
-
-        # Calculate User Growth (new users registered in each period)
-        user_growth_data = []
-        user_growth_labels = []
-        for p in periods:
-            mentor_count = MentorProfile.objects.filter(
-                user__created_at__gte=p['start'],
-                user__created_at__lte=p['end']
-            ).count()
-            mentee_count = MenteeProfile.objects.filter(
-                user__created_at__gte=p['start'],
-                user__created_at__lte=p['end']
-            ).count()
-            user_growth_data.append(mentor_count + mentee_count)
-            user_growth_labels.append(p['label'])
-
-        # Calculate Revenue Trend (from billing payments - platform earnings)
-        revenue_data = []
-        revenue_labels = []
-        try:
-            from billing.models import Payment
-            for p in periods:
-                # Get completed payments in this period
-                completed_payments = Payment.objects.filter(
-                    status='completed',
-                    completed_at__gte=p['start'],
-                    completed_at__lte=p['end']
-                )
-                # Sum platform fees (platform earnings, not total payments)
-                total_fees = completed_payments.aggregate(total=Sum('platform_fee'))['total']
-                revenue_data.append(float(total_fees) if total_fees else 0)
-                revenue_labels.append(p['label'])
-        except Exception:
-            revenue_data = [0] * len(periods)
-            revenue_labels = [p['label'] for p in periods]
+            group_by = 'month'
+            this_month = today.replace(day=1)
+            first_month = this_month.replace(
+                year=this_month.year - (1 if this_month.month <= 5 else 0),
+                month=(this_month.month - 6) % 12 + 1
+            )
+            starts = period_starts(first_month, 6, 'month')
+            labels = [start.strftime('%b') for start in starts]  # Jan, Feb, etc.
+            end = period_starts(this_month, 2, 'month')[1]
+
+        # One range scan over the daily rollups (see core/rollups.py)
+        buckets = read_buckets(
+            ['mentor_signups', 'mentee_signups', 'platform_fees'],
+            starts[0], end,
+            granularity='day', group_by=group_by
+        )
+        empty = {'count': 0, 'total': 0}
+
+        # User Growth (new users registered in each period)
+        user_growth_data = [
+            buckets.get(('mentor_signups', start), empty)['count']
+            + buckets.get(('mentee_signups', start), empty)['count']
+            for start in starts
+        ]
+        user_growth_labels = labels
+
+        # Revenue Trend (platform fees of completed payments, not total payments)
+        revenue_data = [
+            float(buckets.get(('platform_fees', start), empty)['total'])
+            for start in starts
+        ]
+        revenue_labels = labels
 
         # Calculate max values for Y-axis ticks
         max_users = max(user_growth_data) if user_growth_data and max(user_growth_data) > 0 else 100
@@ -237,6 +237,10 @@ class Review(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination of a mentor's reviews
+            models.Index(fields=['mentor', '-created_at', '-id'], name='review_mentor_page_idx'),
+        ]
 
     def __str__(self):
         return f"Review: {self.mentee.full_name} -> {self.mentor.full_name} ({self.rating}★)"
@@ -0,0 +1,83 @@
+"""
+Relevance-ranked mentor search.
+
+MentorProfile.search_vector is a generated tsvector column (full name
+weighted A, title and skills B, bio C) with a GIN index, and full_name has
+a pg_trgm GIN index. A search matches mentors whose document contains
+every search word as a prefix ("pyth dja" finds Python/Django mentors) or
+whose name is a close fuzzy match ("jon smit"), and ranks them by text
+relevance plus name similarity. Both predicates are index lookups, so
+latency does not grow with the catalogue.
+
+Skills and languages are filtered through the generated skill_keys /
+language_keys arrays (normalized by accounts_facet_keys, GIN-indexed):
+facet_key() normalizes a filter value the same way and facet_counts()
+counts the values among a filtered listing.
+"""
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connection
+from django.db.models import F, Q
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+WORD_RE = re.compile(r'\w+')
+
+
+def search_mentors(queryset, term):
+    """Filter a MentorProfile queryset by term and annotate it with search_rank."""
+    words = WORD_RE.findall(term.lower())
+    if not words:
+        return queryset.none()
+
+    term = ' '.join(words)
+    query = SearchQuery(' & '.join(f'{word}:*' for word in words), search_type='raw', config='simple')
+    return queryset.filter(
+        Q(search_vector=query) | Q(full_name__trigram_word_similar=term)
+    ).annotate(
+        search_rank=SearchRank(F('search_vector'), query) + TrigramWordSimilarity(term, 'full_name')
+    )
+
+
+def facet_key(value):
+    """A skill/language as stored in skill_keys/language_keys."""
+    return value.strip().lower()
+
+
+def facet_counts(queryset, field, limit=50):
+    """[{'value', 'count'}] of the most common entries of an array field in queryset."""
+    sql, params = queryset.order_by().values(field).query.sql_with_params()
+    column = connection.ops.quote_name(field)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT key, COUNT(*) AS count
+            FROM ({sql}) AS profiles, unnest(profiles.{column}) AS key
+            GROUP BY key
+            ORDER BY count DESC, key
+            LIMIT %s
+            """,
+            [*params, limit]
+        )
+        return [{'value': key, 'count': count} for key, count in cursor.fetchall()]
+
+
+class MentorSearchFilter(filters.BaseFilterBackend):
+    """
+    Applies ?search= through search_mentors. Results come most relevant
+    first unless the client asked for an explicit ?ordering=; list it after
+    OrderingFilter so the view's default ordering only breaks ties.
+    """
+    search_param = api_settings.SEARCH_PARAM
+    ordering_param = api_settings.ORDERING_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        term = request.query_params.get(self.search_param, '').strip()
+        if not term:
+            return queryset
+
+        queryset = search_mentors(queryset, term)
+        if request.query_params.get(self.ordering_param):
+            return queryset
+        return queryset.order_by('-search_rank', *queryset.query.order_by)
@@ -412,13 +412,16 @@ class MentorMenteesStatsSerializer(serializers.Serializer):
 # -------------------------------------------------------------------
 
 class MentorPublicListSerializer(serializers.ModelSerializer):
-    """Public mentor listing with ratings and category info."""
+    """
+    Public mentor listing with ratings and category info.
+    Expects mentors annotated by MentorPublicQuerysetMixin (mentoring/views.py).
+    """
     
     profile_picture_url = serializers.SerializerMethodField()
     average_rating = serializers.SerializerMethodField()
-    reviews_count = serializers.SerializerMethodField()
+    reviews_count = serializers.IntegerField(source='ratings_count', read_only=True)
     categories = serializers.SerializerMethodField()
-    is_favorite = serializers.SerializerMethodField()
+    is_favorite = serializers.BooleanField(read_only=True)
     
     class Meta:
         model = MentorProfile
@@ -435,20 +438,11 @@ class MentorPublicListSerializer(serializers.ModelSerializer):
         return None
     
     def get_average_rating(self, obj):
-        from scheduling.models import Session
-        avg = Session.objects.filter(
-            mentor=obj, rating__isnull=False
-        ).aggregate(avg=Avg('rating'))['avg']
-        return round(avg, 1) if avg else None
-    
-    def get_reviews_count(self, obj):
-        from scheduling.models import Session
-        return Session.objects.filter(mentor=obj, rating__isnull=False).count()
+        if not obj.ratings_count:
+            return None
+        return round(obj.ratings_sum / obj.ratings_count, 1)
     
     def get_categories(self, obj):
-        assignments = obj.category_assignments.select_related('category').filter(
-            category__is_active=True
-        )
         return [
             {
                 'id': a.category.id,
@@ -456,19 +450,8 @@ class MentorPublicListSerializer(serializers.ModelSerializer):
                 'slug': a.category.slug,
                 'is_primary': a.is_primary
             }
-            for a in assignments
+            for a in obj.active_category_assignments
         ]
-    
-    def get_is_favorite(self, obj):
-        request = self.context.get('request')
-        if not request or not request.user.is_authenticated:
-            return False
-        
-        try:
-            mentee = MenteeProfile.objects.get(user__auth0_id=request.user.auth0_id)
-            return MentorFavorite.objects.filter(mentee=mentee, mentor=obj).exists()
-        except MenteeProfile.DoesNotExist:
-            return False
 
 
 class MentorPublicDetailSerializer(MentorPublicListSerializer):
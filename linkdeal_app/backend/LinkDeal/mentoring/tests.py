@@ -1,3 +1,205 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import AppUser, MentorProfile, MenteeProfile
+from core.authentication import Auth0User
+from mentoring.models import MentorCategory, MentorCategoryAssignment, MentorFavorite
+from mentoring.views import MentorFacetsView, MentorPublicListView
+from scheduling.models import SessionStats
+
+
+class MentorPublicListQueryCountTestCase(TestCase):
+    """The public mentor listing costs a fixed number of queries, whatever its size."""
+
+    def setUp(self):
+        self.categories = [
+            MentorCategory.objects.create(name=f'Category {i}', slug=f'category-{i}')
+            for i in range(3)
+        ]
+        user = AppUser.objects.create(email='mentee@test.com', role='mentee', auth0_id='auth0|mentee')
+        self.mentee = MenteeProfile.objects.create(
+            user=user,
+            email=user.email,
+            full_name='Mentee',
+            country='Canada',
+        )
+
+    def _create_mentors(self, count):
+        start = MentorProfile.objects.count()
+        for i in range(start, start + count):
+            user = AppUser.objects.create(email=f'mentor{i}@test.com', role='mentor', auth0_id=f'auth0|mentor{i}')
+            mentor = MentorProfile.objects.create(
+                user=user,
+                email=user.email,
+                full_name=f'Mentor {i}',
+                professional_title='Senior Dev',
+                location='Remote',
+                linkedin_url='https://linkedin.com/in/mentor',
+                bio='Great mentor',
+                country='USA',
+                session_rate=Decimal('100.00'),
+                status='approved',
+            )
+            for category in self.categories[:2]:
+                MentorCategoryAssignment.objects.create(mentor=mentor, category=category)
+            SessionStats.objects.update_or_create(
+                mentor=mentor,
+                defaults={'rating_sum': 9, 'rating_count': 2},
+            )
+            if i % 2:
+                MentorFavorite.objects.create(mentee=self.mentee, mentor=mentor)
+
+    def _list(self, authenticated):
+        request = APIRequestFactory().get('/')
+        if authenticated:
+            ns = getattr(settings, 'AUTH0_CUSTOM_NAMESPACE', 'https://linkdeal.com/claims/')
+            force_authenticate(request, user=Auth0User({
+                'sub': self.mentee.user.auth0_id,
+                'email': self.mentee.user.email,
+                'email_verified': True,
+                f'{ns}roles': ['mentee'],
+            }))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = MentorPublicListView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        return response.data, len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_mentors(self):
+        self._create_mentors(2)
+        _, small = self._list(authenticated=True)
+
+        self._create_mentors(18)
+        data, large = self._list(authenticated=True)
+
+        self.assertEqual(len(data), 20)
+        self.assertEqual(small, large)
+        # Mentee lookup, mentors, category prefetch
+        self.assertEqual(large, 3)
+
+    def test_anonymous_listing_skips_mentee_lookup(self):
+        self._create_mentors(5)
+        data, queries = self._list(authenticated=False)
+
+        self.assertEqual(queries, 2)
+        self.assertFalse(any(mentor['is_favorite'] for mentor in data))
+
+    def test_annotated_fields(self):
+        self._create_mentors(4)
+        data, _ = self._list(authenticated=True)
+
+        self.assertEqual(sum(mentor['is_favorite'] for mentor in data), 2)
+        for mentor in data:
+            self.assertEqual(mentor['average_rating'], 4.5)
+            self.assertEqual(mentor['reviews_count'], 2)
+            self.assertEqual(len(mentor['categories']), 2)
+
+
+class MentorSearchTestCase(TestCase):
+    """Full-text and fuzzy-name mentor search."""
+
+    def setUp(self):
+        self.alice = self._create_mentor('Alice Martin', 'Backend Engineer', ['Python', 'Django'], 'Loves APIs.')
+        self.bob = self._create_mentor('Bob Stone', 'Data Scientist', ['Pandas'], 'Writes Python daily.')
+        self.carol = self._create_mentor('Carol Jones', 'Designer', ['Figma'], 'UX mentor.')
+
+    def _create_mentor(self, full_name, title, skills, bio):
+        email = f"{full_name.split()[0].lower()}@test.com"
+        user = AppUser.objects.create(email=email, role='mentor', auth0_id=f'auth0|{email}')
+        return MentorProfile.objects.create(
+            user=user,
+            email=email,
+            full_name=full_name,
+            professional_title=title,
+            location='Remote',
+            linkedin_url='https://linkedin.com/in/mentor',
+            bio=bio,
+            country='USA',
+            skills=skills,
+            status='approved',
+        )
+
+    def _search(self, term):
+        request = APIRequestFactory().get('/', {'search': term})
+        response = MentorPublicListView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        return [mentor['full_name'] for mentor in response.data]
+
+    def test_skill_matches_rank_above_bio_matches(self):
+        self.assertEqual(self._search('python'), ['Alice Martin', 'Bob Stone'])
+
+    def test_prefix_search(self):
+        self.assertEqual(self._search('pyth djan'), ['Alice Martin'])
+
+    def test_fuzzy_name_search(self):
+        self.assertEqual(self._search('carol jone'), ['Carol Jones'])
+        self.assertEqual(self._search('Carl Jones'), ['Carol Jones'])
+
+    def test_search_vector_follows_updates(self):
+        self.carol.skills = ['Python']
+        self.carol.save()
+        self.assertIn('Carol Jones', self._search('python'))
+
+    def test_explicit_ordering_wins(self):
+        request = APIRequestFactory().get('/', {'search': 'python', 'ordering': 'full_name'})
+        response = MentorPublicListView.as_view()(request)
+        self.assertEqual([m['full_name'] for m in response.data], ['Alice Martin', 'Bob Stone'])
+
+
+class MentorFacetTestCase(TestCase):
+    """Normalized skill/language filters and facet counts."""
+
+    def setUp(self):
+        self._create_mentor('java', ['Java', 'Spring'], ['English', 'French'])
+        self._create_mentor('js', ['JavaScript', 'React'], 'English, Arabic')
+        self._create_mentor('both', ['java ', 'JavaScript'], ['english'])
+
+    def _create_mentor(self, name, skills, languages):
+        user = AppUser.objects.create(email=f'{name}@test.com', role='mentor', auth0_id=f'auth0|{name}')
+        return MentorProfile.objects.create(
+            user=user,
+            email=user.email,
+            full_name=name,
+            professional_title='Developer',
+            location='Remote',
+            linkedin_url='https://linkedin.com/in/mentor',
+            bio='Mentor',
+            country='USA',
+            skills=skills,
+            languages=languages,
+            status='approved',
+        )
+
+    def _get(self, view, params):
+        response = view.as_view()(APIRequestFactory().get('/', params))
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_skill_filter_is_exact_and_case_insensitive(self):
+        names = {m['full_name'] for m in self._get(MentorPublicListView, {'skills': 'JAVA'})}
+        self.assertEqual(names, {'java', 'both'})
+
+        names = {m['full_name'] for m in self._get(MentorPublicListView, {'skills': 'java,javascript'})}
+        self.assertEqual(names, {'both'})
+
+    def test_language_filter_handles_legacy_strings(self):
+        names = {m['full_name'] for m in self._get(MentorPublicListView, {'language': 'arabic'})}
+        self.assertEqual(names, {'js'})
+
+    def test_facet_counts(self):
+        data = self._get(MentorFacetsView, {})
+        self.assertEqual(data['total'], 3)
+        self.assertEqual(data['languages'][0], {'value': 'english', 'count': 3})
+        skills = {facet['value']: facet['count'] for facet in data['skills']}
+        self.assertEqual(skills['java'], 2)
+        self.assertEqual(skills['javascript'], 2)
 
-# Create your tests here.
+    def test_facet_counts_follow_filters(self):
+        data = self._get(MentorFacetsView, {'skills': 'react'})
+        self.assertEqual(data['total'], 1)
+        self.assertEqual({f['value'] for f in data['languages']}, {'english', 'arabic'})
@@ -10,6 +10,7 @@ urlpatterns = [
 
     # Public Mentor Listing
     path('mentors/', views.MentorPublicListView.as_view(), name='mentor-list'),
+    path('mentors/facets/', views.MentorFacetsView.as_view(), name='mentor-facets'),
     path('mentors/<uuid:id>/', views.MentorPublicDetailView.as_view(), name='mentor-detail'),
     path('mentors/<uuid:mentor_id>/reviews/', views.MentorReviewsView.as_view(), name='mentor-reviews'),
     path('mentors/<uuid:mentor_id>/is-favorite/', views.MentorIsFavoriteView.as_view(), name='mentor-is-favorite'),
@@ -5,7 +5,8 @@ Handles API endpoints for mentor listings, reviews, favorites, and relations.
 import logging
 from decimal import Decimal
 
-from django.db.models import Avg, Count
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Value
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
@@ -19,11 +20,14 @@ from accounts.models import MentorProfile, MenteeProfile
 
 from mentoring.models import (
     MentorCategory,
+    MentorCategoryAssignment,
     MentorMenteeRelation,
     Review,
     MentorFavorite,
     ReviewTag,
 )
+from core.pagination import KeysetPagination
+from mentoring.search import MentorSearchFilter, facet_counts, facet_key
 from mentoring.serializers import (
     MentorCategorySerializer,
     ReviewTagSerializer,
@@ -62,70 +66,142 @@ class MentorCategoryListView(generics.ListAPIView):
 # 2. PUBLIC MENTOR LISTING VIEWS
 # -------------------------------------------------------------------
 
-class MentorPublicListView(generics.ListAPIView):
+class MentorPublicQuerysetMixin:
+    """
+    Annotates mentors with everything the public mentor serializers render,
+    so a listing costs the same few queries whatever its size: ratings from
+    the mentor's SessionStats row, categories in one prefetch and the
+    favorite flag as an EXISTS against the mentee resolved once per request.
+    """
+
+    def get_mentee_id(self):
+        user = self.request.user
+        if not user.is_authenticated:
+            return None
+        return MenteeProfile.objects.filter(
+            user__auth0_id=user.auth0_id
+        ).values_list('id', flat=True).first()
+
+    def annotate_public_fields(self, queryset):
+        mentee_id = self.get_mentee_id()
+        if mentee_id:
+            is_favorite = Exists(MentorFavorite.objects.filter(mentee_id=mentee_id, mentor=OuterRef('pk')))
+        else:
+            is_favorite = Value(False)
+
+        return queryset.annotate(
+            ratings_sum=Coalesce('session_stats__rating_sum', 0),
+            ratings_count=Coalesce('session_stats__rating_count', 0),
+            is_favorite=is_favorite,
+        ).prefetch_related(
+            Prefetch(
+                'category_assignments',
+                queryset=MentorCategoryAssignment.objects.filter(
+                    category__is_active=True
+                ).select_related('category'),
+                to_attr='active_category_assignments'
+            )
+        )
+
+
+class MentorPublicListView(MentorPublicQuerysetMixin, generics.ListAPIView):
     """
     GET /mentoring/mentors/
-    List approved mentors with search and filters.
+    List approved mentors with filters and relevance-ranked search
+    (see mentoring/search.py).
     """
     serializer_class = MentorPublicListSerializer
     permission_classes = [AllowAny]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['full_name', 'professional_title', 'skills', 'bio']
+    pagination_class = KeysetPagination
+    filter_backends = [filters.OrderingFilter, MentorSearchFilter]
     ordering_fields = ['created_at', 'full_name']
     ordering = ['-created_at']
 
     def get_queryset(self):
+        return self.annotate_public_fields(self.filter_mentors())
+
+    def filter_mentors(self):
+        """Approved mentors narrowed by the listing's query parameters."""
         queryset = MentorProfile.objects.filter(status='approved')
         
-        # Category filter
+        # Category filter (EXISTS rather than a join, so no DISTINCT is needed)
         category = self.request.query_params.get('category')
         if category:
-            queryset = queryset.filter(
-                category_assignments__category__slug=category
-            )
-        
-        # Language filter
+            queryset = queryset.filter(Exists(
+                MentorCategoryAssignment.objects.filter(
+                    mentor=OuterRef('pk'),
+                    category__slug=category
+                )
+            ))
+        
+        # Language filter (exact, case-insensitive; GIN index on language_keys)
         language = self.request.query_params.get('language')
         if language:
-            queryset = queryset.filter(languages__icontains=language)
+            queryset = queryset.filter(language_keys__contains=[facet_key(language)])
         
         # Country filter
         country = self.request.query_params.get('country')
         if country:
             queryset = queryset.filter(country__iexact=country)
         
-        # Skills filter
+        # Skills filter (mentors must have every listed skill; GIN index on skill_keys)
         skills = self.request.query_params.get('skills')
         if skills:
-            skill_list = skills.split(',')
-            for skill in skill_list:
-                queryset = queryset.filter(skills__icontains=skill.strip())
+            skill_keys = [facet_key(skill) for skill in skills.split(',') if skill.strip()]
+            queryset = queryset.filter(skill_keys__contains=skill_keys)
         
-        # Rating filter (minimum rating)
+        # Rating filter (minimum average of approved reviews)
         min_rating = self.request.query_params.get('min_rating')
         if min_rating:
             try:
                 min_val = float(min_rating)
-                # Annotate with average rating and filter
-                queryset = queryset.annotate(
-                    avg_rating=Avg('reviews_received__rating')
-                ).filter(avg_rating__gte=min_val)
+                queryset = queryset.filter(
+                    session_stats__review_count__gt=0,
+                    session_stats__review_rating_sum__gte=min_val * F('session_stats__review_count')
+                )
             except ValueError:
                 pass
         
-        return queryset.distinct()
+        return queryset
+
+
+class MentorFacetsView(MentorPublicListView):
+    """
+    GET /mentoring/mentors/facets/
+    Skill and language counts among the mentors matching the listing
+    filters (category, language, country, skills, min_rating, search), for
+    the filter UI. Each value is what the skills/language filters expect.
+
+    Query params:
+    - limit: values per facet (default 50, max 200)
+    """
+
+    def list(self, request, *args, **kwargs):
+        try:
+            limit = min(max(int(request.query_params.get('limit', 50)), 1), 200)
+        except ValueError:
+            limit = 50
+
+        queryset = self.filter_queryset(self.filter_mentors())
+        return Response({
+            'total': queryset.count(),
+            'skills': facet_counts(queryset, 'skill_keys', limit),
+            'languages': facet_counts(queryset, 'language_keys', limit),
+        })
 
 
-class MentorPublicDetailView(generics.RetrieveAPIView):
+class MentorPublicDetailView(MentorPublicQuerysetMixin, generics.RetrieveAPIView):
     """
     GET /mentoring/mentors/<id>/
     Get detailed public profile of a mentor.
     """
-    queryset = MentorProfile.objects.filter(status='approved')
     serializer_class = MentorPublicDetailSerializer
     permission_classes = [AllowAny]
     lookup_field = 'id'
 
+    def get_queryset(self):
+        return self.annotate_public_fields(MentorProfile.objects.filter(status='approved'))
+
 
 # -------------------------------------------------------------------
 # 3. REVIEW VIEWS
@@ -148,6 +224,7 @@ class MentorReviewsView(generics.ListAPIView):
     """
     serializer_class = ReviewListSerializer
     permission_classes = [AllowAny]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         mentor_id = self.kwargs['mentor_id']
@@ -204,6 +281,7 @@ class MentorReceivedReviewsView(generics.ListAPIView):
     """
     serializer_class = ReviewListSerializer
     permission_classes = [IsAuthenticatedAuth0, IsMentor]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         mentor = MentorProfile.objects.get(user__auth0_id=self.request.user.auth0_id)
@@ -413,29 +491,26 @@ class MentorMenteesStatsView(APIView):
         paused = relations.filter(status='paused').count()
         
         # Aggregate session stats
-        from django.db.models import Sum, Avg
+        from django.db.models import Sum
         totals = relations.aggregate(
             sessions=Sum('total_sessions'),
             hours=Sum('total_hours')
         )
         
-        # Get session counts by status
-        from scheduling.models import Session
-        all_sessions = Session.objects.filter(mentor=mentor)
+        # Session counts by status and average rating, kept up to date in
+        # the mentor's SessionStats row
+        from scheduling.stats import get_profile_stats
+        stats = get_profile_stats('mentor', mentor.id)
         
         session_counts = {
-            'pending': all_sessions.filter(status='pending').count(),
-            'confirmed': all_sessions.filter(status='confirmed').count(),
-            'in_progress': all_sessions.filter(status='in_progress').count(),
-            'completed': all_sessions.filter(status='completed').count(),
-            'cancelled': all_sessions.filter(status='cancelled').count(),
-            'no_show': all_sessions.filter(status='no_show').count(),
+            'pending': stats.pending_sessions,
+            'confirmed': stats.confirmed_sessions,
+            'in_progress': stats.in_progress_sessions,
+            'completed': stats.completed_sessions,
+            'cancelled': stats.cancelled_sessions,
+            'no_show': stats.no_show_sessions,
         }
-        
-        # Get average rating from sessions
-        avg_rating = Session.objects.filter(
-            mentor=mentor, rating__isnull=False
-        ).aggregate(avg=Avg('rating'))['avg']
+        avg_rating = stats.average_rating
         
         data = {
             'total_mentees': total,
@@ -463,27 +538,19 @@ class MentorRatingView(APIView):
 
     def get(self, request):
         mentor = MentorProfile.objects.get(user__auth0_id=request.user.auth0_id)
-        reviews = Review.objects.filter(mentor=mentor, is_approved=True)
+        # Approved review counters, kept up to date in the mentor's SessionStats row
+        from scheduling.stats import get_profile_stats
+        stats = get_profile_stats('mentor', mentor.id)
         
-        # Average & count
-        stats = reviews.aggregate(
-            avg=Avg('rating'),
-            total=Count('id')
-        )
-        
-        # Rating distribution
-        distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-        for r in reviews.values('rating').annotate(count=Count('id')):
-            distribution[r['rating']] = r['count']
-        
-        # Featured count
-        featured = reviews.filter(is_featured=True).count()
+        distribution = {
+            rating: getattr(stats, f'reviews_{rating}') for rating in range(1, 6)
+        }
         
         data = {
-            'average_rating': round(stats['avg'] or 0, 2),
-            'total_reviews': stats['total'] or 0,
+            'average_rating': round(stats.average_review_rating or 0, 2),
+            'total_reviews': stats.review_count,
             'rating_distribution': distribution,
-            'featured_reviews_count': featured,
+            'featured_reviews_count': stats.featured_reviews,
         }
         
         return Response(MentorRatingSerializer(data).data)
@@ -514,33 +581,33 @@ class MenteeProgressView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Get session history
+        # Progress metrics in one pass over the pair's sessions
         from scheduling.models import Session
-        sessions = Session.objects.filter(
-            mentor=mentor,
-            mentee_id=mentee_id
-        ).order_by('-scheduled_at')
-        
-        # Calculate progress metrics
-        completed = sessions.filter(status='completed').count()
-        total_hours = sum(s.duration_minutes for s in sessions.filter(status='completed')) / 60
-        
-        # Sessions trend (last 3 months vs previous 3 months)
+        from django.db.models import Q, Sum
         from django.utils import timezone
         from datetime import timedelta
         now = timezone.now()
         three_months_ago = now - timedelta(days=90)
         six_months_ago = now - timedelta(days=180)
         
-        recent = sessions.filter(
-            scheduled_at__gte=three_months_ago,
-            status='completed'
-        ).count()
-        previous = sessions.filter(
-            scheduled_at__gte=six_months_ago,
-            scheduled_at__lt=three_months_ago,
-            status='completed'
-        ).count()
+        completed_q = Q(status='completed')
+        metrics = Session.objects.filter(
+            mentor=mentor,
+            mentee_id=mentee_id
+        ).aggregate(
+            completed=Count('id', filter=completed_q),
+            minutes=Sum('duration_minutes', filter=completed_q),
+            # Sessions trend (last 3 months vs previous 3 months)
+            recent=Count('id', filter=completed_q & Q(scheduled_at__gte=three_months_ago)),
+            previous=Count('id', filter=completed_q & Q(
+                scheduled_at__gte=six_months_ago,
+                scheduled_at__lt=three_months_ago
+            )),
+        )
+        completed = metrics['completed']
+        total_hours = (metrics['minutes'] or 0) / 60
+        recent = metrics['recent']
+        previous = metrics['previous']
         
         trend = 'stable'
         if recent > previous:
@@ -1,14 +1,32 @@
+import os
+
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+PER_PROCESS_CACHES = {'django.core.cache.backends.locmem.LocMemCache'}
 
 
 class NotificationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'notifications'
-    
+
     def ready(self):
-        """Start the scheduler when Django starts."""
-        import os
-        # Only start scheduler in the main process (not in migrations or shell)
-        if os.environ.get('RUN_MAIN') == 'true':
-            from notifications.scheduler import start_scheduler
-            start_scheduler()
+        import notifications.signals  # noqa
+        check_shared_cache()
+
+
+def check_shared_cache():
+    """
+    Stream tickets (push.py) and unread counters (unread.py) live in the
+    default cache, so the workers of a process manager must share it.
+    Refuse to start when WEB_CONCURRENCY (the worker count gunicorn and
+    uvicorn read) asks for several workers on a per-process cache.
+    """
+    workers = int(os.getenv('WEB_CONCURRENCY') or 1)
+    backend = settings.CACHES['default']['BACKEND']
+    if workers > 1 and backend in PER_PROCESS_CACHES:
+        raise ImproperlyConfigured(
+            f"WEB_CONCURRENCY={workers} needs a cache shared by the workers; "
+            f"set CACHE_BACKEND/CACHE_LOCATION (e.g. Redis) instead of {backend}."
+        )
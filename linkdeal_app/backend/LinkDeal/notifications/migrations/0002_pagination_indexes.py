@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_pagination_indexes'),
+        ('notifications', '0001_initial'),
+        ('scheduling', '0006_session_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-created_at', '-id'], name='notification_page_idx'),
+        ),
+    ]
@@ -71,6 +71,8 @@ class Notification(models.Model):
             models.Index(fields=['recipient', 'is_read']),
             models.Index(fields=['notification_type']),
             models.Index(fields=['created_at']),
+            # Keyset pagination of a user's notifications
+            models.Index(fields=['recipient', '-created_at', '-id'], name='notification_page_idx'),
         ]
 
     def __str__(self):
@@ -0,0 +1,149 @@
+"""
+Real-time delivery of notification events to the users' open streams.
+
+publish() sends an event to a user with PostgreSQL NOTIFY, so it reaches
+every web process. A process serving streams runs one listener thread
+(broker) on a dedicated database connection: it LISTENs on CHANNEL and hands
+each event to the asyncio queues of that user's streams in the process.
+
+The streams themselves are server-sent events responses of the ASGI app
+(notifications.views.notification_stream). A stream too slow to keep up
+loses events rather than blocking the others; the unread_count events
+carry the full count, so it resynchronises on the next one.
+
+EventSource cannot send an Authorization header, and an access token in
+the URL would end up in proxy and access logs. Streams are opened with a
+stream ticket instead: a signed user id valid for TICKET_TTL seconds,
+for this purpose only, and redeemable once: the redeemed nonces are kept
+in the default cache, which the workers must share (notifications/apps.py).
+"""
+import asyncio
+import json
+import logging
+import secrets
+import select
+import threading
+import time
+from collections import defaultdict
+
+from django.core import signing
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection, connections
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "linkdeal_notifications"
+MAX_PAYLOAD = 7900  # NOTIFY payloads are limited to 8000 bytes
+QUEUE_SIZE = 100  # Pending events per stream
+POLL_INTERVAL = 5  # Seconds
+RECONNECT_DELAY = 5  # Seconds
+
+TICKET_SALT = "notifications.stream"
+TICKET_TTL = 30  # Seconds
+TICKET_USED_KEY = "notifications:stream_ticket:{nonce}"
+
+
+def publish(user_id, event, data):
+    """Send an event to the open streams of a user (on any process)."""
+    if connection.vendor != "postgresql":
+        return
+
+    payload = json.dumps({"user": str(user_id), "event": event, "data": data}, cls=DjangoJSONEncoder)
+    if len(payload.encode()) > MAX_PAYLOAD:
+        if "id" not in data:
+            logger.warning(f"Dropping oversized {event} event for user {user_id}")
+            return
+        # The client fetches the full record
+        payload = json.dumps({"user": str(user_id), "event": event, "data": {"id": str(data["id"])}})
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, payload])
+    except DatabaseError as e:
+        logger.warning(f"Could not publish {event} event for user {user_id}: {e}")
+
+
+def issue_ticket(user_id):
+    """A stream ticket of an AppUser (see the module docstring)."""
+    return signing.dumps({"user": str(user_id), "nonce": secrets.token_urlsafe(12)}, salt=TICKET_SALT)
+
+
+def redeem_ticket(ticket):
+    """AppUser id of a stream ticket, None if it is invalid, expired or already used."""
+    try:
+        payload = signing.loads(ticket, salt=TICKET_SALT, max_age=TICKET_TTL)
+    except signing.BadSignature:
+        return None
+    if not cache.add(TICKET_USED_KEY.format(nonce=payload["nonce"]), True, TICKET_TTL):
+        return None
+    return payload["user"]
+
+
+def _offer(queue, message):
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        pass
+
+
+class Broker:
+    """Fans the events of CHANNEL out to the streams open in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # user id -> {(queue, event loop)}
+        self._streams = defaultdict(set)
+        self._thread = None
+
+    def subscribe(self, user_id):
+        """Register a stream of the running event loop; returns its handle, whose queue gets the events."""
+        stream = (asyncio.Queue(maxsize=QUEUE_SIZE), asyncio.get_running_loop())
+        with self._lock:
+            self._streams[str(user_id)].add(stream)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._listen, name="notification-broker", daemon=True)
+                self._thread.start()
+        return stream
+
+    def unsubscribe(self, user_id, stream):
+        with self._lock:
+            streams = self._streams.get(str(user_id))
+            if streams is not None:
+                streams.discard(stream)
+                if not streams:
+                    del self._streams[str(user_id)]
+
+    def _dispatch(self, payload):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        with self._lock:
+            streams = list(self._streams.get(message.get("user"), ()))
+        for queue, loop in streams:
+            loop.call_soon_threadsafe(_offer, queue, message)
+
+    def _listen(self):
+        while True:
+            # A connection of its own: LISTEN lasts as long as the connection
+            listener = connections.create_connection(DEFAULT_DB_ALIAS)
+            try:
+                listener.ensure_connection()
+                raw = listener.connection
+                with raw.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                while True:
+                    if select.select([raw], [], [], POLL_INTERVAL) == ([], [], []):
+                        continue
+                    raw.poll()
+                    while raw.notifies:
+                        self._dispatch(raw.notifies.pop(0).payload)
+            except Exception as e:
+                logger.error(f"Notification broker connection failed: {e}", exc_info=True)
+            finally:
+                listener.close()
+            time.sleep(RECONNECT_DELAY)
+
+
+broker = Broker()
@@ -1,185 +1,166 @@
 """
-Scheduler for sending session reminders.
-Uses APScheduler to check for upcoming sessions every minute.
+Session reminders, sent by a periodic job every minute.
+The jobs run under the leader-elected scheduler of core/scheduler.py.
 """
 import logging
 from datetime import timedelta
+from django.db import transaction
 from django.utils import timezone
-from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 logger = logging.getLogger(__name__)
 
-# Global scheduler instance
-_scheduler = None
 
+# Reminders go out for sessions starting between 29 and 31 minutes from now
+REMINDER_WINDOW = (timedelta(minutes=29), timedelta(minutes=31))
+REMINDER_BATCH_SIZE = 500
 
-def get_or_create_video_room(session):
+
+def _reminder_notification(session, user, other_name, video_url):
+    from notifications.models import Notification
+
+    return Notification(
+        recipient=user,
+        notification_type='session_reminder',
+        title="Session dans 30 minutes",
+        message=f"Rappel : Votre session avec {other_name} commence à {session.scheduled_at.strftime('%H:%M')}. "
+                f"Durée : {session.duration_minutes} minutes.",
+        link=video_url,
+        link_text="Rejoindre la réunion",
+        related_session=session,
+        email_sent=True
+    )
+
+
+def _send_reminder_batch(due, batch_size):
     """
-    Get existing video room URL or create a new one.
-    Returns the appropriate URL for joining the session.
+    Claim up to batch_size due sessions and send their reminders, in one
+    transaction: the sessions are marked reminder_sent together with their
+    notifications and queued emails, so a failure sends nothing and the
+    sessions are picked up again by the next run. Returns the number of
+    sessions reminded.
     """
-    # If we already have a Whereby room URL, use it
-    if session.whereby_room_url:
-        return session.whereby_room_url
-    
-    # Try to create a Whereby room
-    try:
-        from scheduling.services import WherebyService
-        
-        meeting = WherebyService.create_meeting(session)
-        if meeting:
-            session.whereby_meeting_id = meeting.get('meetingId')
-            session.whereby_room_url = meeting.get('roomUrl')
-            session.whereby_host_room_url = meeting.get('hostRoomUrl')
-            session.video_provider = 'whereby'
-            session.video_room_id = meeting.get('meetingId')
-            session.save()
-            return session.whereby_room_url
-    except Exception as e:
-        logger.warning(f"Could not create Whereby room: {e}")
-    
-    # Fallback: Generate a Jitsi room ID
-    if not session.video_room_id:
-        session.generate_video_room_id()
-        session.video_provider = 'jitsi'
-        session.save()
-    
-    # Return Jitsi URL
-    return f"https://meet.jit.si/{session.video_room_id}"
-
-
-def check_upcoming_sessions():
+    from notifications.email_service import NotificationEmailService
+    from notifications.models import Notification
+    from notifications.unread import notifications_created
+    from scheduling.models import Session
+    from scheduling.video_rooms import participant_url, pin_fallback
+
+    with transaction.atomic():
+        sessions = list(
+            due.select_for_update(skip_locked=True, of=('self',))
+            .select_related('mentor__user', 'mentee__user')
+            .order_by('scheduled_at')[:batch_size]
+        )
+        if not sessions:
+            return 0
+
+        Session.objects.filter(id__in=[session.id for session in sessions]).update(reminder_sent=True)
+
+        notifications = []
+        emails = []
+        for session in sessions:
+            video_url = participant_url(pin_fallback(session))
+            mentor_user = session.mentor.user
+            mentee_user = session.mentee.user
+
+            notifications.append(_reminder_notification(session, mentor_user, session.mentee.full_name, video_url))
+            notifications.append(_reminder_notification(session, mentee_user, session.mentor.full_name, video_url))
+            # Host URL for the mentor, participant URL for the mentee
+            emails.append((mentor_user, session, session.whereby_host_room_url or video_url, True))
+            emails.append((mentee_user, session, video_url, False))
+
+        Notification.objects.bulk_create(notifications)
+        notifications_created(notifications)
+        NotificationEmailService.send_session_reminders(emails)
+
+    return len(sessions)
+
+
+def check_upcoming_sessions(now=None, batch_size=REMINDER_BATCH_SIZE):
     """
     Check for sessions starting in ~30 minutes and send reminders.
     This job runs every minute.
+
+    Due sessions are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so
+    concurrent runs never remind the same session twice; emails go to the
+    outbox instead of being sent inline.
     """
     try:
         # Import here to avoid circular imports
         from scheduling.models import Session
-        from notifications.models import Notification
-        from notifications.email_service import NotificationEmailService
-        
-        now = timezone.now()
-        
+        from scheduling.video_rooms import provision_rooms
+
+        now = now or timezone.now()
+
         # Window: 29-31 minutes from now (to handle timing variations)
-        reminder_window_start = now + timedelta(minutes=29)
-        reminder_window_end = now + timedelta(minutes=31)
-        
-        # Find sessions that need reminders
-        sessions = Session.objects.filter(
-            scheduled_at__gte=reminder_window_start,
-            scheduled_at__lte=reminder_window_end,
+        due = Session.objects.filter(
+            scheduled_at__gte=now + REMINDER_WINDOW[0],
+            scheduled_at__lte=now + REMINDER_WINDOW[1],
             status__in=['pending', 'confirmed'],
             reminder_sent=False
-        ).select_related('mentor', 'mentee', 'mentor__user', 'mentee__user')
-        
-        if sessions.exists():
-            logger.info(f"Found {sessions.count()} sessions needing reminders")
-        
-        for session in sessions:
-            try:
-                # Get or create video room URL
-                video_url = get_or_create_video_room(session)
-                
-                session_time = session.scheduled_at.strftime("%H:%M")
-                mentor_name = session.mentor.full_name
-                mentee_name = session.mentee.full_name
-                
-                # === MENTOR NOTIFICATION ===
-                mentor_user = session.mentor.user
-                
-                # Create in-app notification for mentor
-                Notification.objects.create(
-                    recipient=mentor_user,
-                    notification_type='session_reminder',
-                    title="Session dans 30 minutes",
-                    message=f"Rappel : Votre session avec {mentee_name} commence à {session_time}. "
-                            f"Durée : {session.duration_minutes} minutes.",
-                    link=video_url,
-                    link_text="Rejoindre la réunion",
-                    related_session=session,
-                    email_sent=True
-                )
-                
-                # Send email to mentor
-                NotificationEmailService.send_session_reminder(
-                    user=mentor_user,
-                    session=session,
-                    video_url=session.whereby_host_room_url or video_url,  # Host URL for mentor
-                    is_mentor=True
-                )
-                
-                logger.info(f"Sent reminder to mentor {mentor_user.email} for session {session.id}")
-                
-                # === MENTEE NOTIFICATION ===
-                mentee_user = session.mentee.user
-                
-                # Create in-app notification for mentee
-                Notification.objects.create(
-                    recipient=mentee_user,
-                    notification_type='session_reminder',
-                    title="Session dans 30 minutes",
-                    message=f"Rappel : Votre session avec {mentor_name} commence à {session_time}. "
-                            f"Durée : {session.duration_minutes} minutes.",
-                    link=video_url,
-                    link_text="Rejoindre la réunion",
-                    related_session=session,
-                    email_sent=True
-                )
-                
-                # Send email to mentee
-                NotificationEmailService.send_session_reminder(
-                    user=mentee_user,
-                    session=session,
-                    video_url=video_url,  # Participant URL for mentee
-                    is_mentor=False
-                )
-                
-                logger.info(f"Sent reminder to mentee {mentee_user.email} for session {session.id}")
-                
-                # Mark session as reminder sent
-                session.reminder_sent = True
-                session.save(update_fields=['reminder_sent'])
-                
-                logger.info(f"Successfully processed reminders for session {session.id}")
-                
-            except Exception as e:
-                logger.error(f"Error sending reminder for session {session.id}: {e}")
-                continue
-                
+        )
+
+        # Last chance for rooms the provisioning job did not create yet,
+        # before the claim so the API calls never hold the session row
+        # locks; sessions still without one are pinned to Jitsi
+        provision_rooms(due.filter(whereby_room_url='', video_fallback=False))
+
+        reminded = 0
+        while True:
+            count = _send_reminder_batch(due, batch_size)
+            reminded += count
+            if count < batch_size:
+                break
+
+        if reminded:
+            logger.info(f"Sent reminders for {reminded} sessions")
+        return reminded
+
     except Exception as e:
-        logger.error(f"Error in check_upcoming_sessions: {e}")
-
-
-def start_scheduler():
-    """Start the background scheduler for sending reminders."""
-    global _scheduler
-    
-    if _scheduler is not None:
-        logger.warning("Scheduler already running")
-        return
-    
-    _scheduler = BackgroundScheduler()
-    
-    # Add job to check for upcoming sessions every minute
-    _scheduler.add_job(
-        check_upcoming_sessions,
-        trigger=IntervalTrigger(minutes=1),
-        id='check_session_reminders',
-        name='Check for sessions needing reminders',
-        replace_existing=True
-    )
-    
-    _scheduler.start()
-    logger.info("Notification scheduler started - checking for session reminders every minute")
-
-
-def stop_scheduler():
-    """Stop the scheduler gracefully."""
-    global _scheduler
-    
-    if _scheduler is not None:
-        _scheduler.shutdown()
-        _scheduler = None
-        logger.info("Notification scheduler stopped")
+        logger.error(f"Error in check_upcoming_sessions: {e}", exc_info=True)
+        return 0
+
+
+def register_jobs(scheduler):
+    """Periodic jobs of the notifications, scheduling and email pipelines (see core/scheduler.py)."""
+    from core.outbox import drain_outbox_job
+    from core.scheduler import add_job
+    from scheduling.lifecycle import sweep_expired_sessions
+    from scheduling.video_rooms import provision_rooms_job
+
+    return [
+        # Check for upcoming sessions every minute
+        add_job(
+            scheduler,
+            check_upcoming_sessions,
+            trigger=IntervalTrigger(minutes=1),
+            id='check_session_reminders',
+            name='Check for sessions needing reminders',
+        ),
+        # Create the video rooms of upcoming sessions ahead of time
+        add_job(
+            scheduler,
+            provision_rooms_job,
+            trigger=IntervalTrigger(minutes=1),
+            id='provision_video_rooms',
+            name='Provision video rooms',
+        ),
+        # Complete sessions whose end time has passed and pay their mentors out
+        add_job(
+            scheduler,
+            sweep_expired_sessions,
+            trigger=IntervalTrigger(minutes=1),
+            id='sweep_expired_sessions',
+            name='Complete expired sessions',
+        ),
+        # Send queued emails over one SMTP connection per run
+        add_job(
+            scheduler,
+            drain_outbox_job,
+            trigger=IntervalTrigger(seconds=10),
+            id='drain_email_outbox',
+            name='Send queued emails',
+            misfire_grace_time=10,
+        ),
+    ]
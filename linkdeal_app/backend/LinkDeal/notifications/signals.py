@@ -0,0 +1,33 @@
+"""
+Keep the unread notification counters current (see notifications/unread.py).
+Queryset updates and bulk_create send no signals: their callers report the
+change themselves.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from notifications.models import Notification
+from notifications.unread import forget_user, notifications_created, unread_changed
+
+
+@receiver(post_save, sender=Notification)
+def count_saved_notification(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        notifications_created([instance])
+    elif update_fields is None:
+        # Unknown change: recompute
+        unread_changed(instance.recipient_id)
+    elif 'is_read' in update_fields:
+        unread_changed(instance.recipient_id, -1 if instance.is_read else 1)
+
+
+@receiver(post_delete, sender=Notification)
+def count_deleted_notification(sender, instance, **kwargs):
+    if not instance.is_read:
+        unread_changed(instance.recipient_id, -1)
+
+
+@receiver(post_delete, sender='accounts.AppUser')
+def forget_deleted_user(sender, instance, **kwargs):
+    """The cached auth0_id -> AppUser id mapping must not outlive the user."""
+    forget_user(instance.auth0_id)
@@ -0,0 +1,220 @@
+import asyncio
+import json
+import time
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import AppUser, MenteeProfile, MentorProfile
+from core.circuit import CircuitBreaker
+from core.models import OutboundEmail
+from notifications import push, unread
+from notifications.apps import check_shared_cache
+from notifications.models import Notification
+from notifications.scheduler import check_upcoming_sessions
+from notifications.views import notification_stream
+from scheduling import video_rooms
+from scheduling.models import Session
+
+
+class SessionReminderTestCase(TestCase):
+    """Due sessions are reminded exactly once, in bulk."""
+
+    def setUp(self):
+        breaker_patch = mock.patch.object(video_rooms, 'whereby_breaker', CircuitBreaker('Whereby'))
+        breaker_patch.start()
+        self.addCleanup(breaker_patch.stop)
+
+        mentee_user = AppUser.objects.create(email='mentee@test.com', role='mentee', auth0_id='auth0|mentee')
+        self.mentee = MenteeProfile.objects.create(
+            user=mentee_user,
+            email=mentee_user.email,
+            full_name='Test Mentee',
+            country='Canada',
+        )
+
+        self.now = timezone.now()
+        # One mentor per session: a mentor cannot hold overlapping sessions
+        self.due = [
+            Session.objects.create(
+                mentor=self._create_mentor(i),
+                mentee=self.mentee,
+                scheduled_at=self.now + timedelta(minutes=30),
+                duration_minutes=60,
+                status='confirmed',
+            )
+            for i in range(3)
+        ]
+        # Outside the reminder window
+        self.later = Session.objects.create(
+            mentor=self._create_mentor(3),
+            mentee=self.mentee,
+            scheduled_at=self.now + timedelta(hours=3),
+            duration_minutes=60,
+            status='confirmed',
+        )
+
+    def _create_mentor(self, i):
+        user = AppUser.objects.create(email=f'mentor{i}@test.com', role='mentor', auth0_id=f'auth0|mentor{i}')
+        return MentorProfile.objects.create(
+            user=user,
+            email=user.email,
+            full_name=f'Mentor {i}',
+            professional_title='Senior Dev',
+            location='Remote',
+            linkedin_url='https://linkedin.com/in/mentor',
+            bio='Great mentor',
+            country='USA',
+            session_rate=Decimal('100.00'),
+        )
+
+    def test_reminders_are_sent_once(self):
+        meeting = {'meetingId': 'm1', 'roomUrl': 'https://whereby.com/r1', 'hostRoomUrl': 'https://whereby.com/r1?host'}
+        with mock.patch('scheduling.services.WherebyService.create_meeting', return_value=meeting) as create:
+            self.assertEqual(check_upcoming_sessions(now=self.now, batch_size=2), 3)
+            self.assertEqual(create.call_count, 3)
+
+            # Already reminded: nothing is claimed again
+            self.assertEqual(check_upcoming_sessions(now=self.now), 0)
+
+        self.assertEqual(Session.objects.filter(reminder_sent=True).count(), 3)
+        self.assertFalse(Session.objects.get(pk=self.later.pk).reminder_sent)
+        self.assertEqual(Notification.objects.filter(notification_type='session_reminder').count(), 6)
+
+        emails = OutboundEmail.objects.all()
+        self.assertEqual(emails.count(), 6)
+        self.assertEqual(emails.filter(recipients=['mentee@test.com']).count(), 3)
+        self.assertEqual(emails.filter(html_body__contains='r1?host').count(), 3)
+
+    def test_rooms_are_provisioned_ahead(self):
+        meeting = {'meetingId': 'm1', 'roomUrl': 'https://whereby.com/r1', 'hostRoomUrl': 'https://whereby.com/r1?host'}
+        with mock.patch('scheduling.services.WherebyService.create_meeting', return_value=meeting) as create:
+            self.assertEqual(video_rooms.provision_upcoming_rooms(now=self.now), 4)
+            # Every session has its room: nothing left to create
+            self.assertEqual(video_rooms.provision_upcoming_rooms(now=self.now), 0)
+            check_upcoming_sessions(now=self.now)
+            self.assertEqual(create.call_count, 4)
+
+    def test_jitsi_fallback_when_whereby_fails(self):
+        with mock.patch('scheduling.services.WherebyService.create_meeting', return_value=None):
+            check_upcoming_sessions(now=self.now)
+
+        session = Session.objects.get(pk=self.due[0].pk)
+        self.assertEqual(session.video_provider, 'jitsi')
+        self.assertTrue(session.video_fallback)
+        self.assertTrue(
+            Notification.objects.filter(related_session=session, link__startswith='https://meet.jit.si/').exists()
+        )
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class UnreadCounterTestCase(SimpleTestCase):
+    """Cached unread counts and their push events."""
+
+    USER_ID = 'b5f7c3c2-6a43-4f0a-9d36-0d6c1f3f4a10'
+
+    def setUp(self):
+        cache.clear()
+        publish_patch = mock.patch.object(push, 'publish')
+        self.publish = publish_patch.start()
+        self.addCleanup(publish_patch.stop)
+
+    def _count_query(self, count):
+        queryset = mock.Mock()
+        queryset.count.return_value = count
+        return mock.patch.object(Notification.objects, 'filter', return_value=queryset)
+
+    def test_count_is_read_through(self):
+        with self._count_query(3) as query:
+            self.assertEqual(unread.get_unread_count(self.USER_ID), 3)
+            self.assertEqual(unread.get_unread_count(self.USER_ID), 3)
+        query.assert_called_once()
+
+    def test_changes_adjust_the_counter_and_push_it(self):
+        with self._count_query(3):
+            unread.get_unread_count(self.USER_ID)
+        unread._apply(self.USER_ID, 2, created=[{'id': 'n1'}])
+        unread._apply(self.USER_ID, -1)
+
+        with self._count_query(0) as query:
+            self.assertEqual(unread.get_unread_count(self.USER_ID), 4)
+        query.assert_not_called()
+        self.assertEqual(self.publish.call_args_list, [
+            mock.call(self.USER_ID, 'notification', {'id': 'n1'}),
+            mock.call(self.USER_ID, 'unread_count', {'count': 5}),
+            mock.call(self.USER_ID, 'unread_count', {'count': 4}),
+        ])
+
+    def test_unknown_change_recomputes(self):
+        with self._count_query(3):
+            unread.get_unread_count(self.USER_ID)
+        with self._count_query(7):
+            unread._apply(self.USER_ID, None)
+            self.assertEqual(unread.get_unread_count(self.USER_ID), 7)
+
+    def test_broker_delivers_to_the_user_streams_only(self):
+        broker = push.Broker()
+
+        async def deliver():
+            with mock.patch.object(push.Broker, '_listen'):
+                mine = broker.subscribe(self.USER_ID)
+                other = broker.subscribe('someone-else')
+            message = {'user': self.USER_ID, 'event': 'unread_count', 'data': {'count': 1}}
+            broker._dispatch(json.dumps(message))
+            received = await asyncio.wait_for(mine[0].get(), 1)
+            broker.unsubscribe(self.USER_ID, mine)
+            broker._dispatch(json.dumps(message))
+            await asyncio.sleep(0)
+            return received, mine[0].empty(), other[0].empty()
+
+        received, mine_empty, other_empty = asyncio.run(deliver())
+        self.assertEqual(received['data'], {'count': 1})
+        self.assertTrue(mine_empty)
+        self.assertTrue(other_empty)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class StreamTicketTestCase(SimpleTestCase):
+    """Stream tickets are signed, short-lived and single-use."""
+
+    USER_ID = 'b5f7c3c2-6a43-4f0a-9d36-0d6c1f3f4a10'
+
+    def setUp(self):
+        cache.clear()
+
+    def test_ticket_is_redeemed_once(self):
+        ticket = push.issue_ticket(self.USER_ID)
+        self.assertEqual(push.redeem_ticket(ticket), self.USER_ID)
+        self.assertIsNone(push.redeem_ticket(ticket))
+
+    def test_tampered_or_expired_ticket(self):
+        ticket = push.issue_ticket(self.USER_ID)
+        self.assertIsNone(push.redeem_ticket(ticket[:-2] + 'xx'))
+
+        issued_at = time.time()
+        with mock.patch('time.time', return_value=issued_at + push.TICKET_TTL + 1):
+            self.assertIsNone(push.redeem_ticket(ticket))
+
+    def test_stream_requires_a_ticket(self):
+        ticket = push.issue_ticket(self.USER_ID)
+        push.redeem_ticket(ticket)
+        request = AsyncRequestFactory().get('/notifications/stream/', {'ticket': ticket})
+        self.assertEqual(asyncio.run(notification_stream(request)).status_code, 401)
+        # Not served by WSGI workers
+        request = RequestFactory().get('/notifications/stream/')
+        self.assertEqual(asyncio.run(notification_stream(request)).status_code, 501)
+
+    def test_workers_require_a_shared_cache(self):
+        with mock.patch.dict('os.environ', {'WEB_CONCURRENCY': '4'}):
+            with self.assertRaises(ImproperlyConfigured):
+                check_shared_cache()
+            redis = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache'}}
+            with override_settings(CACHES=redis):
+                check_shared_cache()
+        with mock.patch.dict('os.environ', {'WEB_CONCURRENCY': '1'}):
+            check_shared_cache()
@@ -0,0 +1,92 @@
+"""
+Per-user unread notification counters.
+
+The count is served from the cache, read through with one COUNT on a
+miss. Notification signals and the bulk paths keep it current: they adjust
+it once their transaction commits. A counter missing from the cache stays
+missing until the next read recomputes it. Counters expire after
+COUNTER_TTL, so one that drifted (an update racing a recompute) corrects
+itself. The cache must be shared by every process (notifications/apps.py).
+
+Every change is also pushed to the user's open streams (notifications/push.py):
+new notifications as `notification` events, counts as `unread_count` events.
+"""
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import transaction
+
+from notifications import push
+
+CACHE_KEY = "notifications:unread:{user_id}"
+USER_ID_KEY = "notifications:user_id:{auth0_id}"
+COUNTER_TTL = 120  # Seconds
+USER_ID_TTL = 60 * 60 * 24
+
+
+def user_id_for(auth0_id):
+    """AppUser id of an Auth0 user, cached (None when not registered)."""
+    from accounts.models import AppUser
+
+    key = USER_ID_KEY.format(auth0_id=auth0_id)
+    user_id = cache.get(key)
+    if user_id is None:
+        user_id = AppUser.objects.filter(auth0_id=auth0_id).values_list("id", flat=True).first()
+        if user_id is not None:
+            cache.set(key, user_id, USER_ID_TTL)
+    return user_id
+
+
+def forget_user(auth0_id):
+    cache.delete(USER_ID_KEY.format(auth0_id=auth0_id))
+
+
+def get_unread_count(user_id):
+    from notifications.models import Notification
+
+    key = CACHE_KEY.format(user_id=user_id)
+    count = cache.get(key)
+    if count is None:
+        count = Notification.objects.filter(recipient_id=user_id, is_read=False).count()
+        cache.add(key, count, COUNTER_TTL)
+    return count
+
+
+def _apply(user_id, delta, created=()):
+    key = CACHE_KEY.format(user_id=user_id)
+    if delta is None:
+        cache.delete(key)
+    elif delta:
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            pass  # Not cached: recomputed on the next read
+
+    for data in created:
+        push.publish(user_id, "notification", data)
+    push.publish(user_id, "unread_count", {"count": get_unread_count(user_id)})
+
+
+def unread_changed(user_id, delta=None):
+    """
+    Once the transaction commits: add delta to the user's cached count
+    (None: the change is unknown, recompute it) and push the new count.
+    """
+    transaction.on_commit(lambda: _apply(user_id, delta))
+
+
+def notifications_created(notifications):
+    """Count and push new notifications once the transaction commits (bulk_create sends no signals)."""
+    from notifications.serializers import NotificationSerializer
+
+    notifications = list(notifications)
+    unread = Counter(notification.recipient_id for notification in notifications if not notification.is_read)
+    created = {}
+    for notification in notifications:
+        created.setdefault(notification.recipient_id, []).append(NotificationSerializer(notification).data)
+
+    def apply():
+        for user_id, data in created.items():
+            _apply(user_id, unread[user_id], data)
+
+    transaction.on_commit(apply)
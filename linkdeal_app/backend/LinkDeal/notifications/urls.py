@@ -16,6 +16,10 @@ urlpatterns = [
     # Unread count
     path('unread-count/', views.NotificationUnreadCountView.as_view(), name='notification-unread-count'),
     
+    # Push: server-sent events of new notifications and unread counts
+    path('stream/', views.notification_stream, name='notification-stream'),
+    path('stream/ticket/', views.NotificationStreamTicketView.as_view(), name='notification-stream-ticket'),
+    
     # Delete
     path('<uuid:pk>/delete/', views.NotificationDeleteView.as_view(), name='notification-delete'),
     path('clear-read/', views.NotificationDeleteAllReadView.as_view(), name='notification-clear-read'),
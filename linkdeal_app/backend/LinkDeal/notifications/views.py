@@ -2,14 +2,23 @@
 Views for the notifications app.
 Handles API endpoints for listing, reading, and managing notifications.
 """
+import asyncio
+import json
 import logging
+from asgiref.sync import sync_to_async
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils import timezone
 
 from accounts.permissions import IsAuthenticatedAuth0
+from core.pagination import KeysetPagination
 from notifications.models import Notification
+from notifications.push import TICKET_TTL, broker, issue_ticket, redeem_ticket
+from notifications.unread import get_unread_count, unread_changed, user_id_for
 from notifications.serializers import (
     NotificationSerializer,
     NotificationDetailSerializer,
@@ -27,19 +36,18 @@ class NotificationListView(generics.ListAPIView):
     Query params:
     - unread_only: true/false - Filter to unread notifications only
     - type: notification_type - Filter by type
+    - page_size, cursor: keyset pagination (see core/pagination.py)
     """
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticatedAuth0]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
-        from accounts.models import AppUser
-        
-        try:
-            user = AppUser.objects.get(auth0_id=self.request.user.auth0_id)
-        except AppUser.DoesNotExist:
+        user_id = user_id_for(self.request.user.auth0_id)
+        if user_id is None:
             return Notification.objects.none()
         
-        queryset = Notification.objects.filter(recipient=user)
+        queryset = Notification.objects.filter(recipient_id=user_id)
         
         # Filter by unread only
         unread_only = self.request.query_params.get('unread_only', 'false').lower() == 'true'
@@ -125,6 +133,8 @@ class NotificationMarkAllReadView(APIView):
             is_read=True,
             read_at=timezone.now()
         )
+        if updated_count:
+            unread_changed(user.id)
         
         return Response({
             'success': True,
@@ -137,23 +147,17 @@ class NotificationUnreadCountView(APIView):
     """
     GET /notifications/unread-count/
     Get the count of unread notifications.
+    Clients holding a notification stream get the count pushed instead.
     """
     permission_classes = [IsAuthenticatedAuth0]
 
     def get(self, request):
-        from accounts.models import AppUser
-        
-        try:
-            user = AppUser.objects.get(auth0_id=request.user.auth0_id)
-        except AppUser.DoesNotExist:
+        # Cached counter (see notifications/unread.py)
+        user_id = user_id_for(request.user.auth0_id)
+        if user_id is None:
             return Response({'count': 0})
         
-        count = Notification.objects.filter(
-            recipient=user,
-            is_read=False
-        ).count()
-        
-        return Response({'count': count})
+        return Response({'count': get_unread_count(user_id)})
 
 
 class NotificationDeleteView(APIView):
@@ -204,3 +208,71 @@ class NotificationDeleteAllReadView(APIView):
             'message': f'{deleted_count} read notifications deleted',
             'count': deleted_count
         })
+
+
+class NotificationStreamTicketView(APIView):
+    """
+    POST /notifications/stream/ticket/
+    Get a short-lived, single-use ticket to open the notification stream
+    with (GET /notifications/stream/?ticket=...).
+    """
+    permission_classes = [IsAuthenticatedAuth0]
+
+    def post(self, request):
+        user_id = user_id_for(request.user.auth0_id)
+        if user_id is None:
+            return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
+        
+        return Response({'ticket': issue_ticket(user_id), 'expires_in': TICKET_TTL})
+
+
+# Seconds between keep-alive comments on an idle stream (proxies drop silent connections)
+STREAM_KEEPALIVE = 15
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+async def notification_stream(request):
+    """
+    GET /notifications/stream/?ticket=...
+    Server-sent events: the unread count on connect, then `notification`
+    and `unread_count` events as they happen (see notifications/push.py).
+    Served by the ASGI app only (the linkdeal-stream service): a WSGI worker
+    would be held by the stream.
+    """
+    if request.method != "GET":
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {'error': 'Notification streams require the ASGI app; poll /notifications/unread-count/ instead'},
+            status=501,
+        )
+
+    ticket = request.GET.get('ticket')
+    user_id = await sync_to_async(redeem_ticket)(ticket) if ticket else None
+    if user_id is None:
+        return JsonResponse({'error': 'Invalid or expired stream ticket.'}, status=401)
+
+    stream = broker.subscribe(user_id)
+    queue = stream[0]
+
+    async def events():
+        try:
+            count = await sync_to_async(get_unread_count)(user_id)
+            yield _sse('unread_count', {'count': count})
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), STREAM_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse(message['event'], message['data'])
+        finally:
+            broker.unsubscribe(user_id, stream)
+
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,284 @@
+"""
+Compiled mentor availability for the public booking calendar.
+
+Instead of expanding every MentorAvailability range and comparing each hour
+against every booked Session on each request, a mentor's availability is
+compiled once into a compact form and cached:
+
+- weekly:    168-bit int, bit (day_of_week * 24 + hour) is set when a
+             recurring rule opens that hour
+- overrides: {date: 24-bit int} for specific-date (non-recurring) rules
+- bookings:  list of (start_ts, end_ts) epoch seconds for active sessions,
+             sorted by start
+
+Slot availability for a day is then a couple of integer mask operations.
+The cached entry is dropped whenever an availability or session row of the
+mentor changes (see scheduling/signals.py).
+"""
+import hashlib
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import DateTimeField, Exists, ExpressionWrapper, F, OuterRef, Q, Value
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "scheduling:availability:{mentor_id}"
+CACHE_TIMEOUT = 60 * 15  # Safety net for updates that bypass signals
+
+HOUR = 3600
+DAY = 24 * HOUR
+DAY_MASK = (1 << 24) - 1
+
+# Booked sessions also block the neighbouring hour on each side to absorb
+# timezone shifts between the booking UI and the server.
+BOOKING_MARGIN = HOUR
+
+# Longest possible session (Session.duration_minutes max validator)
+MAX_SESSION_SECONDS = 480 * 60
+
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def hours_mask(start_time, end_time):
+    """
+    Bitmask of the whole hours opened by a [start_time, end_time) rule.
+    Matches the hourly expansion used by the booking UI (18:00-22:00 opens
+    18, 19, 20 and 21).
+    """
+    start_hour = start_time.hour
+    end_hour = end_time.hour
+    if end_hour <= start_hour:
+        return 0
+    return ((1 << (end_hour - start_hour)) - 1) << start_hour
+
+
+def day_start_timestamp(target_date):
+    """Epoch seconds of midnight (current timezone) for target_date."""
+    return int(timezone.make_aware(datetime.combine(target_date, time.min)).timestamp())
+
+
+class CompiledAvailability:
+    """Bitmap representation of one mentor's availability and bookings."""
+
+    __slots__ = ('weekly', 'overrides', 'booking_starts', 'booking_ends', 'fingerprint')
+
+    def __init__(self, weekly=0, overrides=None, bookings=()):
+        self.weekly = weekly
+        self.overrides = overrides or {}
+        bookings = sorted(bookings)
+        self.booking_starts = [start for start, _ in bookings]
+        self.booking_ends = [end for _, end in bookings]
+        # Content hash, used to build ETags for availability responses
+        self.fingerprint = hashlib.sha1(
+            repr((weekly, sorted(self.overrides.items()), bookings)).encode()
+        ).hexdigest()
+
+    def day_mask(self, target_date):
+        """24-bit mask of the hours opened on target_date."""
+        weekly = (self.weekly >> (target_date.weekday() * 24)) & DAY_MASK
+        return weekly | self.overrides.get(target_date, 0)
+
+    def blocked_mask(self, day_start):
+        """
+        24-bit mask of the hours blocked by bookings on the day starting at
+        day_start (epoch seconds), plus {hour: blocking booking end}.
+        """
+        day_end = day_start + DAY
+        lo = bisect_right(self.booking_starts, day_start - BOOKING_MARGIN - MAX_SESSION_SECONDS)
+        hi = bisect_left(self.booking_starts, day_end + BOOKING_MARGIN)
+
+        blocked = 0
+        booked_until = {}
+        for i in range(lo, hi):
+            start = self.booking_starts[i] - BOOKING_MARGIN - day_start
+            end = self.booking_ends[i] + BOOKING_MARGIN - day_start
+            first = max(start // HOUR, 0)
+            last = min(-(-end // HOUR), 24)
+            if last <= first:
+                continue
+            mask = ((1 << (last - first)) - 1) << first
+            new_bits = mask & ~blocked
+            blocked |= mask
+            while new_bits:
+                bit = new_bits & -new_bits
+                booked_until[bit.bit_length() - 1] = self.booking_ends[i]
+                new_bits ^= bit
+        return blocked, booked_until
+
+    def day_summary(self, target_date):
+        """(total_slots, available_slots) for target_date, without building slots."""
+        opened = self.day_mask(target_date)
+        if not opened:
+            return 0, 0
+        blocked, _ = self.blocked_mask(day_start_timestamp(target_date))
+        return opened.bit_count(), (opened & ~blocked).bit_count()
+
+    def slots_for_date(self, target_date):
+        """Hourly slots for target_date, in the public availability format."""
+        opened = self.day_mask(target_date)
+        if not opened:
+            return []
+
+        blocked, booked_until = self.blocked_mask(day_start_timestamp(target_date))
+        day_of_week = target_date.weekday()
+        day_name = DAY_NAMES[day_of_week]
+
+        slots = []
+        remaining = opened
+        while remaining:
+            bit = remaining & -remaining
+            hour = bit.bit_length() - 1
+            remaining ^= bit
+            until = booked_until.get(hour)
+            slots.append({
+                'day_of_week': day_of_week,
+                'day_name': day_name,
+                'start_time': f'{hour:02d}:00',
+                'end_time': f'{hour + 1:02d}:00',
+                'is_available': not blocked & bit,
+                'booked_until': (
+                    datetime.fromtimestamp(until, tz=dt_timezone.utc).strftime('%H:%M')
+                    if until is not None else None
+                ),
+            })
+        return slots
+
+
+def find_overlapping_slots(slots):
+    """
+    Return (index_a, index_b) pairs of availability slots that overlap.
+
+    slots is a list of dicts with day_of_week/start_time/end_time/
+    is_recurring/specific_date. Recurring slots are compared per weekday and
+    specific-date slots per date. Each group is sorted by start time and
+    swept once, keeping the slot that reaches furthest so far, which makes
+    the check O(n log n) instead of comparing every pair.
+    """
+    groups = {}
+    for index, slot in enumerate(slots):
+        if slot.get('is_recurring', True):
+            key = ('weekly', slot['day_of_week'])
+        else:
+            key = ('date', slot.get('specific_date'))
+        groups.setdefault(key, []).append((slot['start_time'], slot['end_time'], index))
+
+    overlaps = []
+    for entries in groups.values():
+        entries.sort()
+        latest_end, latest_index = None, None
+        for start_time, end_time, index in entries:
+            if latest_end is not None and start_time < latest_end:
+                overlaps.append((latest_index, index))
+            if latest_end is None or end_time > latest_end:
+                latest_end, latest_index = end_time, index
+    return overlaps
+
+
+def compile_availability(mentor_id):
+    """Build the CompiledAvailability of a mentor from the database."""
+    from scheduling.models import MentorAvailability, Session
+
+    weekly = 0
+    overrides = {}
+    rules = MentorAvailability.objects.filter(
+        mentor_id=mentor_id,
+        is_available=True
+    ).values_list('day_of_week', 'start_time', 'end_time', 'is_recurring', 'specific_date')
+
+    for day_of_week, start_time, end_time, is_recurring, specific_date in rules:
+        mask = hours_mask(start_time, end_time)
+        if is_recurring:
+            weekly |= mask << (day_of_week * 24)
+        elif specific_date:
+            overrides[specific_date] = overrides.get(specific_date, 0) | mask
+
+    bookings = []
+    sessions = Session.objects.filter(
+        mentor_id=mentor_id,
+        status__in=Session.ACTIVE_STATUSES
+    ).values_list('scheduled_at', 'duration_minutes')
+
+    for scheduled_at, duration_minutes in sessions:
+        start = int(scheduled_at.timestamp())
+        bookings.append((start, start + duration_minutes * 60))
+
+    return CompiledAvailability(weekly, overrides, bookings)
+
+
+def filter_free_mentors(queryset, window_start, window_end):
+    """
+    Restrict a MentorProfile queryset to mentors free for the whole
+    [window_start, window_end) window, which must lie within one day:
+    every hour the window touches is opened by an availability rule, and no
+    active session overlaps it (with BOOKING_MARGIN on each side).
+
+    Stays a single SQL query (correlated EXISTS per hour + NOT EXISTS on
+    bookings), served by the partial indexes on MentorAvailability and Session.
+    """
+    from scheduling.models import MentorAvailability, Session
+
+    local_start = timezone.localtime(window_start)
+    local_end = timezone.localtime(window_end)
+    target_date = local_start.date()
+    first_hour = local_start.hour
+    if local_end.date() > target_date:
+        last_hour = 24  # Window ends at midnight
+    else:
+        last_hour = local_end.hour + (1 if local_end.time() > time(local_end.hour) else 0)
+
+    day_rules = Q(is_recurring=True, day_of_week=target_date.weekday()) | Q(
+        is_recurring=False, specific_date=target_date
+    )
+    for hour in range(first_hour, last_hour):
+        if hour >= 23:
+            # Rules open whole hours before end_time.hour, so 23:00 is never bookable
+            return queryset.none()
+        next_hour = time(hour + 1)
+        queryset = queryset.filter(Exists(
+            MentorAvailability.objects.filter(
+                day_rules,
+                mentor=OuterRef('pk'),
+                is_available=True,
+                start_time__lt=next_hour,
+                end_time__gte=next_hour,
+            )
+        ))
+
+    margin = timedelta(seconds=BOOKING_MARGIN)
+    bookings = Session.objects.filter(
+        mentor=OuterRef('pk'),
+        status__in=Session.ACTIVE_STATUSES,
+        scheduled_at__lt=window_end + margin,
+        scheduled_at__gt=window_start - margin - timedelta(seconds=MAX_SESSION_SECONDS),
+    ).annotate(
+        ends_at=ExpressionWrapper(
+            F('scheduled_at') + F('duration_minutes') * Value(timedelta(minutes=1)),
+            output_field=DateTimeField()
+        )
+    ).filter(ends_at__gt=window_start - margin)
+
+    return queryset.filter(~Exists(bookings))
+
+
+def get_compiled_availability(mentor_id):
+    """Return the cached CompiledAvailability of a mentor, compiling it on a miss."""
+    key = CACHE_KEY.format(mentor_id=mentor_id)
+    compiled = cache.get(key)
+    if compiled is None:
+        compiled = compile_availability(mentor_id)
+        cache.set(key, compiled, CACHE_TIMEOUT)
+    return compiled
+
+
+def invalidate_availability(mentor_id):
+    """
+    Drop the cached availability of a mentor once the current transaction
+    commits, so a concurrent reader cannot re-cache pre-commit data.
+    """
+    key = CACHE_KEY.format(mentor_id=mentor_id)
+    transaction.on_commit(lambda: cache.delete(key))
@@ -0,0 +1,106 @@
+"""
+Local stand-in for the Whereby REST API, for tests and development.
+
+    with FakeWherebyServer() as whereby:
+        with override_settings(WHEREBY_API_URL=whereby.url, WHEREBY_API_KEY='test'):
+            ...
+
+Set `status` to make every call fail with that HTTP status, and `delay`
+(seconds) to make the server slow. `requests` records the (method, path)
+of each request received.
+"""
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body=None):
+        payload = json.dumps(body).encode() if body is not None else b''
+        self.send_response(status)
+        if body is not None:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self, method):
+        fake = self.server.fake
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        with fake.lock:
+            fake.requests.append((method, self.path))
+        if fake.delay:
+            time.sleep(fake.delay)
+        if fake.status:
+            return self._reply(fake.status, {'error': 'fake failure'})
+
+        parts = self.path.rstrip('/').split('/')
+        if method == 'POST' and parts[-1] == 'meetings':
+            meeting_id = uuid.uuid4().hex[:10]
+            room_url = f"https://fake.whereby.com/linkdeal-{meeting_id}"
+            meeting = {
+                'meetingId': meeting_id,
+                'roomUrl': room_url,
+                'hostRoomUrl': f"{room_url}?roomKey=host",
+                'endDate': body.get('endDate') if body else None,
+            }
+            with fake.lock:
+                fake.meetings[meeting_id] = meeting
+            return self._reply(201, meeting)
+
+        meeting_id = parts[-1]
+        with fake.lock:
+            meeting = fake.meetings.get(meeting_id)
+            if meeting is not None and method == 'DELETE':
+                del fake.meetings[meeting_id]
+        if meeting is None:
+            return self._reply(404, {'error': 'Meeting not found'})
+        return self._reply(204) if method == 'DELETE' else self._reply(200, meeting)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+
+class FakeWherebyServer:
+    def __init__(self):
+        self.status = None
+        self.delay = 0
+        self.requests = []
+        self.meetings = {}
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-whereby', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
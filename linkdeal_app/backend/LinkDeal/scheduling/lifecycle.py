@@ -0,0 +1,87 @@
+"""
+Session lifecycle sweeper.
+
+Pending/confirmed sessions whose end time has passed are marked completed
+in a single set-based UPDATE, run periodically by the scheduler instead of
+on every session list request. Mentor payouts for the completed sessions
+are then processed in batches.
+"""
+import logging
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Statuses that are completed automatically once the session has ended
+EXPIRABLE_STATUSES = ('pending', 'confirmed')
+
+
+def complete_expired_sessions(now=None):
+    """
+    Mark every pending/confirmed session that ended before now as completed.
+    Returns the list of (session_id, mentor_id) that were transitioned.
+    """
+    from scheduling.models import Session
+    from scheduling.availability import invalidate_availability
+    from scheduling.stats import invalidate_session_stats, record_bulk_completion
+
+    now = now or timezone.now()
+    table = connection.ops.quote_name(Session._meta.db_table)
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            # The expired subquery locks the rows and keeps their previous
+            # status for the stats update. scheduled_at < now is implied by
+            # the end-time test but can be answered from an index.
+            cursor.execute(
+                f"""
+                UPDATE {table} AS target
+                SET status = 'completed', updated_at = %s
+                FROM (
+                    SELECT id, status
+                    FROM {table}
+                    WHERE status = ANY(%s)
+                      AND scheduled_at < %s
+                      AND scheduled_at + make_interval(mins => duration_minutes) < %s
+                    FOR UPDATE
+                ) AS expired
+                WHERE target.id = expired.id
+                RETURNING target.id, target.mentor_id, target.mentee_id, expired.status,
+                          target.duration_minutes, target.price, target.rating
+                """,
+                [now, list(EXPIRABLE_STATUSES), now, now]
+            )
+            columns = ['id', 'mentor_id', 'mentee_id', 'status', 'duration_minutes', 'price', 'rating']
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        # Bulk UPDATE bypasses the Session signals: completed sessions no
+        # longer hold the mentor's slot and change both participants' stats
+        record_bulk_completion(rows)
+        for mentor_id in {row['mentor_id'] for row in rows}:
+            invalidate_availability(mentor_id)
+            invalidate_session_stats(mentor_id=mentor_id)
+        for mentee_id in {row['mentee_id'] for row in rows}:
+            invalidate_session_stats(mentee_id=mentee_id)
+
+    completed = [(row['id'], row['mentor_id']) for row in rows]
+    return completed
+
+
+def sweep_expired_sessions():
+    """
+    Scheduler job: complete expired sessions, then pay their mentors out.
+    """
+    from billing.payouts import process_session_payouts
+
+    try:
+        completed = complete_expired_sessions()
+        if not completed:
+            return
+
+        logger.info(f"Marked {len(completed)} expired sessions as completed")
+        paid = process_session_payouts(session_id for session_id, _ in completed)
+        if paid:
+            logger.info(f"Processed {paid} payouts for expired sessions")
+    except Exception as e:
+        logger.error(f"Error in sweep_expired_sessions: {e}", exc_info=True)
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from billing.payouts import process_session_payouts
+from scheduling.lifecycle import complete_expired_sessions
+
+
+class Command(BaseCommand):
+    help = "Mark pending/confirmed sessions that have ended as completed and process their payouts."
+
+    def handle(self, *args, **options):
+        completed = complete_expired_sessions()
+        self.stdout.write(f"Marked {len(completed)} expired sessions as completed.")
+
+        if completed:
+            paid = process_session_payouts(session_id for session_id, _ in completed)
+            self.stdout.write(self.style.SUCCESS(f"Processed {paid} payouts."))
@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from scheduling.models import SessionStats
+from scheduling.stats import COUNTER_FIELDS, compute_all_counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-mentor/per-mentee SessionStats rows from raw sessions, reviews and payments, and report drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Only report drift, do not rewrite the stats rows."
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        total_drifted = 0
+
+        for role in ('mentor', 'mentee'):
+            expected = compute_all_counters(role)
+            key = f'{role}_id'
+            existing = {
+                getattr(stats, key): stats
+                for stats in SessionStats.objects.filter(**{f'{key}__isnull': False})
+            }
+
+            to_create = []
+            to_update = []
+            for profile_id in expected.keys() | existing.keys():
+                counters = expected.get(profile_id) or dict.fromkeys(COUNTER_FIELDS, 0)
+                stats = existing.get(profile_id)
+                if stats is None:
+                    to_create.append(SessionStats(**{key: profile_id}, **counters))
+                    continue
+
+                drift = {
+                    field: (getattr(stats, field), value)
+                    for field, value in counters.items()
+                    if getattr(stats, field) != value
+                }
+                if not drift:
+                    continue
+
+                to_update.append(stats)
+                for field, (_, value) in drift.items():
+                    setattr(stats, field, value)
+                if options['verbosity'] >= 2:
+                    details = ', '.join(
+                        f"{field}: {stored} -> {value}" for field, (stored, value) in drift.items()
+                    )
+                    self.stdout.write(f"  {role} {profile_id}: {details}")
+
+            drifted = len(to_update)
+            total_drifted += drifted
+            self.stdout.write(
+                f"{role}s: {len(expected)} with activity, {len(existing)} stats rows, "
+                f"{len(to_create)} missing, {drifted} drifted."
+            )
+
+            if not dry_run:
+                with transaction.atomic():
+                    SessionStats.objects.bulk_create(to_create, batch_size=500)
+                    SessionStats.objects.bulk_update(to_update, COUNTER_FIELDS, batch_size=500)
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING(f"Dry run: {total_drifted} drifted rows left unchanged."))
+        elif total_drifted:
+            self.stdout.write(self.style.WARNING(f"Rebuilt {total_drifted} drifted stats rows."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Session stats are consistent."))
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_mentorprofile_wallet_balance'),
+        ('scheduling', '0002_session_reminder_sent'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mentoravailability',
+            index=models.Index(condition=models.Q(('is_available', True), ('is_recurring', True)), fields=['day_of_week', 'start_time', 'end_time', 'mentor'], name='avail_weekly_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mentoravailability',
+            index=models.Index(condition=models.Q(('is_available', True), ('is_recurring', False)), fields=['specific_date', 'start_time', 'end_time', 'mentor'], name='avail_date_search_idx'),
+        ),
+    ]
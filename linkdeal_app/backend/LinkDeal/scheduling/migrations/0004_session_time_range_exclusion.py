@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:04
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+
+# timestamptz + interval is only STABLE in PostgreSQL (day/month intervals
+# depend on the session time zone). Adding whole minutes is time-zone
+# independent, so this wrapper can safely be declared IMMUTABLE, which
+# generated columns and index expressions require.
+SESSION_RANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION scheduling_session_range(starts_at timestamptz, duration_minutes integer)
+RETURNS tstzrange AS $$
+    SELECT tstzrange(starts_at, starts_at + make_interval(mins => duration_minutes), '[)')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_mentorprofile_wallet_balance'),
+        ('scheduling', '0003_mentoravailability_search_indexes'),
+    ]
+
+    operations = [
+        # Needed for "mentor_id WITH =" inside a GiST exclusion constraint
+        BtreeGistExtension(),
+        migrations.RunSQL(
+            SESSION_RANGE_FUNCTION,
+            reverse_sql="DROP FUNCTION IF EXISTS scheduling_session_range(timestamptz, integer);",
+        ),
+        migrations.AddField(
+            model_name='session',
+            name='time_range',
+            field=models.GeneratedField(db_persist=True, expression=models.Func(models.F('scheduled_at'), models.F('duration_minutes'), function='scheduling_session_range', output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField()), output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField()),
+        ),
+        migrations.AddConstraint(
+            model_name='session',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('status__in', ['pending', 'confirmed', 'in_progress'])), expressions=[('mentor', '='), ('time_range', '&&')], name='session_no_double_booking'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_mentorprofile_wallet_balance'),
+        ('scheduling', '0004_session_time_range_exclusion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['mentor', 'status', 'scheduled_at'], name='session_mentor_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['mentee', 'status', 'scheduled_at'], name='session_mentee_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['mentor', 'scheduled_at'], name='session_mentor_sched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['mentee', 'scheduled_at'], name='session_mentee_sched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'confirmed'])), fields=['scheduled_at'], name='session_open_sched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(condition=models.Q(('reminder_sent', False), ('status__in', ['pending', 'confirmed'])), fields=['scheduled_at'], name='session_reminder_due_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:10
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_mentorprofile_wallet_balance'),
+        ('scheduling', '0005_session_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionStats',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('pending_sessions', models.IntegerField(default=0)),
+                ('confirmed_sessions', models.IntegerField(default=0)),
+                ('in_progress_sessions', models.IntegerField(default=0)),
+                ('completed_sessions', models.IntegerField(default=0)),
+                ('cancelled_sessions', models.IntegerField(default=0)),
+                ('no_show_sessions', models.IntegerField(default=0)),
+                ('completed_minutes', models.IntegerField(default=0)),
+                ('completed_amount', models.DecimalField(decimal_places=2, default=0, help_text='Total price of completed sessions', max_digits=12)),
+                ('earned_amount', models.DecimalField(decimal_places=2, default=0, help_text='Mentor payouts of completed payments for completed sessions', max_digits=12)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('rating_count', models.IntegerField(default=0)),
+                ('review_count', models.IntegerField(default=0)),
+                ('review_rating_sum', models.IntegerField(default=0)),
+                ('reviews_1', models.IntegerField(default=0)),
+                ('reviews_2', models.IntegerField(default=0)),
+                ('reviews_3', models.IntegerField(default=0)),
+                ('reviews_4', models.IntegerField(default=0)),
+                ('reviews_5', models.IntegerField(default=0)),
+                ('featured_reviews', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('mentee', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='session_stats', to='accounts.menteeprofile')),
+                ('mentor', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='session_stats', to='accounts.mentorprofile')),
+            ],
+            options={
+                'verbose_name_plural': 'Session stats',
+                'constraints': [models.CheckConstraint(condition=models.Q(models.Q(('mentee__isnull', True), ('mentor__isnull', False)), models.Q(('mentee__isnull', False), ('mentor__isnull', True)), _connector='OR'), name='session_stats_single_profile')],
+            },
+        ),
+    ]
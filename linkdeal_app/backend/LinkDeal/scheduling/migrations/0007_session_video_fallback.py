@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduling', '0006_session_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='session',
+            name='video_fallback',
+            field=models.BooleanField(default=False, help_text='No Whereby room was ready when the room was first needed; the session stays on Jitsi'),
+        ),
+    ]
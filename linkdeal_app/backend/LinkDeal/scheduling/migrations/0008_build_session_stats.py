@@ -0,0 +1,38 @@
+from django.db import migrations
+
+from scheduling.stats import compute_all_counters
+
+
+def build_session_stats(apps, schema_editor):
+    """
+    Create the SessionStats rows of the profiles that already have sessions
+    or reviews: the public mentor listing only reads these rows, so they
+    must exist before it is served (later changes maintain them).
+    """
+    SessionStats = apps.get_model('scheduling', 'SessionStats')
+    for role in ('mentor', 'mentee'):
+        key = f'{role}_id'
+        existing = set(
+            SessionStats.objects.filter(**{f'{key}__isnull': False}).values_list(key, flat=True)
+        )
+        SessionStats.objects.bulk_create(
+            [
+                SessionStats(**{key: profile_id}, **counters)
+                for profile_id, counters in compute_all_counters(role, apps).items()
+                if profile_id not in existing
+            ],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing', '0003_pagination_indexes'),
+        ('mentoring', '0002_pagination_indexes'),
+        ('scheduling', '0007_session_video_fallback'),
+    ]
+
+    operations = [
+        migrations.RunPython(build_session_stats, migrations.RunPython.noop),
+    ]
@@ -3,6 +3,8 @@ Scheduling models for LinkDeal platform.
 Handles mentor availability, sessions, and video calls.
 """
 from django.db import models
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField, RangeOperators
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 import uuid
@@ -84,6 +86,19 @@ class MentorAvailability(models.Model):
     class Meta:
         ordering = ['day_of_week', 'start_time']
         verbose_name_plural = "Mentor availabilities"
+        indexes = [
+            # Availability search: "who is open on <weekday/date> at <hour>"
+            models.Index(
+                fields=['day_of_week', 'start_time', 'end_time', 'mentor'],
+                condition=models.Q(is_recurring=True, is_available=True),
+                name='avail_weekly_search_idx',
+            ),
+            models.Index(
+                fields=['specific_date', 'start_time', 'end_time', 'mentor'],
+                condition=models.Q(is_recurring=False, is_available=True),
+                name='avail_date_search_idx',
+            ),
+        ]
 
     def __str__(self):
         day = self.get_day_of_week_display()
@@ -114,6 +129,9 @@ class Session(models.Model):
         ('no_show', 'No Show'),
     ]
 
+    # Statuses that hold the mentor's time slot
+    ACTIVE_STATUSES = ['pending', 'confirmed', 'in_progress']
+
     VIDEO_PROVIDERS = [
         ('jitsi', 'Jitsi Meet'),
         ('twilio', 'Twilio Video'),
@@ -150,6 +168,19 @@ class Session(models.Model):
     )
     timezone = models.CharField(max_length=50, default='UTC')
     
+    # [scheduled_at, scheduled_at + duration) maintained by PostgreSQL.
+    # Backs the double-booking exclusion constraint (see Meta.constraints).
+    time_range = models.GeneratedField(
+        expression=models.Func(
+            models.F('scheduled_at'),
+            models.F('duration_minutes'),
+            function='scheduling_session_range',
+            output_field=DateTimeRangeField()
+        ),
+        output_field=DateTimeRangeField(),
+        db_persist=True,
+    )
+    
     # Status
     status = models.CharField(
         max_length=20,
@@ -217,6 +248,10 @@ class Session(models.Model):
         choices=VIDEO_PROVIDERS,
         default='jitsi'
     )
+    video_fallback = models.BooleanField(
+        default=False,
+        help_text="No Whereby room was ready when the room was first needed; the session stays on Jitsi"
+    )
     call_started_at = models.DateTimeField(null=True, blank=True)
     call_ended_at = models.DateTimeField(null=True, blank=True)
     
@@ -263,6 +298,38 @@ class Session(models.Model):
 
     class Meta:
         ordering = ['-scheduled_at']
+        indexes = [
+            # Per-user session lists, stats and date filters
+            # ("my sessions", "my upcoming sessions", from/to ranges)
+            models.Index(fields=['mentor', 'status', 'scheduled_at'], name='session_mentor_status_idx'),
+            models.Index(fields=['mentee', 'status', 'scheduled_at'], name='session_mentee_status_idx'),
+            models.Index(fields=['mentor', 'scheduled_at'], name='session_mentor_sched_idx'),
+            models.Index(fields=['mentee', 'scheduled_at'], name='session_mentee_sched_idx'),
+            # Upcoming/expirable sessions (lifecycle sweeper, booking checks)
+            models.Index(
+                fields=['scheduled_at'],
+                condition=models.Q(status__in=['pending', 'confirmed']),
+                name='session_open_sched_idx',
+            ),
+            # Reminder scan: sessions starting soon that were not reminded yet
+            models.Index(
+                fields=['scheduled_at'],
+                condition=models.Q(status__in=['pending', 'confirmed'], reminder_sent=False),
+                name='session_reminder_due_idx',
+            ),
+        ]
+        constraints = [
+            # A mentor cannot hold two active sessions whose time ranges overlap.
+            # Status list mirrors Session.ACTIVE_STATUSES.
+            ExclusionConstraint(
+                name='session_no_double_booking',
+                expressions=[
+                    ('mentor', RangeOperators.EQUAL),
+                    ('time_range', RangeOperators.OVERLAPS),
+                ],
+                condition=models.Q(status__in=['pending', 'confirmed', 'in_progress']),
+            ),
+        ]
 
     def __str__(self):
         return f"Session: {self.mentor.full_name} with {self.mentee.full_name} on {self.scheduled_at}"
@@ -351,3 +418,106 @@ class SessionAttachment(models.Model):
         if self.file and not self.file_size:
             self.file_size = self.file.size
         super().save(*args, **kwargs)
+
+
+# -------------------------------------------------------------------
+# 5. SESSION STATS MODEL
+# -------------------------------------------------------------------
+
+class SessionStats(models.Model):
+    """
+    All-time session and review counters of one mentor or mentee.
+    Maintained incrementally from Session, Review and Payment changes
+    (see scheduling/stats.py); rebuilt with `manage.py reconcile_session_stats`.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    mentor = models.OneToOneField(
+        'accounts.MentorProfile',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='session_stats'
+    )
+    mentee = models.OneToOneField(
+        'accounts.MenteeProfile',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='session_stats'
+    )
+    
+    # Sessions by status
+    pending_sessions = models.IntegerField(default=0)
+    confirmed_sessions = models.IntegerField(default=0)
+    in_progress_sessions = models.IntegerField(default=0)
+    completed_sessions = models.IntegerField(default=0)
+    cancelled_sessions = models.IntegerField(default=0)
+    no_show_sessions = models.IntegerField(default=0)
+    
+    # Completed sessions
+    completed_minutes = models.IntegerField(default=0)
+    completed_amount = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        help_text="Total price of completed sessions"
+    )
+    earned_amount = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        help_text="Mentor payouts of completed payments for completed sessions"
+    )
+    
+    # Session ratings
+    rating_sum = models.IntegerField(default=0)
+    rating_count = models.IntegerField(default=0)
+    
+    # Approved reviews (mentors only)
+    review_count = models.IntegerField(default=0)
+    review_rating_sum = models.IntegerField(default=0)
+    reviews_1 = models.IntegerField(default=0)
+    reviews_2 = models.IntegerField(default=0)
+    reviews_3 = models.IntegerField(default=0)
+    reviews_4 = models.IntegerField(default=0)
+    reviews_5 = models.IntegerField(default=0)
+    featured_reviews = models.IntegerField(default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Session stats"
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    models.Q(mentor__isnull=False, mentee__isnull=True)
+                    | models.Q(mentor__isnull=True, mentee__isnull=False)
+                ),
+                name='session_stats_single_profile',
+            ),
+        ]
+
+    def __str__(self):
+        profile = self.mentor or self.mentee
+        return f"Session stats: {profile.full_name}"
+
+    @property
+    def total_sessions(self):
+        return (
+            self.pending_sessions + self.confirmed_sessions + self.in_progress_sessions
+            + self.completed_sessions + self.cancelled_sessions + self.no_show_sessions
+        )
+
+    @property
+    def average_rating(self):
+        """Average session rating, or None without ratings."""
+        if not self.rating_count:
+            return None
+        return self.rating_sum / self.rating_count
+
+    @property
+    def average_review_rating(self):
+        """Average approved review rating, or None without reviews."""
+        if not self.review_count:
+            return None
+        return self.review_rating_sum / self.review_count
@@ -4,7 +4,7 @@ Handles serialization/deserialization of session and availability data.
 """
 from rest_framework import serializers
 from django.utils import timezone
-from django.db import transaction
+from django.db import transaction, IntegrityError
 from datetime import timedelta
 
 from scheduling.models import (
@@ -14,6 +14,7 @@ from scheduling.models import (
     SessionAttachment,
 )
 from accounts.models import MentorProfile, MenteeProfile, AppUser
+from core.exceptions import ConflictError
 
 
 # -------------------------------------------------------------------
@@ -82,13 +83,29 @@ class MentorAvailabilitySerializer(serializers.ModelSerializer):
 class MentorAvailabilityCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating multiple availability slots."""
     
+    id = serializers.UUIDField(required=False)
+    
     class Meta:
         model = MentorAvailability
         fields = [
-            'day_of_week', 'start_time', 'end_time',
+            'id', 'day_of_week', 'start_time', 'end_time',
             'is_recurring', 'specific_date', 'is_available'
         ]
 
+    def validate(self, data):
+        """Validate time slots."""
+        if data['start_time'] >= data['end_time']:
+            raise serializers.ValidationError({
+                'end_time': 'End time must be after start time.'
+            })
+        
+        if not data.get('is_recurring', True) and not data.get('specific_date'):
+            raise serializers.ValidationError({
+                'specific_date': 'Non-recurring slots require a specific date.'
+            })
+        
+        return data
+
 
 class PublicMentorAvailabilitySerializer(serializers.ModelSerializer):
     """Public view of mentor availability (for booking)."""
@@ -246,40 +263,6 @@ class SessionCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError('Session must be scheduled in the future.')
         return value
     
-    def validate(self, data):
-        """
-        Check that no other active session exists for this mentor at the requested time.
-        Prevents double booking by detecting time slot overlaps.
-        Uses select_for_update() to prevent race conditions on concurrent bookings.
-        """
-        mentor = data.get('mentor_id')  # This is already validated to MentorProfile
-        scheduled_at = data.get('scheduled_at')
-        duration = data.get('duration_minutes', 60)
-        
-        # Calculate session end time
-        session_end_time = scheduled_at + timedelta(minutes=duration)
-        
-        # Check for overlapping sessions
-        # A session overlaps if:
-        #   - It starts before our session ends, AND
-        #   - It ends after our session starts
-        conflicting_sessions = Session.objects.filter(
-            mentor=mentor,
-            scheduled_at__date=scheduled_at.date(),
-            status__in=['pending', 'confirmed', 'in_progress']
-        )
-        
-        for existing_session in conflicting_sessions:
-            existing_end = existing_session.scheduled_at + timedelta(minutes=existing_session.duration_minutes)
-            
-            # Check overlap: sessions overlap if one starts before the other ends
-            if (scheduled_at < existing_end) and (session_end_time > existing_session.scheduled_at):
-                raise serializers.ValidationError({
-                    'scheduled_at': f"Ce créneau est déjà réservé. Une session existe de {existing_session.scheduled_at.strftime('%H:%M')} à {existing_end.strftime('%H:%M')}."
-                })
-        
-        return data
-    
     @transaction.atomic
     def create(self, validated_data):
         request = self.context.get('request')
@@ -295,13 +278,21 @@ class SessionCreateSerializer(serializers.ModelSerializer):
             except SessionType.DoesNotExist:
                 pass
         
-        session = Session.objects.create(
-            mentor=mentor,
-            mentee=mentee_profile,
-            session_type=session_type,
-            status='pending',
-            **validated_data
-        )
+        # Double booking is prevented by the session_no_double_booking
+        # exclusion constraint, which is race-free under concurrent bookings.
+        try:
+            with transaction.atomic():
+                session = Session.objects.create(
+                    mentor=mentor,
+                    mentee=mentee_profile,
+                    session_type=session_type,
+                    status='pending',
+                    **validated_data
+                )
+        except IntegrityError as e:
+            if 'session_no_double_booking' not in str(e):
+                raise
+            raise ConflictError(self._conflict_message(mentor, validated_data))
         
         # Generate video room ID
         session.generate_video_room_id()
@@ -364,6 +355,23 @@ class SessionCreateSerializer(serializers.ModelSerializer):
         
         return session
 
+    @staticmethod
+    def _conflict_message(mentor, validated_data):
+        """Describe the active session that blocked a booking (failure path only)."""
+        scheduled_at = validated_data['scheduled_at']
+        session_end_time = scheduled_at + timedelta(minutes=validated_data.get('duration_minutes', 60))
+        existing_session = Session.objects.filter(
+            mentor=mentor,
+            status__in=Session.ACTIVE_STATUSES,
+            time_range__overlap=(scheduled_at, session_end_time)
+        ).first()
+        if not existing_session:
+            return "Ce créneau est déjà réservé."
+        return (
+            f"Ce créneau est déjà réservé. Une session existe de "
+            f"{existing_session.scheduled_at.strftime('%H:%M')} à {existing_session.end_time.strftime('%H:%M')}."
+        )
+
 
 class SessionCancelSerializer(serializers.Serializer):
     """Serializer for cancelling a session."""
@@ -1,14 +1,25 @@
 import os
-import requests
 import logging
 from datetime import timedelta
 from django.conf import settings
 
+from core.http import client as http_client
+
 logger = logging.getLogger(__name__)
 
 class WherebyService:
-    BASE_URL = "https://api.whereby.dev/v1"
-    
+    # (connect, read) seconds: a hung API must never hold a worker
+    TIMEOUT = (3.05, 10)
+
+    @classmethod
+    def base_url(cls):
+        return getattr(settings, 'WHEREBY_API_URL', '') or "https://api.whereby.dev/v1"
+
+    @classmethod
+    def http(cls):
+        """Shared keep-alive session (core/http.py), pool sized for the room provisioning workers."""
+        return http_client('whereby', timeout=cls.TIMEOUT, pool_size=16)
+
     @staticmethod
     def get_headers():
         api_key = getattr(settings, 'WHEREBY_API_KEY', '') or os.getenv('WHEREBY_API_KEY', '')
@@ -42,7 +53,7 @@ class WherebyService:
         }
 
         try:
-            response = requests.post(f"{cls.BASE_URL}/meetings", json=payload, headers=headers)
+            response = cls.http().post(f"{cls.base_url()}/meetings", json=payload, headers=headers, timeout=cls.TIMEOUT)
             if response.status_code == 201:
                 data = response.json()
                 logger.info(f"Whereby meeting created: {data.get('meetingId')}")
@@ -64,7 +75,7 @@ class WherebyService:
             return False
 
         try:
-            response = requests.delete(f"{cls.BASE_URL}/meetings/{meeting_id}", headers=headers)
+            response = cls.http().delete(f"{cls.base_url()}/meetings/{meeting_id}", headers=headers, timeout=cls.TIMEOUT)
             if response.status_code == 204:
                 logger.info(f"Whereby meeting deleted: {meeting_id}")
                 return True
@@ -85,7 +96,7 @@ class WherebyService:
             return None
             
         try:
-            response = requests.get(f"{cls.BASE_URL}/meetings/{meeting_id}", headers=headers)
+            response = cls.http().get(f"{cls.base_url()}/meetings/{meeting_id}", headers=headers, timeout=cls.TIMEOUT)
             if response.status_code == 200:
                 return response.json()
             return None
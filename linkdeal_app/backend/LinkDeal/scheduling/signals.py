@@ -0,0 +1,64 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from core import rollups
+from core.tracking import UNTRACKED, current_state, remember_state, take_previous_state
+from mentoring.models import Review
+from scheduling.models import MentorAvailability, Session
+from scheduling.availability import invalidate_availability
+from scheduling import stats
+
+
+@receiver([post_save, post_delete], sender=MentorAvailability)
+def handle_availability_change(sender, instance, **kwargs):
+    """Drop the compiled availability when a mentor's rules change."""
+    invalidate_availability(instance.mentor_id)
+
+
+@receiver(pre_save, sender=Session)
+def remember_session_state(sender, instance, update_fields=None, **kwargs):
+    """Keep the stored values needed to compute the session's stats change."""
+    remember_state(instance, stats.SESSION_FIELDS, update_fields)
+
+
+@receiver(post_save, sender=Session)
+def handle_session_save(sender, instance, **kwargs):
+    previous = take_previous_state(instance)
+    if previous is not UNTRACKED:
+        record_session_change(instance, previous, current_state(instance, stats.SESSION_FIELDS))
+    handle_session_change(instance)
+
+
+@receiver(post_delete, sender=Session)
+def handle_session_delete(sender, instance, **kwargs):
+    record_session_change(instance, current_state(instance, stats.SESSION_FIELDS), None)
+    handle_session_change(instance)
+
+
+def record_session_change(instance, old, new):
+    """Update the participants' stats and the session rollups."""
+    stats.record_session_change(instance.pk, old, new)
+    rollups.record_session_change(old, new)
+
+
+def handle_session_change(instance):
+    """Drop the compiled availability and dashboard stats of both participants."""
+    invalidate_availability(instance.mentor_id)
+    stats.invalidate_session_stats(mentor_id=instance.mentor_id, mentee_id=instance.mentee_id)
+
+
+@receiver(pre_save, sender=Review)
+def remember_review_state(sender, instance, update_fields=None, **kwargs):
+    remember_state(instance, stats.REVIEW_FIELDS, update_fields)
+
+
+@receiver(post_save, sender=Review)
+def handle_review_save(sender, instance, **kwargs):
+    previous = take_previous_state(instance)
+    if previous is not UNTRACKED:
+        stats.record_review_change(previous, current_state(instance, stats.REVIEW_FIELDS))
+
+
+@receiver(post_delete, sender=Review)
+def handle_review_delete(sender, instance, **kwargs):
+    stats.record_review_change(current_state(instance, stats.REVIEW_FIELDS), None)
@@ -0,0 +1,418 @@
+"""
+Per-user session statistics for the mentor/mentee dashboards.
+
+All-time counters (sessions by status, completed minutes and amounts,
+session ratings, approved reviews, earnings) are materialized in the
+SessionStats table, one row per mentor or mentee. Rows are maintained
+incrementally: each Session, Review or Payment change computes the
+difference between the row's old and new contribution and applies it with
+a single F() UPDATE inside the caller's transaction (see
+scheduling/signals.py and billing/signals.py). The rows of the profiles
+that existed before are built by migration 0008_build_session_stats; readers
+that join the table (the public mentor listing) rely on that. A missing row
+is rebuilt from scratch on first use, and `manage.py
+reconcile_session_stats` rebuilds every row and reports drift.
+
+Time-window counters (upcoming, this month) depend on the clock and come
+from one index range query over the profile's sessions since the start of
+the month. The assembled dashboard payload is cached per profile; cached
+entries are dropped whenever a session or payment of the profile changes,
+and expire on their own at the start of the next upcoming session or of
+next month.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.apps import apps as global_apps
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Min, Q, Sum
+from django.utils import timezone
+
+from scheduling.models import Session, SessionStats
+
+CACHE_KEY = "scheduling:session_stats:{role}:{profile_id}"
+CACHE_TIMEOUT = 60 * 15  # Upper bound, for updates that bypass signals
+
+STATUS_FIELDS = {status: f'{status}_sessions' for status, _ in Session.STATUS_CHOICES}
+
+# Fields tracked across saves (core.tracking); also read by core.rollups
+SESSION_FIELDS = (
+    'mentor_id', 'mentee_id', 'status', 'scheduled_at', 'duration_minutes', 'price', 'rating'
+)
+REVIEW_FIELDS = ('mentor_id', 'rating', 'is_approved', 'is_featured')
+PAYMENT_FIELDS = (
+    'mentor_id', 'session_id', 'status', 'amount', 'platform_fee', 'mentor_payout', 'completed_at'
+)
+
+DECIMAL_FIELDS = ('completed_amount', 'earned_amount')
+COUNTER_FIELDS = [
+    *STATUS_FIELDS.values(),
+    'completed_minutes', 'completed_amount', 'earned_amount',
+    'rating_sum', 'rating_count',
+    'review_count', 'review_rating_sum',
+    'reviews_1', 'reviews_2', 'reviews_3', 'reviews_4', 'reviews_5',
+    'featured_reviews',
+]
+
+
+# -------------------------------------------------------------------
+# Contributions of single rows
+# -------------------------------------------------------------------
+
+def session_counters(values, payout=None):
+    """
+    Counters one session adds to its participants' stats, as
+    (mentor_counters, mentee_counters). values holds SESSION_FIELDS;
+    payout is the mentor_payout of the session's completed payment.
+    """
+    counters = {STATUS_FIELDS[values['status']]: 1}
+    if values['status'] == 'completed':
+        counters['completed_minutes'] = values['duration_minutes']
+        counters['completed_amount'] = Decimal(str(values['price'] or 0))
+    if values['rating'] is not None:
+        counters['rating_sum'] = values['rating']
+        counters['rating_count'] = 1
+
+    mentor_counters = dict(counters)
+    if values['status'] == 'completed' and payout:
+        mentor_counters['earned_amount'] = Decimal(str(payout))
+    return mentor_counters, counters
+
+
+def review_counters(values):
+    """Counters one review adds to its mentor's stats (approved reviews only)."""
+    if not values['is_approved']:
+        return {}
+    return {
+        'review_count': 1,
+        'review_rating_sum': values['rating'],
+        f"reviews_{values['rating']}": 1,
+        'featured_reviews': int(values['is_featured']),
+    }
+
+
+def _diff(old, new):
+    delta = {}
+    for field in old.keys() | new.keys():
+        change = new.get(field, 0) - old.get(field, 0)
+        if change:
+            delta[field] = change
+    return delta
+
+
+def _negate(counters):
+    return {field: -value for field, value in counters.items()}
+
+
+# -------------------------------------------------------------------
+# Applying changes
+# -------------------------------------------------------------------
+
+def apply_stats_delta(role, profile_id, delta, rebuild_missing=True):
+    """
+    Add delta to the stats row of a mentor or mentee in one UPDATE.
+    A missing row is rebuilt from the current data instead (which already
+    includes the change), unless rebuild_missing is False: deletions may
+    run while the profile itself is being deleted.
+    """
+    if not delta or not profile_id:
+        return
+    updated = SessionStats.objects.filter(**{f'{role}_id': profile_id}).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + value for field, value in delta.items()}
+    )
+    if not updated and rebuild_missing:
+        rebuild_profile_stats(role, profile_id)
+
+
+def _apply_row_change(role_keys, old, new, counters):
+    """
+    Apply the stats change of one source row going from old to new values
+    (either may be None for creations/deletions). counters(values) returns
+    the counters of the row, one dict per entry of role_keys.
+    """
+    old_counters = counters(old) if old else [{}] * len(role_keys)
+    new_counters = counters(new) if new else [{}] * len(role_keys)
+    for (role, key), old_c, new_c in zip(role_keys, old_counters, new_counters):
+        if old and new and old[key] == new[key]:
+            apply_stats_delta(role, new[key], _diff(old_c, new_c))
+            continue
+        if old:
+            apply_stats_delta(role, old[key], _negate(old_c), rebuild_missing=False)
+        if new:
+            apply_stats_delta(role, new[key], new_c)
+
+
+def _completed_payout(session_id):
+    from billing.models import Payment
+    payout = Payment.objects.filter(
+        session_id=session_id,
+        status='completed'
+    ).values_list('mentor_payout', flat=True).first()
+    return payout or Decimal('0')
+
+
+def record_session_change(session_id, old, new):
+    """
+    Apply the stats change of a session going from old to new values
+    (dicts of SESSION_FIELDS, None on creation/deletion).
+    """
+    payout = None
+    if any(values and values['status'] == 'completed' for values in (old, new)):
+        payout = _completed_payout(session_id)
+
+    _apply_row_change(
+        [('mentor', 'mentor_id'), ('mentee', 'mentee_id')],
+        old, new,
+        lambda values: session_counters(values, payout)
+    )
+
+
+def record_review_change(old, new):
+    """Apply the stats change of a review (dicts of REVIEW_FIELDS) to its mentor."""
+    _apply_row_change(
+        [('mentor', 'mentor_id')],
+        old, new,
+        lambda values: [review_counters(values)]
+    )
+
+
+def record_payment_change(old, new):
+    """
+    Apply the stats change of a payment (dicts of PAYMENT_FIELDS): a
+    completed payment counts towards the mentor's earnings once its session
+    is completed.
+    """
+    session_status = {}
+
+    def counters(values):
+        session_id = values['session_id']
+        if values['status'] != 'completed' or not session_id:
+            return [{}]
+        if session_id not in session_status:
+            session_status[session_id] = Session.objects.filter(
+                pk=session_id
+            ).values_list('status', flat=True).first()
+        if session_status[session_id] != 'completed':
+            return [{}]
+        return [{'earned_amount': Decimal(str(values['mentor_payout'] or 0))}]
+
+    _apply_row_change([('mentor', 'mentor_id')], old, new, counters)
+
+
+def record_bulk_completion(rows):
+    """
+    Apply the stats change of sessions completed by a bulk UPDATE (which
+    bypasses signals). rows are dicts with the session 'id', participants
+    and counted fields, holding the status before the update.
+    """
+    from billing.models import Payment
+
+    payouts = dict(Payment.objects.filter(
+        session_id__in=[row['id'] for row in rows],
+        status='completed'
+    ).values_list('session_id', 'mentor_payout'))
+
+    deltas = {'mentor': defaultdict(dict), 'mentee': defaultdict(dict)}
+    for row in rows:
+        payout = payouts.get(row['id'])
+        old = session_counters(row, payout)
+        new = session_counters({**row, 'status': 'completed'}, payout)
+        for role, old_c, new_c in zip(('mentor', 'mentee'), old, new):
+            profile_delta = deltas[role][row[f'{role}_id']]
+            for field, change in _diff(old_c, new_c).items():
+                profile_delta[field] = profile_delta.get(field, 0) + change
+
+    for role, profiles in deltas.items():
+        for profile_id, delta in profiles.items():
+            apply_stats_delta(role, profile_id, delta)
+
+
+# -------------------------------------------------------------------
+# Rebuilding from scratch
+# -------------------------------------------------------------------
+
+def _session_aggregates():
+    completed = Q(status='completed')
+    aggregates = {
+        field: Count('id', filter=Q(status=status))
+        for status, field in STATUS_FIELDS.items()
+    }
+    aggregates.update(
+        completed_minutes=Sum('duration_minutes', filter=completed),
+        completed_amount=Sum('price', filter=completed),
+        rating_sum=Sum('rating'),
+        rating_count=Count('rating'),
+    )
+    return aggregates
+
+
+def _review_aggregates():
+    aggregates = {
+        f'reviews_{rating}': Count('id', filter=Q(rating=rating))
+        for rating in range(1, 6)
+    }
+    aggregates.update(
+        review_count=Count('id'),
+        review_rating_sum=Sum('rating'),
+        featured_reviews=Count('id', filter=Q(is_featured=True)),
+    )
+    return aggregates
+
+
+def _earned_payments(payment_model=None):
+    if payment_model is None:
+        from billing.models import Payment as payment_model
+    return payment_model.objects.filter(status='completed', session__status='completed')
+
+
+def _clean(values):
+    """Replace the NULLs of empty sums by zero."""
+    return {
+        field: values.get(field) or (Decimal('0') if field in DECIMAL_FIELDS else 0)
+        for field in COUNTER_FIELDS
+    }
+
+
+def compute_profile_counters(role, profile_id):
+    """All-time counters of one mentor or mentee, computed from raw rows."""
+    from mentoring.models import Review
+
+    lookup = {f'{role}_id': profile_id}
+    values = Session.objects.filter(**lookup).aggregate(**_session_aggregates())
+    if role == 'mentor':
+        values.update(Review.objects.filter(
+            is_approved=True, **lookup
+        ).aggregate(**_review_aggregates()))
+        values['earned_amount'] = _earned_payments().filter(
+            **lookup
+        ).aggregate(total=Sum('mentor_payout'))['total']
+    return _clean(values)
+
+
+def compute_all_counters(role, apps=global_apps):
+    """
+    {profile_id: counters} for every mentor or mentee with sessions or
+    reviews. apps is the model registry (a migration's historical models
+    when called from one).
+    """
+    key = f'{role}_id'
+    counters = defaultdict(dict)
+    # order_by() drops the models' default ordering from the GROUP BY
+    sessions = apps.get_model('scheduling', 'Session').objects.order_by().values(key)
+    for row in sessions.annotate(**_session_aggregates()):
+        counters[row.pop(key)].update(row)
+    if role == 'mentor':
+        reviews = apps.get_model('mentoring', 'Review').objects.filter(is_approved=True).order_by().values(key)
+        for row in reviews.annotate(**_review_aggregates()):
+            counters[row.pop(key)].update(row)
+        payments = _earned_payments(apps.get_model('billing', 'Payment')).order_by().values(key)
+        for row in payments.annotate(earned_amount=Sum('mentor_payout')):
+            counters[row.pop(key)].update(row)
+    return {profile_id: _clean(values) for profile_id, values in counters.items()}
+
+
+def rebuild_profile_stats(role, profile_id):
+    """Recompute the stats row of a mentor or mentee from raw rows."""
+    counters = compute_profile_counters(role, profile_id)
+    with transaction.atomic():
+        stats, _ = SessionStats.objects.update_or_create(
+            **{f'{role}_id': profile_id},
+            defaults=counters
+        )
+    return stats
+
+
+def get_profile_stats(role, profile_id):
+    """Return the SessionStats row of a mentor or mentee, building it if missing."""
+    stats = SessionStats.objects.filter(**{f'{role}_id': profile_id}).first()
+    if stats is None:
+        stats = rebuild_profile_stats(role, profile_id)
+    return stats
+
+
+# -------------------------------------------------------------------
+# Dashboard payload
+# -------------------------------------------------------------------
+
+def compute_session_stats(role, profile, now=None):
+    """
+    Build the SessionStatsView payload of a mentor or mentee.
+
+    For mentors, total_earned is the sum of their completed payouts; for
+    mentees it is the total price of their completed sessions.
+    Returns (data, seconds until the data goes stale on its own).
+    """
+    now = now or timezone.now()
+    this_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if this_month_start.month == 12:
+        next_month_start = this_month_start.replace(year=now.year + 1, month=1)
+    else:
+        next_month_start = this_month_start.replace(month=now.month + 1)
+
+    stats = get_profile_stats(role, profile.id)
+
+    # Upcoming sessions all start after the beginning of the month, so one
+    # range scan over this month's sessions covers both windows.
+    upcoming = Q(scheduled_at__gt=now, status__in=['pending', 'confirmed'])
+    this_month = Q(status='completed')
+    window = Session.objects.filter(
+        scheduled_at__gte=this_month_start,
+        **{role: profile}
+    ).aggregate(
+        upcoming=Count('id', filter=upcoming),
+        next_upcoming=Min('scheduled_at', filter=upcoming),
+        this_month_count=Count('id', filter=this_month),
+        this_month_minutes=Sum('duration_minutes', filter=this_month),
+    )
+
+    if role == 'mentor':
+        # Mentor's share after platform fee, for sessions that took place
+        total_earned = stats.earned_amount
+    else:
+        # For mentees, show how much they've paid
+        total_earned = stats.completed_amount
+
+    avg_rating = stats.average_rating
+    data = {
+        'total_sessions': stats.total_sessions,
+        'completed_sessions': stats.completed_sessions,
+        'upcoming_sessions': window['upcoming'],
+        'cancelled_sessions': stats.cancelled_sessions,
+        'total_hours': round(Decimal(stats.completed_minutes) / 60, 1),
+        'this_month_sessions': window['this_month_count'],
+        'this_month_hours': round(Decimal(window['this_month_minutes'] or 0) / 60, 1),
+        'average_rating': round(avg_rating, 1) if avg_rating else None,
+        'total_earned': total_earned,
+    }
+
+    expires_at = next_month_start
+    if window['next_upcoming'] and window['next_upcoming'] < expires_at:
+        expires_at = window['next_upcoming']
+    timeout = max(1, min(CACHE_TIMEOUT, int((expires_at - now).total_seconds())))
+    return data, timeout
+
+
+def get_session_stats(role, profile):
+    """
+    Return the cached stats of a mentor or mentee profile, computing them
+    on a miss. role is 'mentor' or 'mentee'.
+    """
+    key = CACHE_KEY.format(role=role, profile_id=profile.id)
+    data = cache.get(key)
+    if data is None:
+        data, timeout = compute_session_stats(role, profile)
+        cache.set(key, data, timeout)
+    return data
+
+
+def invalidate_session_stats(mentor_id=None, mentee_id=None):
+    """Drop cached stats of the given profiles once the transaction commits."""
+    keys = []
+    if mentor_id:
+        keys.append(CACHE_KEY.format(role='mentor', profile_id=mentor_id))
+    if mentee_id:
+        keys.append(CACHE_KEY.format(role='mentee', profile_id=mentee_id))
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
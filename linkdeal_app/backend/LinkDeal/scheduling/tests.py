@@ -1,3 +1,453 @@
-from django.test import TestCase
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import AppUser, MenteeProfile, MentorProfile
+from core.authentication import Auth0User
+from core.circuit import CircuitBreaker
+from notifications.scheduler import REMINDER_BATCH_SIZE, REMINDER_WINDOW
+from scheduling import views
+from scheduling import video_rooms
+from scheduling.availability import CompiledAvailability, find_overlapping_slots, hours_mask
+from scheduling.fake_whereby import FakeWherebyServer
+from scheduling.models import MentorAvailability, Session
+from scheduling.services import WherebyService
+from scheduling.stats import review_counters, session_counters
+
+
+def ts(year, month, day, hour, minute=0):
+    return int(datetime(year, month, day, hour, minute, tzinfo=dt_timezone.utc).timestamp())
+
+
+def create_mentor(i, **fields):
+    user = AppUser.objects.create(email=f'mentor{i}@test.com', role='mentor', auth0_id=f'auth0|mentor{i}')
+    return MentorProfile.objects.create(
+        user=user,
+        email=user.email,
+        full_name=f'Mentor {i}',
+        professional_title='Senior Dev',
+        location='Remote',
+        linkedin_url='https://linkedin.com/in/mentor',
+        bio='Great mentor',
+        country='USA',
+        session_rate=Decimal('100.00'),
+        **fields,
+    )
+
+
+def auth0_user(user):
+    """Authenticated request user of an AppUser."""
+    ns = getattr(settings, 'AUTH0_CUSTOM_NAMESPACE', 'https://linkdeal.com/claims/')
+    return Auth0User({
+        'sub': user.auth0_id,
+        'email': user.email,
+        'email_verified': True,
+        f'{ns}roles': [user.role],
+    })
+
+
+def create_mentee(i):
+    user = AppUser.objects.create(email=f'mentee{i}@test.com', role='mentee', auth0_id=f'auth0|mentee{i}')
+    return MenteeProfile.objects.create(
+        user=user,
+        email=user.email,
+        full_name=f'Mentee {i}',
+        country='Canada',
+    )
+
+
+class CompiledAvailabilityTestCase(SimpleTestCase):
+    def setUp(self):
+        # Tuesdays 18:00-22:00 plus a one-off Wednesday 09:00-11:00
+        self.tuesday = date(2026, 10, 20)
+        self.wednesday = date(2026, 10, 21)
+        weekly = hours_mask(time(18), time(22)) << (self.tuesday.weekday() * 24)
+        overrides = {self.wednesday: hours_mask(time(9), time(11))}
+        bookings = [(ts(2026, 10, 20, 19), ts(2026, 10, 20, 19, 30))]
+        self.compiled = CompiledAvailability(weekly, overrides, bookings)
+
+    def test_hours_mask(self):
+        self.assertEqual(hours_mask(time(18), time(22)), 0b1111 << 18)
+        self.assertEqual(hours_mask(time(18, 30), time(20)), 0b11 << 18)
+        self.assertEqual(hours_mask(time(20), time(18)), 0)
+
+    def test_recurring_slots_with_booking_margin(self):
+        slots = self.compiled.slots_for_date(self.tuesday)
+
+        self.assertEqual([s['start_time'] for s in slots], ['18:00', '19:00', '20:00', '21:00'])
+        # 19:00-19:30 booking blocks 18:00-20:59 once the +/-1h margin is applied
+        self.assertEqual([s['is_available'] for s in slots], [False, False, False, True])
+        self.assertEqual(slots[0]['booked_until'], '19:30')
+        self.assertIsNone(slots[3]['booked_until'])
+        self.assertEqual(slots[0]['day_name'], 'Tuesday')
+
+    def test_specific_date_override(self):
+        slots = self.compiled.slots_for_date(self.wednesday)
+
+        self.assertEqual([s['start_time'] for s in slots], ['09:00', '10:00'])
+        self.assertTrue(all(s['is_available'] for s in slots))
+
+    def test_day_without_rules(self):
+        self.assertEqual(self.compiled.slots_for_date(date(2026, 10, 22)), [])
+
+    def test_day_summary_matches_slots(self):
+        for day in (self.tuesday, self.wednesday, date(2026, 10, 22)):
+            slots = self.compiled.slots_for_date(day)
+            self.assertEqual(
+                self.compiled.day_summary(day),
+                (len(slots), sum(1 for s in slots if s['is_available']))
+            )
+
+
+class FindOverlappingSlotsTestCase(SimpleTestCase):
+    def slot(self, day, start, end, specific_date=None):
+        return {
+            'day_of_week': day,
+            'start_time': time(start),
+            'end_time': time(end),
+            'is_recurring': specific_date is None,
+            'specific_date': specific_date,
+        }
+
+    def test_adjacent_slots_do_not_overlap(self):
+        slots = [self.slot(0, 9, 10), self.slot(0, 10, 11), self.slot(1, 9, 10)]
+        self.assertEqual(find_overlapping_slots(slots), [])
+
+    def test_overlaps_are_reported_per_day(self):
+        slots = [
+            self.slot(0, 14, 16),
+            self.slot(0, 9, 18),
+            self.slot(1, 15, 17),
+            self.slot(0, 17, 19),
+        ]
+        self.assertEqual(sorted(find_overlapping_slots(slots)), [(1, 0), (1, 3)])
+
+    def test_specific_dates_are_separate_from_weekly_rules(self):
+        day = date(2026, 10, 19)
+        slots = [self.slot(0, 9, 12), self.slot(0, 10, 11, specific_date=day)]
+        self.assertEqual(find_overlapping_slots(slots), [])
+        slots.append(self.slot(0, 10, 12, specific_date=day))
+        self.assertEqual(find_overlapping_slots(slots), [(1, 2)])
+
+
+class SessionCountersTestCase(SimpleTestCase):
+    def session(self, **values):
+        return {
+            'mentor_id': 1, 'mentee_id': 2, 'status': 'pending',
+            'duration_minutes': 90, 'price': Decimal('150.00'), 'rating': None,
+            **values
+        }
+
+    def test_pending_session(self):
+        mentor, mentee = session_counters(self.session(), payout=Decimal('135.00'))
+        self.assertEqual(mentor, {'pending_sessions': 1})
+        self.assertEqual(mentee, {'pending_sessions': 1})
+
+    def test_completed_rated_session(self):
+        mentor, mentee = session_counters(self.session(status='completed', rating=4), payout=Decimal('135.00'))
+        self.assertEqual(mentee, {
+            'completed_sessions': 1,
+            'completed_minutes': 90,
+            'completed_amount': Decimal('150.00'),
+            'rating_sum': 4,
+            'rating_count': 1,
+        })
+        self.assertEqual(mentor, {**mentee, 'earned_amount': Decimal('135.00')})
+
+    def test_review_counters(self):
+        review = {'mentor_id': 1, 'rating': 5, 'is_approved': True, 'is_featured': True}
+        self.assertEqual(review_counters(review), {
+            'review_count': 1, 'review_rating_sum': 5, 'reviews_5': 1, 'featured_reviews': 1,
+        })
+        self.assertEqual(review_counters({**review, 'is_approved': False}), {})
+
+
+class WherebyClientTestCase(SimpleTestCase):
+    """WherebyService and room creation against the local fake API."""
+
+    def setUp(self):
+        self.whereby = FakeWherebyServer().start()
+        self.addCleanup(self.whereby.stop)
+        settings_override = override_settings(WHEREBY_API_URL=self.whereby.url, WHEREBY_API_KEY='test')
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.breaker = CircuitBreaker('Whereby', failure_threshold=3, reset_timeout=60)
+        breaker_patch = mock.patch.object(video_rooms, 'whereby_breaker', self.breaker)
+        breaker_patch.start()
+        self.addCleanup(breaker_patch.stop)
+        self.session = Session(scheduled_at=timezone.now() + timedelta(hours=2), duration_minutes=60)
+
+    def test_create_and_delete_meeting(self):
+        meeting = WherebyService.create_meeting(self.session)
+        self.assertIn(meeting['meetingId'], self.whereby.meetings)
+        self.assertTrue(meeting['hostRoomUrl'].startswith(meeting['roomUrl']))
+
+        self.assertTrue(WherebyService.delete_meeting(meeting['meetingId']))
+        self.assertEqual(self.whereby.meetings, {})
+
+    def test_slow_api_times_out(self):
+        self.whereby.delay = 1
+        with mock.patch.object(WherebyService, 'TIMEOUT', (0.5, 0.2)):
+            self.assertIsNone(WherebyService.create_meeting(self.session))
+
+    def test_circuit_opens_after_failures(self):
+        self.whereby.status = 503
+        for _ in range(3):
+            self.assertIsNone(video_rooms._create_meeting(self.session))
+        self.assertTrue(self.breaker.is_open)
+
+        # Open circuit: no further calls reach the API
+        self.assertIsNone(video_rooms._create_meeting(self.session))
+        self.assertEqual(video_rooms.provision_rooms([self.session]), 0)
+        self.assertEqual(len(self.whereby.requests), 3)
+
+
+class SessionQueryPlanTestCase(TestCase):
+    """
+    Hot Session queries must be answerable from an index.
+
+    Sequential scans are disabled for the test transaction, so PostgreSQL
+    picks some index (the primary or foreign key one at worst) for every
+    query: each plan is checked for the index meant to serve it.
+    """
+
+    def setUp(self):
+        self.mentors = [create_mentor(i) for i in range(5)]
+        self.mentees = [create_mentee(i) for i in range(5)]
+
+        now = timezone.now()
+        statuses = ['pending', 'confirmed', 'completed', 'cancelled']
+        sessions = []
+        for m, mentor in enumerate(self.mentors):
+            for i in range(200):
+                sessions.append(Session(
+                    mentor=mentor,
+                    mentee=self.mentees[(m + i) % len(self.mentees)],
+                    scheduled_at=now + timedelta(hours=2 * i - 200),
+                    duration_minutes=60,
+                    status=statuses[i % len(statuses)],
+                    price=Decimal('100.00'),
+                ))
+        Session.objects.bulk_create(sessions)
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE scheduling_session')
+            cursor.execute('ANALYZE core_metricbucket')
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def _session_queries(self, view, profile, params=None, table='scheduling_session'):
+        """Run view as the profile's user and return the SQL hitting table."""
+        request = APIRequestFactory().get('/', params or {})
+        force_authenticate(request, user=auth0_user(profile.user))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = view.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+
+        queries = [q['sql'] for q in ctx.captured_queries if f'"{table}"' in q['sql']]
+        self.assertTrue(queries)
+        return queries
+
+    def assertUsesIndex(self, sql, params=None, *, indexes, table='scheduling_session'):
+        """The plan of sql reads table through one of the named indexes."""
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN {sql}', params)
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+        self.assertNotIn(f'Seq Scan on {table}', plan, msg=f'{sql}\n{plan}')
+        self.assertTrue(any(index in plan for index in indexes), msg=f'None of {indexes} in:\n{sql}\n{plan}')
+
+    def test_session_list(self):
+        today = timezone.localdate()
+        for side, profile in (('mentor', self.mentors[0]), ('mentee', self.mentees[0])):
+            for params, indexes in (
+                ({}, ['sched']),
+                ({'status': 'upcoming'}, ['status', 'sched']),
+                ({'status': 'completed'}, ['status']),
+                ({'from': str(today - timedelta(days=3)), 'to': str(today)}, ['sched', 'status']),
+            ):
+                indexes = [f'session_{side}_{name}_idx' for name in indexes]
+                with self.subTest(side=side, **params):
+                    for sql in self._session_queries(views.SessionListView, profile, params):
+                        self.assertUsesIndex(sql, indexes=indexes)
+
+    def test_session_stats(self):
+        for side, profile in (('mentor', self.mentors[0]), ('mentee', self.mentees[0])):
+            with self.subTest(side=side):
+                # This month's sessions; the totals come from SessionStats
+                for sql in self._session_queries(views.SessionStatsView, profile):
+                    self.assertUsesIndex(
+                        sql, indexes=[f'session_{side}_sched_idx', f'session_{side}_status_idx']
+                    )
+
+    def test_session_chart(self):
+        for period in ('day', 'week', 'month', 'year'):
+            with self.subTest(period=period):
+                # Served from the rollup buckets, not from scheduling_session
+                queries = self._session_queries(
+                    views.SessionChartView, self.mentors[0], {'period': period}, table='core_metricbucket'
+                )
+                for sql in queries:
+                    self.assertUsesIndex(sql, indexes=['metric_bucket_unique'], table='core_metricbucket')
+
+    def test_reminder_scan(self):
+        # Same shape as the batch claim of notifications.scheduler._send_reminder_batch
+        now = timezone.now()
+        due = Session.objects.filter(
+            scheduled_at__gte=now + REMINDER_WINDOW[0],
+            scheduled_at__lte=now + REMINDER_WINDOW[1],
+            status__in=['pending', 'confirmed'],
+            reminder_sent=False
+        )
+        claim = due.select_for_update(skip_locked=True, of=('self',)).select_related(
+            'mentor__user', 'mentee__user'
+        ).order_by('scheduled_at')[:REMINDER_BATCH_SIZE]
+        self.assertUsesIndex(*claim.query.sql_with_params(), indexes=['session_reminder_due_idx'])
+
+class MentorAvailabilitySearchTestCase(TestCase):
+    """Mentors free for a whole window, from rules and bookings in one query."""
+
+    def setUp(self):
+        self.day = timezone.localdate() + timedelta(days=7)
+        self.mentee = create_mentee(0)
+
+    def _mentor(self, i, *rules):
+        mentor = create_mentor(i, status='approved')
+        for start, end, specific_date in rules:
+            MentorAvailability.objects.create(
+                mentor=mentor,
+                day_of_week=self.day.weekday(),
+                start_time=time(start),
+                end_time=time(end),
+                is_recurring=specific_date is None,
+                specific_date=specific_date,
+            )
+        return mentor
+
+    def _search(self, **params):
+        request = APIRequestFactory().get('/', {'date': self.day.isoformat(), **params})
+        response = views.MentorAvailabilitySearchView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        return {mentor['id'] for mentor in response.data}
+
+    def test_weekly_rule_without_booking(self):
+        free = self._mentor(0, (9, 12, None))
+        self._mentor(1, (13, 17, None))  # Rule outside the window
+
+        self.assertEqual(self._search(start='10:00', end='11:00'), {str(free.id)})
+
+    def test_overlapping_booking_excludes_mentor(self):
+        free = self._mentor(0, (9, 17, None))
+        booked = self._mentor(1, (9, 17, None))
+        Session.objects.create(
+            mentor=booked,
+            mentee=self.mentee,
+            scheduled_at=timezone.make_aware(datetime.combine(self.day, time(10, 30))),
+            duration_minutes=30,
+            status='confirmed',
+            price=Decimal('100.00'),
+        )
+
+        self.assertEqual(self._search(start='10:00', end='11:00'), {str(free.id)})
+        # Outside the booking and its margin
+        self.assertEqual(self._search(start='14:00'), {str(free.id), str(booked.id)})
+
+    def test_specific_date_override(self):
+        override = self._mentor(0, (9, 12, self.day))
+        self._mentor(1, (9, 12, self.day + timedelta(days=7)))  # Override for another date
+
+        self.assertEqual(self._search(start='10:00', end='11:00'), {str(override.id)})
+        self.assertEqual(self._search(start='11:00', end='13:00'), set())
+
+
+class SessionDoubleBookingTestCase(TestCase):
+    """Overlapping bookings are rejected by the session_no_double_booking constraint."""
+
+    def setUp(self):
+        self.mentor = create_mentor(0, status='approved')
+        self.mentees = [create_mentee(i) for i in range(2)]
+        self.start = (timezone.now() + timedelta(days=3)).replace(minute=0, second=0, microsecond=0)
+
+    def _book(self, mentee, scheduled_at):
+        request = APIRequestFactory().post('/', {
+            'mentor_id': str(self.mentor.id),
+            'scheduled_at': scheduled_at.isoformat(),
+            'duration_minutes': 60,
+        }, format='json')
+        force_authenticate(request, user=auth0_user(mentee.user))
+        return views.SessionCreateView.as_view()(request)
+
+    def test_overlapping_booking_conflicts(self):
+        self.assertEqual(self._book(self.mentees[0], self.start).status_code, 201)
+
+        response = self._book(self.mentees[1], self.start + timedelta(minutes=30))
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Session.objects.filter(mentor=self.mentor).count(), 1)
+
+    def test_adjacent_booking_is_accepted(self):
+        self.assertEqual(self._book(self.mentees[0], self.start).status_code, 201)
+        self.assertEqual(self._book(self.mentees[1], self.start + timedelta(hours=1)).status_code, 201)
+        self.assertEqual(Session.objects.filter(mentor=self.mentor).count(), 2)
+
+
+class SessionVideoRoomTestCase(TestCase):
+    """Joining never waits on Whereby, and only falls back to Jitsi close to the start."""
+
+    def setUp(self):
+        self.mentor = create_mentor(0, status='approved')
+        self.mentee = create_mentee(0)
+
+    def _session(self, starts_in):
+        return Session.objects.create(
+            mentor=self.mentor,
+            mentee=self.mentee,
+            scheduled_at=timezone.now() + starts_in,
+            duration_minutes=60,
+            status='confirmed',
+            price=Decimal('100.00'),
+        )
+
+    def _join(self, session):
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=auth0_user(self.mentee.user))
+        return views.SessionVideoRoomView.as_view()(request, pk=session.pk)
+
+    def test_room_not_ready_yet(self):
+        # Beyond the provisioning horizon, and just booked within it
+        for starts_in in (timedelta(days=3), timedelta(hours=5)):
+            with self.subTest(starts_in=starts_in):
+                session = self._session(starts_in)
+                response = self._join(session)
+
+                self.assertEqual(response.status_code, 425)
+                session.refresh_from_db()
+                self.assertFalse(session.video_fallback)
+                self.assertEqual(session.whereby_room_url, '')
+
+    def test_falls_back_to_jitsi_close_to_the_start(self):
+        session = self._session(timedelta(minutes=10))
+        response = self._join(session)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['provider'], 'jitsi')
+        session.refresh_from_db()
+        self.assertTrue(session.video_fallback)
+
+    def test_provisioned_room(self):
+        session = self._session(timedelta(days=3))
+        Session.objects.filter(pk=session.pk).update(
+            whereby_room_url='https://linkdeal.whereby.com/room',
+            whereby_meeting_id='m1',
+            video_provider='whereby',
+        )
+        response = self._join(session)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['room_url'], 'https://linkdeal.whereby.com/room')
@@ -14,7 +14,9 @@ urlpatterns = [
     path('mentor/availability/<uuid:pk>/', views.MentorAvailabilityDetailView.as_view(), name='mentor-availability-detail'),
 
     # Public Mentor Availability (for booking)
+    path('mentors/available/', views.MentorAvailabilitySearchView.as_view(), name='mentor-availability-search'),
     path('mentors/<uuid:mentor_id>/availability/', views.PublicMentorAvailabilityView.as_view(), name='public-mentor-availability'),
+    path('mentors/<uuid:mentor_id>/availability/range/', views.PublicMentorAvailabilityRangeView.as_view(), name='public-mentor-availability-range'),
 
     # Sessions
     path('sessions/', views.SessionListView.as_view(), name='session-list'),
@@ -0,0 +1,155 @@
+"""
+Video room provisioning.
+
+Whereby rooms are created ahead of time by a periodic job for the sessions
+starting within PROVISION_AHEAD, PROVISION_WORKERS API calls at a time and
+behind a circuit breaker, so an unavailable Whereby API costs one short
+timeout per run instead of one per session.
+
+The join and reminder paths only read the stored room and never wait on the
+API: a session that still has no Whereby room once it starts within
+FALLBACK_AHEAD (when its reminder goes out) is pinned to Jitsi
+(video_fallback), and stays there so both participants end up in the same
+room. Before that, joining answers "not ready yet" and leaves the session to
+the provisioning job.
+
+Rooms are stored with conditional UPDATEs (only while the session has no
+room), so concurrent provisioning runs and fallbacks never overwrite each
+other; a Whereby room that lost such a race is deleted.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.utils import timezone
+
+from core.circuit import CircuitBreaker, CircuitOpenError
+from scheduling.models import Session
+from scheduling.services import WherebyService
+
+logger = logging.getLogger(__name__)
+
+# Rooms are created for sessions starting within this delay
+PROVISION_AHEAD = timedelta(hours=24)
+PROVISION_BATCH_SIZE = 200
+# Concurrent Whereby API calls (see WherebyService.http() pool size)
+PROVISION_WORKERS = 8
+# Sessions starting within this delay fall back to Jitsi when they have no
+# room (the end of notifications.scheduler.REMINDER_WINDOW)
+FALLBACK_AHEAD = timedelta(minutes=31)
+
+ROOM_FIELDS = [
+    'whereby_meeting_id', 'whereby_room_url', 'whereby_host_room_url',
+    'video_provider', 'video_room_id', 'video_fallback',
+]
+
+whereby_breaker = CircuitBreaker('Whereby', failure_threshold=5, reset_timeout=60)
+
+
+def participant_url(session):
+    """Participant URL of the session's video room (Whereby, else Jitsi)."""
+    if session.whereby_room_url:
+        return session.whereby_room_url
+    return f"https://meet.jit.si/{session.video_room_id}"
+
+
+def _create_meeting(session):
+    try:
+        return whereby_breaker.call(WherebyService.create_meeting, session)
+    except CircuitOpenError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not create Whereby room for session {session.id}: {e}")
+        return None
+
+
+def store_room(session, meeting):
+    """
+    Save a created Whereby room on the session unless it got a room (or
+    was pinned to Jitsi) in the meantime, in which case the new room is
+    deleted. Returns True when the room was stored.
+    """
+    room = {
+        'whereby_meeting_id': meeting.get('meetingId'),
+        'whereby_room_url': meeting.get('roomUrl'),
+        'whereby_host_room_url': meeting.get('hostRoomUrl'),
+        'video_provider': 'whereby',
+        'video_room_id': meeting.get('meetingId'),
+    }
+    stored = Session.objects.filter(pk=session.pk, whereby_room_url='', video_fallback=False).update(**room)
+    if stored:
+        for field, value in room.items():
+            setattr(session, field, value)
+        return True
+
+    WherebyService.delete_meeting(meeting.get('meetingId'))
+    session.refresh_from_db(fields=ROOM_FIELDS)
+    return False
+
+
+def provision_rooms(sessions):
+    """
+    Create a Whereby room for each session that needs one, PROVISION_WORKERS
+    API calls at a time. Only the HTTP calls run in the pool; the rooms are
+    stored from this thread. Returns the number of rooms stored.
+    """
+    sessions = [session for session in sessions if not session.whereby_room_url and not session.video_fallback]
+    if not sessions or whereby_breaker.is_open:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=PROVISION_WORKERS) as pool:
+        meetings = list(pool.map(_create_meeting, sessions))
+
+    return sum(store_room(session, meeting) for session, meeting in zip(sessions, meetings) if meeting)
+
+
+def provision_upcoming_rooms(now=None, batch_size=PROVISION_BATCH_SIZE):
+    """Create the rooms of the soonest upcoming sessions that have none."""
+    now = now or timezone.now()
+    sessions = Session.objects.filter(
+        status__in=['pending', 'confirmed'],
+        scheduled_at__gt=now,
+        scheduled_at__lte=now + PROVISION_AHEAD,
+        whereby_room_url='',
+        video_fallback=False,
+    ).order_by('scheduled_at')[:batch_size]
+    return provision_rooms(list(sessions))
+
+
+def provision_rooms_job():
+    """Periodic job: provision upcoming rooms (see notifications/scheduler.py)."""
+    try:
+        created = provision_upcoming_rooms()
+        if created:
+            logger.info(f"Provisioned {created} video rooms")
+    except Exception as e:
+        logger.error(f"Error in provision_rooms_job: {e}", exc_info=True)
+
+
+def fallback_due(session, now=None):
+    """Whether a session without a Whereby room must move to Jitsi now."""
+    now = now or timezone.now()
+    return session.scheduled_at <= now + FALLBACK_AHEAD
+
+
+def pin_fallback(session):
+    """
+    Move a session without a Whereby room to Jitsi for good. Returns the
+    session with its room fields current (a room stored concurrently wins).
+    """
+    if session.whereby_room_url or session.video_fallback:
+        return session
+
+    session.generate_video_room_id()
+    pinned = Session.objects.filter(pk=session.pk, whereby_room_url='').update(
+        video_fallback=True,
+        video_provider='jitsi',
+        video_room_id=session.video_room_id,
+    )
+    if pinned:
+        logger.warning(f"No Whereby room ready for session {session.id}, falling back to Jitsi")
+        session.video_fallback = True
+        session.video_provider = 'jitsi'
+    else:
+        session.refresh_from_db(fields=ROOM_FIELDS)
+    return session
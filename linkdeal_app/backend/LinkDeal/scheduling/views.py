@@ -2,11 +2,13 @@
 Views for the scheduling app.
 Handles API endpoints for sessions, availability, and video calls.
 """
+import calendar
+import hashlib
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
 
-from django.db.models import Sum, Count, Q
+from django.db import transaction
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 
@@ -14,9 +16,11 @@ from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
 
 from accounts.permissions import IsAuthenticatedAuth0, IsMentor, IsMentee
 from accounts.models import MentorProfile, MenteeProfile
+from mentoring.views import MentorPublicListView
 
 from scheduling.models import (
     SessionType,
@@ -38,6 +42,15 @@ from scheduling.serializers import (
     SessionChartDataSerializer,
     SessionAttachmentSerializer,
 )
+from scheduling.availability import (
+    get_compiled_availability,
+    filter_free_mentors,
+    find_overlapping_slots,
+    invalidate_availability,
+)
+from scheduling.stats import get_session_stats
+from core.pagination import KeysetPagination
+from core.rollups import period_starts, profile_subject, read_buckets
 
 logger = logging.getLogger(__name__)
 
@@ -91,37 +104,170 @@ class MentorAvailabilityBulkCreateView(APIView):
     """
     POST /scheduling/mentor/availability/bulk/
     Create multiple availability slots at once.
+
+    PUT /scheduling/mentor/availability/bulk/
+    Replace the mentor's whole availability with the submitted slots.
+
+    All slots are validated (including overlaps) before anything is written;
+    changes are then applied in a single transaction with bulk queries.
     """
     permission_classes = [IsAuthenticatedAuth0, IsMentor]
 
+    SLOT_FIELDS = [
+        'day_of_week', 'start_time', 'end_time',
+        'is_recurring', 'specific_date', 'is_available'
+    ]
+
+    def _validate_slots(self, slots, existing=()):
+        """
+        Validate every slot and check for overlaps, both within the payload
+        and against existing rows. Returns (validated_data list, errors list).
+        """
+        validated = []
+        errors = []
+        for i, slot_data in enumerate(slots):
+            serializer = MentorAvailabilityCreateSerializer(data=slot_data)
+            if serializer.is_valid():
+                data = dict(serializer.validated_data)
+                data.setdefault('is_recurring', True)
+                data.setdefault('is_available', True)
+                data.setdefault('specific_date', None)
+                validated.append(data)
+            else:
+                validated.append(None)
+                errors.append({'index': i, 'errors': serializer.errors})
+
+        if errors:
+            return validated, errors
+
+        existing = list(existing)
+        candidates = validated + [
+            {field: getattr(row, field) for field in self.SLOT_FIELDS}
+            for row in existing
+        ]
+        for a, b in find_overlapping_slots(candidates):
+            if a >= len(validated) and b >= len(validated):
+                continue  # Pre-existing overlap, not introduced by this request
+            index, other = (a, b) if a < len(validated) else (b, a)
+            if other >= len(validated):
+                row = existing[other - len(validated)]
+                message = (
+                    f'Overlaps existing slot {row.start_time:%H:%M}-{row.end_time:%H:%M}.'
+                )
+            else:
+                message = f'Overlaps slot at index {other}.'
+            errors.append({'index': index, 'errors': {'non_field_errors': [message]}})
+
+        errors.sort(key=lambda error: error['index'])
+        return validated, errors
+
+    def _get_slots(self, request):
+        slots = request.data.get('slots', [])
+        if not isinstance(slots, list):
+            raise ValidationError({'slots': 'Expected a list of slots.'})
+        return slots
+
     def post(self, request):
         mentor = MentorProfile.objects.get(user__auth0_id=request.user.auth0_id)
         
-        slots = request.data.get('slots', [])
+        slots = self._get_slots(request)
         if not slots:
             return Response(
                 {'error': 'No slots provided'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        created = []
-        errors = []
+        with transaction.atomic():
+            # Lock the mentor so concurrent bulk writes see each other's slots
+            MentorProfile.objects.select_for_update().filter(pk=mentor.pk).first()
+            existing = MentorAvailability.objects.filter(mentor=mentor)
+            validated, errors = self._validate_slots(slots, existing)
+            if errors:
+                return Response({
+                    'created': [],
+                    'errors': errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            created = MentorAvailability.objects.bulk_create([
+                MentorAvailability(mentor=mentor, **{
+                    field: data[field] for field in self.SLOT_FIELDS
+                })
+                for data in validated
+            ])
+            invalidate_availability(mentor.id)
         
-        for i, slot_data in enumerate(slots):
-            serializer = MentorAvailabilityCreateSerializer(data=slot_data)
-            if serializer.is_valid():
-                availability = MentorAvailability.objects.create(
-                    mentor=mentor,
-                    **serializer.validated_data
+        return Response({
+            'created': MentorAvailabilitySerializer(created, many=True).data,
+            'errors': []
+        }, status=status.HTTP_201_CREATED)
+
+    def put(self, request):
+        mentor = MentorProfile.objects.get(user__auth0_id=request.user.auth0_id)
+        
+        slots = self._get_slots(request)
+        validated, errors = self._validate_slots(slots)
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        
+        with transaction.atomic():
+            MentorProfile.objects.select_for_update().filter(pk=mentor.pk).first()
+            existing = {
+                row.id: row for row in MentorAvailability.objects.filter(mentor=mentor)
+            }
+            by_key = {
+                self._slot_key(vars(row)): row_id for row_id, row in existing.items()
+            }
+            
+            to_create = []
+            to_update = []
+            kept = set()
+            now = timezone.now()
+            for data in validated:
+                row_id = data.get('id')
+                if row_id not in existing or row_id in kept:
+                    row_id = by_key.get(self._slot_key(data))
+                if row_id is None or row_id in kept:
+                    to_create.append(MentorAvailability(mentor=mentor, **{
+                        field: data[field] for field in self.SLOT_FIELDS
+                    }))
+                    continue
+                
+                kept.add(row_id)
+                row = existing[row_id]
+                changed = False
+                for field in self.SLOT_FIELDS:
+                    if getattr(row, field) != data[field]:
+                        setattr(row, field, data[field])
+                        changed = True
+                if changed:
+                    row.updated_at = now
+                    to_update.append(row)
+            
+            stale_ids = [row_id for row_id in existing if row_id not in kept]
+            if stale_ids:
+                MentorAvailability.objects.filter(id__in=stale_ids).delete()
+            if to_update:
+                MentorAvailability.objects.bulk_update(
+                    to_update, self.SLOT_FIELDS + ['updated_at']
                 )
-                created.append(MentorAvailabilitySerializer(availability).data)
-            else:
-                errors.append({'index': i, 'errors': serializer.errors})
+            if to_create:
+                MentorAvailability.objects.bulk_create(to_create)
+            invalidate_availability(mentor.id)
         
+        current = MentorAvailability.objects.filter(mentor=mentor)
         return Response({
-            'created': created,
-            'errors': errors
-        }, status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST)
+            'created': len(to_create),
+            'updated': len(to_update),
+            'deleted': len(stale_ids),
+            'slots': MentorAvailabilitySerializer(current, many=True).data
+        })
+
+    @staticmethod
+    def _slot_key(data):
+        return (
+            data['is_recurring'], data['day_of_week'], data['specific_date'],
+            data['start_time'], data['end_time']
+        )
 
 
 class PublicMentorAvailabilityView(APIView):
@@ -149,81 +295,14 @@ class PublicMentorAvailabilityView(APIView):
         
         try:
             target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-            day_of_week = target_date.weekday()
         except ValueError:
             return Response(
                 {'error': 'Invalid date format. Use YYYY-MM-DD'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get availability slots for this day
-        availability_queryset = MentorAvailability.objects.filter(
-            mentor=mentor,
-            is_available=True
-        ).filter(
-            Q(is_recurring=True, day_of_week=day_of_week) |
-            Q(is_recurring=False, specific_date=target_date)
-        )
-        
-        # Get existing sessions for this mentor on this date
-        # Only consider active sessions (pending, confirmed, in_progress)
-        booked_sessions = list(Session.objects.filter(
-            mentor=mentor,
-            scheduled_at__date=target_date,
-            status__in=['pending', 'confirmed', 'in_progress']
-        ))
-        
-        # Build per-hour availability slots
-        # This generates individual hourly slots from each availability range
-        hourly_slots = []
-        
-        for slot in availability_queryset:
-            start_hour = slot.start_time.hour
-            end_hour = slot.end_time.hour
-            
-            # Generate individual hourly slots (e.g., 18:00-22:00 becomes 18:00, 19:00, 20:00, 21:00)
-            for hour in range(start_hour, end_hour):
-                # Create datetime for this specific hour
-                slot_start = timezone.make_aware(
-                    datetime.combine(target_date, datetime.min.time().replace(hour=hour))
-                )
-                slot_end = slot_start + timedelta(hours=1)
-                
-                # Check if this specific hour overlaps with any booked session
-                is_available = True
-                blocking_session = None
-                
-                for session in booked_sessions:
-                    s_start = session.scheduled_at
-                    s_end = session.scheduled_at + timedelta(minutes=session.duration_minutes)
-                    
-                    # 1. Strict Check
-                    if slot_start < s_end and slot_end > s_start:
-                        is_available = False
-                        blocking_session = session
-                        break
-                    
-                    # 2. Fuzzy Check (+/- 1h) for Timezone shifts
-                    # Shift +1h
-                    if slot_start < (s_end + timedelta(hours=1)) and slot_end > (s_start + timedelta(hours=1)):
-                        is_available = False
-                        blocking_session = session
-                        break
-                        
-                    # Shift -1h
-                    if slot_start < (s_end - timedelta(hours=1)) and slot_end > (s_start - timedelta(hours=1)):
-                        is_available = False
-                        blocking_session = session
-                        break
-                
-                hourly_slots.append({
-                    'day_of_week': slot.day_of_week,
-                    'day_name': slot.get_day_of_week_display(),
-                    'start_time': f'{hour:02d}:00',
-                    'end_time': f'{hour + 1:02d}:00',
-                    'is_available': is_available,
-                    'booked_until': (blocking_session.scheduled_at + timedelta(minutes=blocking_session.duration_minutes)).strftime('%H:%M') if blocking_session else None
-                })
+        # Hourly slots come from the mentor's compiled (cached) availability bitmap
+        hourly_slots = get_compiled_availability(mentor.id).slots_for_date(target_date)
         
         return Response({
             'date': target_date.isoformat(),
@@ -234,6 +313,145 @@ class PublicMentorAvailabilityView(APIView):
         })
 
 
+class PublicMentorAvailabilityRangeView(APIView):
+    """
+    GET /scheduling/mentors/<id>/availability/range/
+    Get availability for a span of days in a single request (booking calendar).
+
+    Query params:
+    - from, to: YYYY-MM-DD (inclusive), or
+    - month: YYYY-MM
+    - detail: true/false - Include hourly slots for each day
+
+    Returns a per-day summary (total/available slots). Supports ETag /
+    If-None-Match so an unchanged calendar costs a 304.
+    """
+    permission_classes = [AllowAny]
+    MAX_RANGE_DAYS = 62
+
+    def get(self, request, mentor_id):
+        mentor = get_object_or_404(MentorProfile, id=mentor_id, status='approved')
+        
+        month_str = request.query_params.get('month')
+        from_str = request.query_params.get('from')
+        to_str = request.query_params.get('to')
+        
+        try:
+            if month_str:
+                import calendar
+                start_date = datetime.strptime(month_str, '%Y-%m').date()
+                _, num_days = calendar.monthrange(start_date.year, start_date.month)
+                end_date = start_date.replace(day=num_days)
+            elif from_str and to_str:
+                start_date = datetime.strptime(from_str, '%Y-%m-%d').date()
+                end_date = datetime.strptime(to_str, '%Y-%m-%d').date()
+            else:
+                return Response(
+                    {'error': 'Provide either month (YYYY-MM) or from and to (YYYY-MM-DD)'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        except ValueError:
+            return Response(
+                {'error': 'Invalid date format. Use YYYY-MM-DD (from/to) or YYYY-MM (month)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        num_days = (end_date - start_date).days + 1
+        if num_days < 1:
+            return Response(
+                {'error': '"from" must be before or equal to "to"'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if num_days > self.MAX_RANGE_DAYS:
+            return Response(
+                {'error': f'Date range cannot exceed {self.MAX_RANGE_DAYS} days'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        detail = request.query_params.get('detail', 'false').lower() == 'true'
+        
+        # One cache lookup (or one compile) covers the whole span
+        compiled = get_compiled_availability(mentor.id)
+        
+        etag = '"{}"'.format(hashlib.sha1(
+            f'{mentor.id}:{start_date}:{end_date}:{detail}:{compiled.fingerprint}'.encode()
+        ).hexdigest())
+        if etag in request.headers.get('If-None-Match', ''):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response['ETag'] = etag
+            return response
+        
+        days = []
+        for offset in range(num_days):
+            day = start_date + timedelta(days=offset)
+            if detail:
+                slots = compiled.slots_for_date(day)
+                total = len(slots)
+                available = sum(1 for s in slots if s['is_available'])
+            else:
+                total, available = compiled.day_summary(day)
+            
+            entry = {
+                'date': day.isoformat(),
+                'total_slots': total,
+                'available_slots': available,
+            }
+            if detail:
+                entry['slots'] = slots
+            days.append(entry)
+        
+        response = Response({
+            'mentor_id': str(mentor_id),
+            'from': start_date.isoformat(),
+            'to': end_date.isoformat(),
+            'days': days,
+        })
+        response['ETag'] = etag
+        return response
+
+
+class MentorAvailabilitySearchView(MentorPublicListView):
+    """
+    GET /scheduling/mentors/available/
+    List approved mentors who are free for a given time window
+    ("who is free Tuesday at 18:00"), in a single query.
+
+    Query params:
+    - date: YYYY-MM-DD (required)
+    - start: HH:MM (required)
+    - end: HH:MM (optional, defaults to start + 1 hour, same day)
+    - Any MentorPublicListView filter (category, language, country,
+      skills, min_rating, search, ordering)
+    """
+
+    def get_queryset(self):
+        params = self.request.query_params
+        date_str = params.get('date')
+        start_str = params.get('start')
+        if not date_str or not start_str:
+            raise ValidationError({'date': 'date (YYYY-MM-DD) and start (HH:MM) are required.'})
+        
+        try:
+            target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            start_time = datetime.strptime(start_str, '%H:%M').time()
+            window_start = timezone.make_aware(datetime.combine(target_date, start_time))
+            end_str = params.get('end')
+            if end_str:
+                end_time = datetime.strptime(end_str, '%H:%M').time()
+                window_end = timezone.make_aware(datetime.combine(target_date, end_time))
+            else:
+                window_end = window_start + timedelta(hours=1)
+        except ValueError:
+            raise ValidationError({'date': 'Invalid format. Use date=YYYY-MM-DD, start=HH:MM, end=HH:MM.'})
+        
+        if window_end <= window_start:
+            raise ValidationError({'end': 'End time must be after start time.'})
+        if window_end > timezone.make_aware(datetime.combine(target_date + timedelta(days=1), datetime.min.time())):
+            raise ValidationError({'end': 'The window must end on the same day.'})
+        
+        return filter_free_mentors(super().get_queryset(), window_start, window_end)
+
+
 # -------------------------------------------------------------------
 # 3. SESSION VIEWS
 # -------------------------------------------------------------------
@@ -245,6 +463,7 @@ class SessionListView(generics.ListAPIView):
     """
     serializer_class = SessionListSerializer
     permission_classes = [IsAuthenticatedAuth0]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -260,22 +479,6 @@ class SessionListView(generics.ListAPIView):
             except MenteeProfile.DoesNotExist:
                 return Session.objects.none()
         
-        # Auto-update expired sessions: mark sessions as 'completed' if their 
-        # scheduled time (+ duration) has passed and they're still pending/confirmed
-        now = timezone.now()
-        expired_sessions = queryset.filter(
-            status__in=['pending', 'confirmed']
-        ).exclude(
-            scheduled_at__gt=now  # Exclude future sessions
-        )
-        
-        # Update expired sessions to 'completed'
-        for session in expired_sessions:
-            # Check if the session end time has passed
-            if session.end_time < now:
-                session.status = 'completed'
-                session.save(update_fields=['status', 'updated_at'])
-        
         # Apply filters
         status_filter = self.request.query_params.get('status')
         if status_filter:
@@ -290,10 +493,14 @@ class SessionListView(generics.ListAPIView):
         # Date range filter
         from_date = self.request.query_params.get('from')
         to_date = self.request.query_params.get('to')
+        # Compared as datetime ranges rather than scheduled_at__date so the
+        # (mentor|mentee, scheduled_at) indexes apply
         if from_date:
-            queryset = queryset.filter(scheduled_at__date__gte=from_date)
+            queryset = queryset.filter(scheduled_at__gte=self._day_start(from_date, 'from'))
         if to_date:
-            queryset = queryset.filter(scheduled_at__date__lte=to_date)
+            queryset = queryset.filter(
+                scheduled_at__lt=self._day_start(to_date, 'to') + timedelta(days=1)
+            )
         
         # Mentor/Mentee filter (for the other side)
         mentor_id = self.request.query_params.get('mentor_id')
@@ -305,6 +512,15 @@ class SessionListView(generics.ListAPIView):
         
         return queryset.select_related('mentor', 'mentee', 'session_type')
 
+    @staticmethod
+    def _day_start(value, param):
+        """Aware midnight (current timezone) of a YYYY-MM-DD query parameter."""
+        try:
+            day = datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise ValidationError({param: 'Invalid date format. Use YYYY-MM-DD.'})
+        return timezone.make_aware(datetime.combine(day, datetime.min.time()))
+
 
 class SessionCreateView(generics.CreateAPIView):
     """
@@ -493,92 +709,24 @@ class SessionStatsView(APIView):
     """
     GET /scheduling/sessions/stats/
     Get session statistics for the current user.
+    Read from the profile's SessionStats row plus one query over this
+    month's sessions, and cached per profile (see scheduling/stats.py).
     """
     permission_classes = [IsAuthenticatedAuth0]
 
     def get(self, request):
         user = request.user
-        is_mentor = False
         
         try:
             mentor = MentorProfile.objects.get(user__auth0_id=user.auth0_id)
-            sessions = Session.objects.filter(mentor=mentor)
-            is_mentor = True
+            data = get_session_stats('mentor', mentor)
         except MentorProfile.DoesNotExist:
             try:
                 mentee = MenteeProfile.objects.get(user__auth0_id=user.auth0_id)
-                sessions = Session.objects.filter(mentee=mentee)
+                data = get_session_stats('mentee', mentee)
             except MenteeProfile.DoesNotExist:
                 return Response({'error': 'User profile not found'}, status=404)
         
-        now = timezone.now()
-        this_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        
-        total = sessions.count()
-        completed = sessions.filter(status='completed').count()
-        upcoming = sessions.filter(
-            scheduled_at__gt=now,
-            status__in=['pending', 'confirmed']
-        ).count()
-        cancelled = sessions.filter(status='cancelled').count()
-        
-        # Total hours
-        total_minutes = sessions.filter(status='completed').aggregate(
-            total=Sum('duration_minutes')
-        )['total'] or 0
-        total_hours = Decimal(total_minutes) / 60
-        
-        # This month stats
-        this_month = sessions.filter(scheduled_at__gte=this_month_start)
-        this_month_count = this_month.filter(status='completed').count()
-        this_month_minutes = this_month.filter(status='completed').aggregate(
-            total=Sum('duration_minutes')
-        )['total'] or 0
-        this_month_hours = Decimal(this_month_minutes) / 60
-        
-        # Average rating (from sessions)
-        from django.db.models import Avg
-        avg_rating_result = sessions.filter(rating__isnull=False).aggregate(avg=Avg('rating'))['avg']
-        avg_rating = round(avg_rating_result, 1) if avg_rating_result else None
-        
-        # Total earned (from billing payments - mentor's payout, not full amount)
-        total_earned = Decimal('0.00')
-        if is_mentor:
-            try:
-                from billing.models import Payment
-                # Get completed payments where this mentor is the recipient
-                mentor_payments = Payment.objects.filter(
-                    mentor=mentor,
-                    status='completed',
-                    session__status='completed'
-                )
-                # Sum mentor_payout (their share after platform fee)
-                payout_sum = mentor_payments.aggregate(total=Sum('mentor_payout'))['total']
-                if payout_sum:
-                    total_earned = Decimal(str(payout_sum))
-            except Exception:
-                # Fallback to session-based calculation if billing fails
-                total_earned = sessions.filter(status='completed').aggregate(
-                    total=Sum('price')
-                )['total'] or Decimal('0.00')
-        else:
-            # For mentees, show how much they've paid
-            total_earned = sessions.filter(status='completed').aggregate(
-                total=Sum('price')
-            )['total'] or Decimal('0.00')
-        
-        data = {
-            'total_sessions': total,
-            'completed_sessions': completed,
-            'upcoming_sessions': upcoming,
-            'cancelled_sessions': cancelled,
-            'total_hours': round(total_hours, 1),
-            'this_month_sessions': this_month_count,
-            'this_month_hours': round(this_month_hours, 1),
-            'average_rating': avg_rating,
-            'total_earned': total_earned,
-        }
-        
         return Response(SessionStatsSerializer(data).data)
 
 
@@ -586,126 +734,72 @@ class SessionChartView(APIView):
     """
     GET /scheduling/sessions/chart/
     Get session chart data with granular breakdown.
+    Served from the profile's session rollup buckets (see core/rollups.py).
     """
     permission_classes = [IsAuthenticatedAuth0]
 
     def get(self, request):
-        from django.db.models.functions import ExtractHour, ExtractDay, ExtractMonth, ExtractWeekDay
-        from django.utils import timezone
-        
         user = request.user
         period = request.query_params.get('period', 'month')
         
         try:
             mentor = MentorProfile.objects.get(user__auth0_id=user.auth0_id)
-            base_qs = Session.objects.filter(mentor=mentor)
+            subject = profile_subject('mentor', mentor.id)
         except MentorProfile.DoesNotExist:
             try:
                 mentee = MenteeProfile.objects.get(user__auth0_id=user.auth0_id)
-                base_qs = Session.objects.filter(mentee=mentee)
+                subject = profile_subject('mentee', mentee.id)
             except MenteeProfile.DoesNotExist:
                 return Response({'error': 'User profile not found'}, status=404)
         
-        now = timezone.now()
-        data = []
+        now = timezone.localtime()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
         if period == 'day':
             # Hourly breakdown for today (00-23)
-            today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            qs = base_qs.filter(scheduled_at__date=today.date())
-            
-            # Aggregate by hour
-            stats = qs.annotate(hour=ExtractHour('scheduled_at')).values('hour').annotate(
-                count=Count('id'), 
-                duration=Sum('duration_minutes')
-            )
-            stats_map = {s['hour']: s for s in stats}
-            
-            for h in range(24):
-                stat = stats_map.get(h, {'count': 0, 'duration': 0})
-                data.append({
-                    'label': f'{h:02d}:00',
-                    'sessions': stat['count'],
-                    'hours': round(Decimal(stat['duration'] or 0) / 60, 1)
-                })
+            starts = [today + timedelta(hours=h) for h in range(24)]
+            labels = [f'{h:02d}:00' for h in range(24)]
+            end = today + timedelta(days=1)
+            granularity, group_by = 'hour', None
 
         elif period == 'week':
             # Daily breakdown for current week (Mon-Sun)
-            # Find start of week (Monday)
-            start_of_week = now - timedelta(days=now.weekday())
-            start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_week = start_of_week + timedelta(days=7)
-            
-            qs = base_qs.filter(scheduled_at__gte=start_of_week, scheduled_at__lt=end_of_week)
-            
-            # ExtractWeekDay: 1=Sunday, 2=Monday... 7=Saturday (Django default)
-            # But we want 0=Monday... 6=Sunday for python logic
-            # Let's just key by date to be safe
-            stats = qs.annotate(day=ExtractDay('scheduled_at')).values('scheduled_at__date').annotate(
-                count=Count('id'),
-                duration=Sum('duration_minutes')
-            )
-            stats_map = {s['scheduled_at__date']: s for s in stats}
-            
-            days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-            for i in range(7):
-                day_date = (start_of_week + timedelta(days=i)).date()
-                stat = stats_map.get(day_date, {'count': 0, 'duration': 0})
-                data.append({
-                    'label': days[i],
-                    'sessions': stat['count'],
-                    'hours': round(Decimal(stat['duration'] or 0) / 60, 1)
-                })
+            start_of_week = today - timedelta(days=now.weekday())
+            starts = period_starts(start_of_week, 7, 'day')
+            labels = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+            end = start_of_week + timedelta(days=7)
+            granularity, group_by = 'day', None
 
         elif period == 'month':
             # Daily breakdown for current month (1-31)
-            start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            if start_of_month.month == 12:
-                end_of_month = start_of_month.replace(year=now.year + 1, month=1)
-            else:
-                end_of_month = start_of_month.replace(month=now.month + 1)
-            
-            qs = base_qs.filter(scheduled_at__gte=start_of_month, scheduled_at__lt=end_of_month)
-            
-            stats = qs.annotate(day=ExtractDay('scheduled_at')).values('day').annotate(
-                count=Count('id'),
-                duration=Sum('duration_minutes')
-            )
-            stats_map = {s['day']: s for s in stats}
-            
-            # Days in month
-            import calendar
+            start_of_month = today.replace(day=1)
             _, num_days = calendar.monthrange(now.year, now.month)
-            
-            for d in range(1, num_days + 1):
-                stat = stats_map.get(d, {'count': 0, 'duration': 0})
-                data.append({
-                    'label': str(d),
-                    'sessions': stat['count'],
-                    'hours': round(Decimal(stat['duration'] or 0) / 60, 1)
-                })
+            starts = period_starts(start_of_month, num_days, 'day')
+            labels = [str(d) for d in range(1, num_days + 1)]
+            end = start_of_month + timedelta(days=num_days)
+            granularity, group_by = 'day', None
 
         elif period == 'year':
             # Monthly breakdown for current year (Jan-Dec)
-            start_of_year = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-            end_of_year = start_of_year.replace(year=now.year + 1)
-            
-            qs = base_qs.filter(scheduled_at__gte=start_of_year, scheduled_at__lt=end_of_year)
-            
-            stats = qs.annotate(month=ExtractMonth('scheduled_at')).values('month').annotate(
-                count=Count('id'),
-                duration=Sum('duration_minutes')
-            )
-            stats_map = {s['month']: s for s in stats}
-            
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            for i in range(1, 13):
-                stat = stats_map.get(i, {'count': 0, 'duration': 0})
-                data.append({
-                    'label': months[i-1],
-                    'sessions': stat['count'],
-                    'hours': round(Decimal(stat['duration'] or 0) / 60, 1)
-                })
+            start_of_year = today.replace(month=1, day=1)
+            starts = period_starts(start_of_year, 12, 'month')
+            labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+            end = start_of_year.replace(year=now.year + 1)
+            granularity, group_by = 'day', 'month'
+
+        else:
+            return Response([])
+
+        buckets = read_buckets(['sessions'], starts[0], end, granularity, group_by, subject)
+        
+        data = []
+        for label, start in zip(labels, starts):
+            stat = buckets.get(('sessions', start), {'count': 0, 'total': 0})
+            data.append({
+                'label': label,
+                'sessions': stat['count'],
+                'hours': round(Decimal(stat['total']) / 60, 1)
+            })
 
         return Response(data)
 
@@ -746,7 +840,7 @@ class SessionRateView(APIView):
 class SessionVideoRoomView(APIView):
     """
     GET /scheduling/sessions/<id>/video-room/
-    Get or create video room for a session.
+    Get the video room of a session.
     """
     permission_classes = [IsAuthenticatedAuth0]
 
@@ -758,10 +852,12 @@ class SessionVideoRoomView(APIView):
             try:
                 mentor = MentorProfile.objects.get(user__auth0_id=user.auth0_id)
                 session = Session.objects.get(id=pk, mentor=mentor)
+                is_mentor = True
             except MentorProfile.DoesNotExist:
                 try:
                     mentee = MenteeProfile.objects.get(user__auth0_id=user.auth0_id)
                     session = Session.objects.get(id=pk, mentee=mentee)
+                    is_mentor = False
                 except (MenteeProfile.DoesNotExist, Session.DoesNotExist):
                     return Response({'error': 'Session not found'}, status=404)
             
@@ -772,15 +868,26 @@ class SessionVideoRoomView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # 3. Check for Existing Room
+            # 3. Rooms are provisioned ahead of time (scheduling/video_rooms.py);
+            # without one ready the session moves to Jitsi instead of waiting on
+            # Whereby, but only once it starts soon
+            from scheduling.video_rooms import fallback_due, pin_fallback
+
+            if not session.whereby_room_url and not session.video_fallback:
+                if not fallback_due(session):
+                    response = Response({
+                        'error': 'Video room not ready yet',
+                        'session_id': str(session.id),
+                    }, status=status.HTTP_425_TOO_EARLY)
+                    response['Retry-After'] = '60'
+                    return response
+                session = pin_fallback(session)
+
             if session.whereby_room_url:
-                try:
-                    # Determine appropriate URL
-                    mentor = MentorProfile.objects.get(user__auth0_id=user.auth0_id)
-                    # If user is the mentor, return host URL if available
+                # Host URL for the mentor, participant URL for the mentee
+                if is_mentor:
                     room_url = session.whereby_host_room_url or session.whereby_room_url
-                except MentorProfile.DoesNotExist:
-                    # If user is mentee, return participant URL
+                else:
                     room_url = session.whereby_room_url
 
                 return Response({
@@ -790,46 +897,12 @@ class SessionVideoRoomView(APIView):
                     'session_id': str(session.id),
                 })
 
-            # 4. Create New Whereby Room
-            from scheduling.services import WherebyService
-            
-            meeting = WherebyService.create_meeting(session)
-            
-            if meeting:
-                # Success - update session
-                session.whereby_meeting_id = meeting.get('meetingId')
-                session.whereby_room_url = meeting.get('roomUrl')
-                session.whereby_host_room_url = meeting.get('hostRoomUrl')
-                session.video_provider = 'whereby'
-                session.video_room_id = meeting.get('meetingId')
-                session.save()
-                
-                # Determine URL for response
-                try:
-                    mentor = MentorProfile.objects.get(user__auth0_id=user.auth0_id)
-                    room_url = session.whereby_host_room_url
-                except MentorProfile.DoesNotExist:
-                    room_url = session.whereby_room_url
-
-                return Response({
-                    'room_url': room_url,
-                    'room_id': session.whereby_meeting_id,
-                    'provider': 'whereby',
-                    'session_id': str(session.id),
-                })
-            else:
-                # Fallback to Jitsi
-                logger.warning(f"Whereby creation failed for session {session.id}, falling back to Jitsi")
-                room_id = session.generate_video_room_id()
-                session.video_provider = 'jitsi'
-                session.save()
-                
-                return Response({
-                    'room_id': room_id,
-                    'provider': 'jitsi',
-                    'session_id': str(session.id),
-                    'note': 'Video service fallback active'
-                })
+            return Response({
+                'room_id': session.video_room_id,
+                'provider': 'jitsi',
+                'session_id': str(session.id),
+                'note': 'Video service fallback active'
+            })
 
         except Exception as e:
             import traceback
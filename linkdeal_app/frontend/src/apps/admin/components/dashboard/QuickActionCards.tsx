@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 
 type QuickAction = {
     title: string;
@@ -23,10 +23,8 @@ export const QuickActionCards = (): JSX.Element => {
     useEffect(() => {
         const fetchPendingCount = async () => {
             try {
-                const response = await api.get('/auth/admin/mentors/pending/');
-                // Assuming response structure is { results: [...] } or just [...]
-                const count = response.data.results ? response.data.count : response.data.length;
-                setPendingCount(count || 0);
+                const pendingMentors = await fetchAllPages('/auth/admin/mentors/pending/');
+                setPendingCount(pendingMentors.length);
             } catch (error) {
                 console.error("Failed to fetch pending mentors count", error);
             }
@@ -1,5 +1,5 @@
 import { FunctionComponent, useState, useEffect } from 'react';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 
 const UserStats: FunctionComponent = () => {
   const [stats, setStats] = useState({
@@ -13,28 +13,22 @@ const UserStats: FunctionComponent = () => {
     const fetchStats = async () => {
       try {
         // Fetch approved mentors
-        const mentorsResponse = await api.get('/auth/admin/mentors/pending/?status=approved');
-        const mentorsCount = mentorsResponse.data.count ?? mentorsResponse.data.length ?? 0;
+        const mentorsCount = (await fetchAllPages('/auth/admin/mentors/pending/?status=approved')).length;
 
         // Fetch rejected mentors
-        const rejectedMentorsResponse = await api.get('/auth/admin/mentors/pending/?status=rejected');
-        const rejectedMentorsCount = rejectedMentorsResponse.data.count ?? rejectedMentorsResponse.data.length ?? 0;
+        const rejectedMentorsCount = (await fetchAllPages('/auth/admin/mentors/pending/?status=rejected')).length;
 
         // Fetch active mentees
-        const menteesResponse = await api.get('/auth/admin/mentees/?status=active');
-        const menteesCount = menteesResponse.data.count ?? menteesResponse.data.length ?? 0;
+        const menteesCount = (await fetchAllPages('/auth/admin/mentees/?status=active')).length;
 
         // Fetch pending mentors
-        const pendingMentorsResponse = await api.get('/auth/admin/mentors/pending/?status=pending');
-        const pendingMentorsCount = pendingMentorsResponse.data.count ?? pendingMentorsResponse.data.length ?? 0;
+        const pendingMentorsCount = (await fetchAllPages('/auth/admin/mentors/pending/?status=pending')).length;
 
         // Fetch banned mentors (for calculating total)
-        const bannedMentorsResponse = await api.get('/auth/admin/mentors/pending/?status=banned');
-        const bannedMentorsCount = bannedMentorsResponse.data.count ?? bannedMentorsResponse.data.length ?? 0;
+        const bannedMentorsCount = (await fetchAllPages('/auth/admin/mentors/pending/?status=banned')).length;
 
         // Fetch banned mentees
-        const bannedMenteesResponse = await api.get('/auth/admin/mentees/?status=banned');
-        const bannedMenteesCount = bannedMenteesResponse.data.count ?? bannedMenteesResponse.data.length ?? 0;
+        const bannedMenteesCount = (await fetchAllPages('/auth/admin/mentees/?status=banned')).length;
 
         const totalMentors = mentorsCount + bannedMentorsCount + rejectedMentorsCount + pendingMentorsCount;
         const totalMentees = menteesCount + bannedMenteesCount;
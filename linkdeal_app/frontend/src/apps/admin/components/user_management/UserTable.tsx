@@ -1,5 +1,5 @@
 import { FunctionComponent, useMemo, useState, useEffect } from 'react';
-import api from '@/services/api';
+import api, { fetchAllPages } from '@/services/api';
 
 interface User {
   id: string;
@@ -90,8 +90,7 @@ const UserTable: FunctionComponent<UserTableProps> = ({ searchTerm, selectedRole
         setLoading(true);
 
         // Fetch approved mentors
-        const mentorsApprovedRes = await api.get('/auth/admin/mentors/pending/?status=approved');
-        const mentorsApproved = (mentorsApprovedRes.data.results || mentorsApprovedRes.data || []).map((m: any) => ({
+        const mentorsApproved = (await fetchAllPages('/auth/admin/mentors/pending/?status=approved')).map((m: any) => ({
           id: m.id,
           name: m.full_name,
           email: m.email,
@@ -107,8 +106,7 @@ const UserTable: FunctionComponent<UserTableProps> = ({ searchTerm, selectedRole
         }));
 
         // Fetch rejected mentors
-        const mentorsRejectedRes = await api.get('/auth/admin/mentors/pending/?status=rejected');
-        const mentorsRejected = (mentorsRejectedRes.data.results || mentorsRejectedRes.data || []).map((m: any) => ({
+        const mentorsRejected = (await fetchAllPages('/auth/admin/mentors/pending/?status=rejected')).map((m: any) => ({
           id: m.id,
           name: m.full_name,
           email: m.email,
@@ -124,8 +122,7 @@ const UserTable: FunctionComponent<UserTableProps> = ({ searchTerm, selectedRole
         }));
 
         // Fetch banned mentors
-        const mentorsBannedRes = await api.get('/auth/admin/mentors/pending/?status=banned');
-        const mentorsBanned = (mentorsBannedRes.data.results || mentorsBannedRes.data || []).map((m: any) => ({
+        const mentorsBanned = (await fetchAllPages('/auth/admin/mentors/pending/?status=banned')).map((m: any) => ({
           id: m.id,
           name: m.full_name,
           email: m.email,
@@ -141,8 +138,7 @@ const UserTable: FunctionComponent<UserTableProps> = ({ searchTerm, selectedRole
         }));
 
         // Fetch active mentees
-        const menteesActiveRes = await api.get('/auth/admin/mentees/?status=active');
-        const menteesActive = (menteesActiveRes.data.results || menteesActiveRes.data || []).map((m: any) => ({
+        const menteesActive = (await fetchAllPages('/auth/admin/mentees/?status=active')).map((m: any) => ({
           id: m.id,
           name: m.full_name,
           email: m.email,
@@ -158,8 +154,7 @@ const UserTable: FunctionComponent<UserTableProps> = ({ searchTerm, selectedRole
         }));
 
         // Fetch banned mentees
-        const menteesBannedRes = await api.get('/auth/admin/mentees/?status=banned');
-        const menteesBanned = (menteesBannedRes.data.results || menteesBannedRes.data || []).map((m: any) => ({
+        const menteesBanned = (await fetchAllPages('/auth/admin/mentees/?status=banned')).map((m: any) => ({
           id: m.id,
           name: m.full_name,
           email: m.email,
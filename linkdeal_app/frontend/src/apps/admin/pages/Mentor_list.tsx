@@ -1,6 +1,6 @@
 import { FunctionComponent, useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 import {
   MentorListHeader,
   SearchBar,
@@ -19,21 +19,10 @@ const MentorListPage: FunctionComponent = () => {
     const fetchMentors = async () => {
       try {
         setLoading(true);
-        // Use full path or import api client correctly
-        // Assuming api.get handles the baseURL
-        const response = await api.get('/auth/admin/mentors/pending/');
+        const pendingMentors = await fetchAllPages('/auth/admin/mentors/pending/');
 
         // Map backend response to Mentor interface
-        const mappedMentors = response.data.results ? response.data.results.map((m: any) => ({
-          id: m.id,
-          name: m.full_name,
-          email: m.email,
-          initials: m.full_name.split(' ').map((n: string) => n[0]).join('').substring(0, 2).toUpperCase(),
-          domain: m.professional_title || 'N/A',
-          submittedDate: new Date(m.created_at).toLocaleDateString(),
-          profilePictureUrl: m.profile_picture_url,
-          socialPictureUrl: m.social_picture_url
-        })) : response.data.map((m: any) => ({
+        const mappedMentors = pendingMentors.map((m: any) => ({
           id: m.id,
           name: m.full_name,
           email: m.email,
@@ -1,5 +1,5 @@
 import { FunctionComponent, useEffect, useState } from 'react';
-import api from '@/services/api';
+import api, { fetchAllPages } from '@/services/api';
 
 interface SessionStats {
   total_sessions: number;
@@ -31,8 +31,7 @@ const StatsCards: FunctionComponent = () => {
         setStats(statsResponse.data);
 
         // Fetch sessions to get next upcoming one
-        const sessionsResponse = await api.get('scheduling/sessions/');
-        const sessions = sessionsResponse.data;
+        const sessions = await fetchAllPages('scheduling/sessions/');
 
         // Find the next upcoming session (closest scheduled_at in the future)
         const now = new Date();
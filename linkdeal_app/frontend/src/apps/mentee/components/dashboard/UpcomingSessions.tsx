@@ -1,5 +1,5 @@
 import { FunctionComponent, useState, useEffect } from 'react';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 import SessionDetailsModal from './SessionDetailsModal';
 
 interface Session {
@@ -37,8 +37,7 @@ const UpcomingSessions: FunctionComponent = () => {
   useEffect(() => {
     const fetchSessions = async () => {
       try {
-        const response = await api.get('scheduling/sessions/');
-        const allSessions = response.data;
+        const allSessions = await fetchAllPages('scheduling/sessions/');
 
         // Filter for upcoming sessions (pending or confirmed, scheduled in the future)
         const now = new Date();
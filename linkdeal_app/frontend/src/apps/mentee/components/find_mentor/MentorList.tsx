@@ -1,6 +1,6 @@
 import { FunctionComponent, useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 
 interface Mentor {
   id: string;
@@ -92,8 +92,7 @@ const MentorList: FunctionComponent<MentorListProps> = ({ searchTerm, selectedCa
           params.append('search', searchTerm);
         }
         const url = `mentoring/mentors/${params.toString() ? `?${params.toString()}` : ''}`;
-        const response = await api.get(url);
-        setMentors(response.data || []);
+        setMentors(await fetchAllPages<Mentor>(url));
       } catch (err) {
         console.error('Failed to fetch mentors:', err);
         setError('Failed to load mentors');
@@ -1,6 +1,7 @@
 import { FunctionComponent, useState, useEffect } from 'react';
 import { useNavigate, useParams } from 'react-router-dom';
 import api from '@/services/api';
+import type { ApiError } from '@/types';
 
 export const VideoArea: FunctionComponent = () => {
   const navigate = useNavigate();
@@ -9,16 +10,25 @@ export const VideoArea: FunctionComponent = () => {
   const [roomUrl, setRoomUrl] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  // Seconds until the next attempt while the room is not ready yet
+  const [retryAfter, setRetryAfter] = useState<number | null>(null);
+  const [attempt, setAttempt] = useState(0);
 
   useEffect(() => {
+    let cancelled = false;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+
     const fetchRoom = async () => {
       if (!sessionId) return;
 
       try {
         setLoading(true);
-        // Get video room URL from backend
-        // This will create a Whereby room if one doesn't exist
+        setRetryAfter(null);
+        // Get video room URL from backend. Rooms are created ahead of the
+        // session: until one is ready (or the session is close enough to move
+        // to Jitsi) the backend answers 425 with Retry-After
         const response = await api.get(`/scheduling/sessions/${sessionId}/video-room/`);
+        if (cancelled) return;
 
         if (response.data.room_url) {
           setRoomUrl(response.data.room_url);
@@ -26,16 +36,26 @@ export const VideoArea: FunctionComponent = () => {
           setError('No video room URL returned');
         }
       } catch (err) {
+        if (cancelled) return;
+        if ((err as ApiError).status === 425) {
+          const seconds = parseInt((err as ApiError).response?.headers?.['retry-after'], 10) || 60;
+          setRetryAfter(seconds);
+          retryTimer = setTimeout(() => setAttempt((n) => n + 1), seconds * 1000);
+          return;
+        }
         console.error('Failed to join video session:', err);
         setError('Failed to join video session. Please try again.');
-        // Fallback or specific error handling could go here
       } finally {
-        setLoading(false);
+        if (!cancelled) setLoading(false);
       }
     };
 
     fetchRoom();
-  }, [sessionId]);
+    return () => {
+      cancelled = true;
+      clearTimeout(retryTimer);
+    };
+  }, [sessionId, attempt]);
 
   const handleEndSession = () => {
     navigate(`/mentee/rate/${sessionId}`);
@@ -49,6 +69,21 @@ export const VideoArea: FunctionComponent = () => {
     );
   }
 
+  if (retryAfter !== null) {
+    return (
+      <div className="flex-1 bg-[#0a0a1a]/50 p-6 flex flex-col items-center justify-center min-h-[400px]">
+        <div className="text-white text-xl mb-2">The video room is not ready yet</div>
+        <div className="text-white/60 text-sm mb-4">Trying again in {retryAfter} seconds...</div>
+        <button
+          onClick={() => navigate(-1)}
+          className="px-4 py-2 bg-white/10 hover:bg-white/20 rounded-lg text-white transition-colors"
+        >
+          Go Back
+        </button>
+      </div>
+    );
+  }
+
   if (error) {
     return (
       <div className="flex-1 bg-[#0a0a1a]/50 p-6 flex flex-col items-center justify-center min-h-[400px]">
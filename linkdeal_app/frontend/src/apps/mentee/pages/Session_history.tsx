@@ -1,6 +1,6 @@
 import { FunctionComponent, useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 import { SessionHistoryHeader } from '../components/session_history';
 
 interface Session {
@@ -29,8 +29,7 @@ const SessionHistory: FunctionComponent = () => {
   useEffect(() => {
     const fetchSessions = async () => {
       try {
-        const response = await api.get('scheduling/sessions/');
-        const allSessions = response.data;
+        const allSessions = await fetchAllPages('scheduling/sessions/');
 
         // Filter for completed sessions and sort by date (most recent first)
         const completedSessions = allSessions
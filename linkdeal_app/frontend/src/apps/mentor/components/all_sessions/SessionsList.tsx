@@ -1,5 +1,5 @@
 import { FunctionComponent, useEffect, useState } from 'react';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 import { SessionCard } from './SessionCard';
 
 interface BackendSession {
@@ -105,8 +105,8 @@ export const SessionsList: FunctionComponent = () => {
     useEffect(() => {
         const fetchSessions = async () => {
             try {
-                const response = await api.get('/scheduling/sessions/');
-                const mappedSessions = response.data.map(mapBackendToSession);
+                const backendSessions = await fetchAllPages<BackendSession>('/scheduling/sessions/');
+                const mappedSessions = backendSessions.map(mapBackendToSession);
                 setSessions(mappedSessions);
             } catch (error) {
                 console.error('Failed to fetch sessions:', error);
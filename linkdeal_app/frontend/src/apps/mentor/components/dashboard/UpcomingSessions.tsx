@@ -1,5 +1,5 @@
 import { FunctionComponent, useEffect, useState } from 'react';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 import SessionItem from './SessionItem';
 
 interface BackendSession {
@@ -59,12 +59,12 @@ const UpcomingSessions: FunctionComponent = () => {
   useEffect(() => {
     const fetchUpcomingSessions = async () => {
       try {
-        const response = await api.get('/scheduling/sessions/', {
+        const upcomingSessions = await fetchAllPages<BackendSession>('/scheduling/sessions/', {
           params: { status: 'upcoming' }
         });
 
         // Map backend data to component format and limit to 3 sessions
-        const mappedSessions = response.data.slice(0, 3).map((session: BackendSession) => ({
+        const mappedSessions = upcomingSessions.slice(0, 3).map((session: BackendSession) => ({
           id: session.id,
           initials: getInitials(session.mentee.full_name),
           name: session.mentee.full_name,
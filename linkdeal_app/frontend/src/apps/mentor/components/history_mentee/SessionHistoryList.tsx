@@ -1,6 +1,6 @@
 import { FunctionComponent, useEffect, useState } from 'react';
 import { SessionCard } from './SessionCard';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 
 interface Session {
   id: string;
@@ -51,14 +51,12 @@ export const SessionHistoryList: FunctionComponent<SessionHistoryListProps> = ({
       setError(null);
 
       // Fetch all sessions for this mentee (no status filter to get all)
-      const response = await api.get('/scheduling/sessions/', {
+      const rawSessions = await fetchAllPages<ApiSession>('/scheduling/sessions/', {
         params: {
           mentee_id: menteeId
         }
       });
 
-      const rawSessions: ApiSession[] = response.data.results || response.data || [];
-
       // Transform API data to component format
       const transformedSessions = rawSessions.map((session: ApiSession): Session => {
         const scheduledDate = new Date(session.scheduled_at);
@@ -1,5 +1,5 @@
 import { FunctionComponent, useEffect, useState } from 'react';
-import api from '@/services/api';
+import { fetchAllPages } from '@/services/api';
 
 interface Session {
     id: string;
@@ -40,7 +40,7 @@ export const SessionsDetailsModal: FunctionComponent<SessionsDetailsModalProps>
             setIsLoading(true);
             setError(null);
             // Fetch upcoming sessions (pending and confirmed) for this mentee
-            const response = await api.get('/scheduling/sessions/', {
+            const upcomingSessions = await fetchAllPages<Session>('/scheduling/sessions/', {
                 params: {
                     mentee_id: menteeId,
                     status: 'upcoming'
@@ -48,7 +48,7 @@ export const SessionsDetailsModal: FunctionComponent<SessionsDetailsModalProps>
             });
 
             // Sort sessions by scheduled_at (closest first)
-            const sortedSessions = (response.data.results || response.data || []).sort(
+            const sortedSessions = upcomingSessions.sort(
                 (a: Session, b: Session) =>
                     new Date(a.scheduled_at).getTime() - new Date(b.scheduled_at).getTime()
             );
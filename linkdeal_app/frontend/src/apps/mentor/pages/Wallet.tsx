@@ -1,6 +1,6 @@
 import { FunctionComponent, useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import api from '@/services/api';
+import api, { fetchAllPages } from '@/services/api';
 
 interface PaymentHistory {
     id: string;
@@ -74,7 +74,7 @@ const Wallet: FunctionComponent = () => {
             const paymentsRes = await api.get('billing/payments/list/?limit=50');
 
             // Fetch payout history
-            const payoutsRes = await api.get('billing/payouts/');
+            const payoutHistory = await fetchAllPages<PayoutData>('billing/payouts/');
 
             // Calculate funds
             let totalEarned = 0;
@@ -131,7 +131,7 @@ const Wallet: FunctionComponent = () => {
             });
 
             setPayments(paymentsRes.data.data || []);
-            setPayouts(payoutsRes.data || []);
+            setPayouts(payoutHistory);
         } catch (error) {
             console.error('Failed to fetch wallet data:', error);
         } finally {
@@ -1,4 +1,6 @@
 export const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000'
+// Notification stream (server-sent events, served by the ASGI app)
+export const STREAM_BASE_URL = import.meta.env.VITE_STREAM_URL || API_BASE_URL
 export const APP_NAME = import.meta.env.VITE_APP_NAME || 'LinkDeal'
 export const APP_VERSION = import.meta.env.VITE_APP_VERSION || '1.0.0'
 
@@ -1,10 +1,77 @@
 /**
  * useNotifications Hook
  * Manages notification state including unread count
+ *
+ * Updates are pushed over the notification stream; the hooks only poll
+ * while it is unavailable (e.g. no stream service deployed).
  */
 import { useState, useEffect, useCallback } from 'react';
 import notificationsService, { Notification } from '@/services/notifications';
 
+const STREAM_RETRY_MIN_MS = 30000;
+const STREAM_RETRY_MAX_MS = 300000;
+
+/**
+ * Keep a notification stream open while enabled, reopening it with backoff
+ * when it drops. Returns whether the stream is currently delivering.
+ * Handlers must be stable (useCallback or state setters).
+ */
+function useNotificationStream(
+    enabled: boolean,
+    onUnreadCount: (count: number) => void,
+    onNotification?: (notification: Notification) => void
+): boolean {
+    const [connected, setConnected] = useState(false);
+
+    useEffect(() => {
+        if (!enabled) return;
+
+        let cancelled = false;
+        let close: (() => void) | null = null;
+        let retry: ReturnType<typeof setTimeout> | null = null;
+        let delay = STREAM_RETRY_MIN_MS;
+
+        const reconnect = () => {
+            setConnected(false);
+            if (cancelled) return;
+            retry = setTimeout(connect, delay);
+            delay = Math.min(delay * 2, STREAM_RETRY_MAX_MS);
+        };
+
+        const connect = async () => {
+            try {
+                const closeStream = await notificationsService.openStream({
+                    onUnreadCount: (count) => {
+                        // Sent first on every (re)connection
+                        delay = STREAM_RETRY_MIN_MS;
+                        setConnected(true);
+                        onUnreadCount(count);
+                    },
+                    onNotification,
+                    onError: reconnect,
+                });
+                if (cancelled) {
+                    closeStream();
+                } else {
+                    close = closeStream;
+                }
+            } catch (err) {
+                reconnect();
+            }
+        };
+
+        connect();
+
+        return () => {
+            cancelled = true;
+            if (retry) clearTimeout(retry);
+            close?.();
+        };
+    }, [enabled, onUnreadCount, onNotification]);
+
+    return connected;
+}
+
 interface UseNotificationsOptions {
     autoRefresh?: boolean; // Auto-refresh every 30 seconds
     unreadOnly?: boolean;
@@ -127,16 +194,19 @@ export function useNotifications(options: UseNotificationsOptions = {}): UseNoti
         refresh();
     }, [refresh]);
 
-    // Auto-refresh every 30 seconds if enabled
+    // Pushed updates: counts directly, new notifications by reloading the list
+    const streaming = useNotificationStream(autoRefresh, setUnreadCount, fetchNotifications);
+
+    // Auto-refresh every 30 seconds if enabled and the stream is down
     useEffect(() => {
-        if (!autoRefresh) return;
+        if (!autoRefresh || streaming) return;
 
         const interval = setInterval(() => {
             fetchUnreadCount(); // Just refresh the count, not the full list
         }, 30000);
 
         return () => clearInterval(interval);
-    }, [autoRefresh, fetchUnreadCount]);
+    }, [autoRefresh, streaming, fetchUnreadCount]);
 
     return {
         notifications,
@@ -171,12 +241,14 @@ export function useUnreadCount(autoRefresh = true): { count: number; refresh: ()
         refresh();
     }, [refresh]);
 
+    const streaming = useNotificationStream(autoRefresh, setCount);
+
     useEffect(() => {
-        if (!autoRefresh) return;
+        if (!autoRefresh || streaming) return;
 
         const interval = setInterval(refresh, 30000);
         return () => clearInterval(interval);
-    }, [autoRefresh, refresh]);
+    }, [autoRefresh, streaming, refresh]);
 
     return { count, refresh };
 }
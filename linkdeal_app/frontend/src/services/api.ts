@@ -1,4 +1,4 @@
-import axios, { AxiosError, InternalAxiosRequestConfig } from 'axios'
+import axios, { AxiosError, AxiosRequestConfig, InternalAxiosRequestConfig } from 'axios'
 import { API_BASE_URL, LOCAL_STORAGE_KEYS } from '@/constants'
 import type { ApiError } from '@/types'
 
@@ -68,4 +68,26 @@ api.interceptors.response.use(
     }
 )
 
+// Largest page the backend serves (KeysetPagination.max_page_size)
+const MAX_PAGE_SIZE = 100
+
+/**
+ * GET every page of a cursor-paginated list endpoint.
+ * List endpoints return one page at a time and advertise the next one in the
+ * X-Next-Cursor header; this follows it until the last page.
+ */
+export async function fetchAllPages<T = any>(url: string, config: AxiosRequestConfig = {}): Promise<T[]> {
+    const items: T[] = []
+    let cursor: string | undefined
+    do {
+        const response = await api.get<T[]>(url, {
+            ...config,
+            params: { page_size: MAX_PAGE_SIZE, ...config.params, ...(cursor ? { cursor } : {}) },
+        })
+        items.push(...response.data)
+        cursor = response.headers['x-next-cursor']
+    } while (cursor)
+    return items
+}
+
 export default api
@@ -2,7 +2,8 @@
  * Notifications API Service
  * Handles all notification-related API calls
  */
-import api from './api';
+import api, { fetchAllPages } from './api';
+import { STREAM_BASE_URL } from '@/constants';
 
 export interface Notification {
     id: string;
@@ -22,6 +23,17 @@ export interface UnreadCountResponse {
     count: number;
 }
 
+export interface StreamTicketResponse {
+    ticket: string;
+    expires_in: number;
+}
+
+export interface NotificationStreamHandlers {
+    onUnreadCount?: (count: number) => void;
+    onNotification?: (notification: Notification) => void;
+    onError?: () => void;
+}
+
 export interface MarkReadResponse {
     success: boolean;
     message: string;
@@ -51,8 +63,7 @@ const notificationsService = {
         const queryString = params.toString();
         const url = queryString ? `notifications/?${queryString}` : 'notifications/';
 
-        const response = await api.get(url);
-        return response.data;
+        return fetchAllPages<Notification>(url);
     },
 
     /**
@@ -63,6 +74,30 @@ const notificationsService = {
         return response.data.count;
     },
 
+    /**
+     * Open the notification stream (server-sent events).
+     * Resolves to a function closing it; onError is called when the stream
+     * cannot be opened or drops (tickets are single-use: reopen to reconnect).
+     */
+    async openStream(handlers: NotificationStreamHandlers): Promise<() => void> {
+        const response = await api.post<StreamTicketResponse>('notifications/stream/ticket/');
+        const ticket = encodeURIComponent(response.data.ticket);
+        const source = new EventSource(`${STREAM_BASE_URL.replace(/\/$/, '')}/notifications/stream/?ticket=${ticket}`);
+
+        source.addEventListener('unread_count', (event) => {
+            handlers.onUnreadCount?.(JSON.parse((event as MessageEvent).data).count);
+        });
+        source.addEventListener('notification', (event) => {
+            handlers.onNotification?.(JSON.parse((event as MessageEvent).data));
+        });
+        source.onerror = () => {
+            source.close();
+            handlers.onError?.();
+        };
+
+        return () => source.close();
+    },
+
     /**
      * Mark a single notification as read
      */
@@ -2,6 +2,7 @@
 
 interface ImportMetaEnv {
     readonly VITE_API_URL: string
+    readonly VITE_STREAM_URL?: string
     readonly VITE_APP_NAME: string
     readonly VITE_APP_VERSION: string
     readonly VITE_AUTH0_DOMAIN: string